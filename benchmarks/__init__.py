@@ -0,0 +1 @@
+"""Performance benchmarks for the decision engine (``python -m benchmarks``)."""
@@ -0,0 +1,52 @@
+"""Run the benchmark suite, optionally saving or comparing a JSON baseline."""
+
+import argparse
+import json
+import sys
+
+from benchmarks.runner import compare, format_table, run_suite
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the evaluator, policy set and CLI hot paths.",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Fewer iterations and smaller sets"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="PREFIX",
+        help="Run only scenarios whose name starts with PREFIX",
+    )
+    parser.add_argument("-o", "--output", help="Write results as a JSON baseline")
+    parser.add_argument("--baseline", help="Compare against a saved JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed p50 slowdown before a regression is flagged (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    report = run_suite(quick=args.quick, only=args.only)
+    print(format_table(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, threshold=args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
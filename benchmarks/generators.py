@@ -0,0 +1,108 @@
+"""Deterministic synthetic policy sets and request contexts."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Mapping, Optional
+
+ENVIRONMENTS = ("prod", "staging", "dev")
+
+# Context fields by value kind, so every operator gets comparable operands.
+STRING_FIELDS = {
+    "user.role": ("admin", "editor", "viewer", "auditor"),
+    "user.department": ("eng", "sales", "finance", "legal", "ops"),
+    "user.region": ("eu", "us", "apac"),
+    "resource.owner": ("alice", "bob", "carol", "dave"),
+    "resource.classification": ("public", "internal", "secret"),
+}
+NUMBER_FIELDS = {
+    "user.level": (1, 10),
+    "resource.size": (0, 1000),
+    "request.hour": (0, 23),
+}
+
+DEFAULT_OPERATOR_MIX = {"equals": 0.4, "in": 0.3, "gt": 0.15, "lt": 0.15}
+
+
+def generate_targets(count: int) -> list[tuple[str, str]]:
+    """Return ``count`` distinct (resource_type, environment) pairs."""
+    return [
+        (f"type{i // len(ENVIRONMENTS)}", ENVIRONMENTS[i % len(ENVIRONMENTS)])
+        for i in range(count)
+    ]
+
+
+def _condition(rng: random.Random, operator: str) -> dict[str, Any]:
+    if operator in ("gt", "lt"):
+        field = rng.choice(sorted(NUMBER_FIELDS))
+        low, high = NUMBER_FIELDS[field]
+        return {"field": field, "operator": operator, "value": rng.randint(low, high)}
+    field = rng.choice(sorted(STRING_FIELDS))
+    choices = STRING_FIELDS[field]
+    if operator == "in":
+        value: Any = rng.sample(choices, k=min(2, len(choices)))
+    else:
+        value = rng.choice(choices)
+    return {"field": field, "operator": operator, "value": value}
+
+
+def generate_policies(
+    count: int,
+    *,
+    conditions: int = 3,
+    targets: int = 4,
+    operators: Optional[Mapping[str, float]] = None,
+    deny_ratio: float = 0.2,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """Generate ``count`` valid policy dicts spread over ``targets`` targets.
+
+    ``operators`` maps operator name to relative weight (default
+    ``DEFAULT_OPERATOR_MIX``).
+    """
+    rng = random.Random(seed)
+    mix = dict(operators or DEFAULT_OPERATOR_MIX)
+    names, weights = list(mix), list(mix.values())
+    pairs = generate_targets(targets)
+    policies = []
+    for i in range(count):
+        resource_type, environment = pairs[i % len(pairs)]
+        ops = rng.choices(names, weights=weights, k=conditions)
+        policies.append(
+            {
+                "policy_id": f"bench.policy{i}.v1",
+                "target": {
+                    "resource_type": resource_type,
+                    "environment": environment,
+                },
+                "conditions": {
+                    rng.choice(("all", "any")): [_condition(rng, op) for op in ops]
+                },
+                "effect": "DENY" if rng.random() < deny_ratio else "ALLOW",
+            }
+        )
+    return policies
+
+
+def generate_contexts(
+    count: int, *, targets: int = 4, seed: int = 0
+) -> list[dict[str, Any]]:
+    """Generate ``count`` contexts that define every generated condition field."""
+    rng = random.Random(seed + 1)
+    pairs = generate_targets(targets)
+    contexts = []
+    for i in range(count):
+        resource_type, environment = rng.choice(pairs)
+        context: dict[str, Any] = {
+            "resource": {"type": resource_type},
+            "environment": {"env": environment},
+            "request": {"id": f"req-{i}"},
+        }
+        for field, choices in STRING_FIELDS.items():
+            section, name = field.split(".")
+            context.setdefault(section, {})[name] = rng.choice(choices)
+        for field, (low, high) in NUMBER_FIELDS.items():
+            section, name = field.split(".")
+            context.setdefault(section, {})[name] = rng.randint(low, high)
+        contexts.append(context)
+    return contexts
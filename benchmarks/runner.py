@@ -0,0 +1,270 @@
+"""Benchmark scenarios, latency statistics and baseline comparison."""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from engine.dag import PolicyDAG
+from engine.evaluator import evaluate_policy, resolve_field
+from engine.target_matcher import target_matches
+from validation.schema import Policy
+
+from benchmarks.generators import generate_contexts, generate_policies
+from engine import (
+    PolicyIndex,
+    evaluate_batch,
+    evaluate_policies_decision,
+    evaluate_policy_decision,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BASELINE_FORMAT = 1
+
+Stats = dict[str, float]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted ``samples``."""
+    if not samples:
+        raise ValueError("no samples")
+    rank = max(0, min(len(samples) - 1, round(q / 100 * len(samples)) - 1))
+    return samples[rank]
+
+
+def measure(
+    fn: Callable[[], Any], *, iterations: int, warmup: int = 0, ops: int = 1
+) -> Stats:
+    """Time ``iterations`` calls of ``fn``; each call performs ``ops`` operations.
+
+    Latencies are per call in microseconds; throughput is operations per second.
+    """
+    for _ in range(warmup):
+        fn()
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(iterations):
+        start = clock()
+        fn()
+        samples.append((clock() - start) / 1000)
+    return _stats(samples, ops=ops)
+
+
+def _stats(samples: list[float], *, ops: int = 1) -> Stats:
+    """Latency statistics of per-call ``samples`` in microseconds."""
+    samples = sorted(samples)
+    iterations = len(samples)
+    total = sum(samples)
+    return {
+        "iterations": iterations,
+        "ops_per_call": ops,
+        "mean_us": total / iterations,
+        "p50_us": percentile(samples, 50),
+        "p90_us": percentile(samples, 90),
+        "p99_us": percentile(samples, 99),
+        "max_us": samples[-1],
+        "throughput_ops": ops * iterations / (total / 1e6) if total else 0.0,
+    }
+
+
+def _cycle(items: list[Any]) -> Callable[[], Any]:
+    state = {"i": 0}
+
+    def next_item() -> Any:
+        i = state["i"]
+        state["i"] = (i + 1) % len(items)
+        return items[i]
+
+    return next_item
+
+
+def _single_scenarios(quick: bool) -> Iterable[tuple[str, Callable[[], Any], int]]:
+    policy = Policy(**generate_policies(1, conditions=3, targets=1)[0])
+    context = _cycle(generate_contexts(256, targets=1))
+    yield "resolve_field", lambda: resolve_field("user.role", context()), 1
+    yield "target_matches", lambda: target_matches(policy.target, context()), 1
+    # Plain ``Policy`` models go through the per-instance compile memo.
+    yield "policy_evaluate", lambda: evaluate_policy(policy, context()), 1
+    yield "policy_decision", lambda: evaluate_policy_decision(
+        policy, context(), trace=False
+    ), 1
+    yield "policy_decision_trace", lambda: evaluate_policy_decision(
+        policy, context(), trace=True
+    ), 1
+
+
+def _per_context(
+    fn: Callable[[Any], Any], context: Callable[[], Any]
+) -> Callable[[], Any]:
+    return lambda: fn(context())
+
+
+def _decide(
+    policies: Any, context: Callable[[], Any], *, trace: bool
+) -> Callable[[], Any]:
+    return lambda: evaluate_policies_decision(policies, context(), trace=trace)
+
+
+def _set_scenarios(quick: bool) -> Iterable[tuple[str, Callable[[], Any], int]]:
+    sizes = [(10, 4), (100, 8)] if quick else [(10, 4), (100, 8), (1000, 24)]
+    for count, targets in sizes:
+        policies = [
+            Policy(**p) for p in generate_policies(count, conditions=4, targets=targets)
+        ]
+        index = PolicyIndex(policies)
+        dag = PolicyDAG(index)
+        context = _cycle(generate_contexts(256, targets=targets))
+        yield f"policies_{count}", _decide(policies, context, trace=False), 1
+        yield f"policies_{count}_trace", _decide(policies, context, trace=True), 1
+        yield f"index_{count}", _decide(index, context, trace=False), 1
+        yield f"dag_{count}", _per_context(dag.evaluate, context), 1
+
+    index = PolicyIndex(
+        Policy(**p) for p in generate_policies(100, conditions=4, targets=8)
+    )
+    contexts = generate_contexts(1000, targets=8)
+    yield "batch_100x1000", lambda: evaluate_batch(index, contexts, trace=False), len(
+        contexts
+    )
+
+
+def _import_stats(quick: bool) -> Stats:
+    """Cumulative ``-X importtime`` of ``cli.main`` in a fresh interpreter."""
+    command = [sys.executable, "-X", "importtime", "-c", "import cli.main"]
+    samples = []
+    for _ in range(5 if quick else 20):
+        proc = subprocess.run(
+            command, cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+        for line in proc.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == "cli.main":
+                samples.append(float(fields[1]))
+    return _stats(samples)
+
+
+def _cli_stats(quick: bool) -> Stats:
+    count = 1000 if quick else 10000
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        files = []
+        for i, data in enumerate(generate_policies(20, conditions=4, targets=4)):
+            path = directory / f"policy{i}.json"
+            path.write_text(json.dumps(data), encoding="utf-8")
+            files.append(str(path))
+        source = directory / "requests.jsonl"
+        source.write_text(
+            "".join(json.dumps(c) + "\n" for c in generate_contexts(count, targets=4)),
+            encoding="utf-8",
+        )
+        command = [sys.executable, "-m", "cli.main", "evaluate-stream", *files]
+        command += ["-i", str(source), "-o", os.devnull]
+        return measure(
+            lambda: subprocess.run(command, cwd=PROJECT_ROOT, check=True),
+            iterations=3 if quick else 5,
+            ops=count,
+        )
+
+
+def memory_stats(count: int) -> dict[str, float]:
+    """Bytes per policy held by validated models versus the compiled index."""
+    data = generate_policies(count, conditions=4, targets=24)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        models = [Policy(**d) for d in data]
+        model_bytes = tracemalloc.get_traced_memory()[0] - before
+        index = PolicyIndex(models)
+        # Workers keep only the compiled index once validation is done.
+        del models
+        gc.collect()
+        compiled_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(index) == count
+    return {
+        "policies": count,
+        "model_bytes_per_policy": model_bytes / count,
+        "compiled_bytes_per_policy": compiled_bytes / count,
+    }
+
+
+def run_suite(*, quick: bool = False, only: Optional[list[str]] = None) -> dict:
+    """Run every scenario whose name starts with one of ``only`` (default: all)."""
+    iterations = 2000 if quick else 20000
+    results: dict[str, Stats] = {}
+
+    def selected(name: str) -> bool:
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    for scenarios in (_single_scenarios(quick), _set_scenarios(quick)):
+        for name, fn, ops in scenarios:
+            if selected(name):
+                runs = iterations if ops == 1 else max(5, iterations // 1000)
+                results[name] = measure(
+                    fn, iterations=runs, warmup=min(runs, 100), ops=ops
+                )
+    if selected("cli_import"):
+        results["cli_import"] = _import_stats(quick)
+    if selected("cli_evaluate_stream"):
+        results["cli_evaluate_stream"] = _cli_stats(quick)
+
+    report: dict[str, Any] = {
+        "format": BASELINE_FORMAT,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+    if selected("memory"):
+        report["memory"] = memory_stats(2000 if quick else 20000)
+    return report
+
+
+def compare(
+    baseline: dict, current: dict, *, threshold: float = 0.25, metric: str = "p50_us"
+) -> list[str]:
+    """Return a message per scenario whose ``metric`` grew by more than ``threshold``."""
+    regressions = []
+    for name, stats in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or not before.get(metric):
+            continue
+        ratio = stats[metric] / before[metric]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {metric} {before[metric]:.2f} -> {stats[metric]:.2f} "
+                f"(+{(ratio - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def format_table(report: dict) -> str:
+    header = f"{'scenario':<24}{'p50 us':>12}{'p90 us':>12}{'p99 us':>12}{'ops/s':>14}"
+    lines = [header, "-" * len(header)]
+    for name, stats in report["results"].items():
+        lines.append(
+            f"{name:<24}{stats['p50_us']:>12.2f}{stats['p90_us']:>12.2f}"
+            f"{stats['p99_us']:>12.2f}{stats['throughput_ops']:>14,.0f}"
+        )
+    memory = report.get("memory")
+    if memory:
+        lines.append(
+            f"memory ({memory['policies']} policies): "
+            f"{memory['model_bytes_per_policy']:,.0f} B/policy as models, "
+            f"{memory['compiled_bytes_per_policy']:,.0f} B/policy compiled"
+        )
+    return "\n".join(lines)
@@ -1,14 +1,34 @@
-"""CLI for policy validation and evaluation."""
+"""CLI for policy validation and evaluation.
+
+Only the standard library is imported at module level; each subcommand
+imports the engine, validation (Pydantic) and server modules it needs, so
+``ace --help`` and light subcommands start quickly.
+"""
+
+from __future__ import annotations
 
 import argparse
 import json
 import sys
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator
 
-from validation.policy_validator import validate_policy_semantics
-from validation.schema import Policy
+if TYPE_CHECKING:
+    from engine.decision import Decision
+    from engine.policy_index import PolicyIndex
+    from engine.policy_set import ConflictStrategy
+    from engine.store import PolicyStore
+    from engine.summary import DecisionSummary
 
-from engine import evaluate_policies_decision, evaluate_policy_decision
+# Mirrors engine.policy_set.STRATEGIES without importing the engine for --help.
+STRATEGIES = (
+    "deny_overrides",
+    "permit_overrides",
+    "first_applicable",
+    "only_one_applicable",
+)
+# Mirrors engine.audit.OVERFLOW_POLICIES.
+AUDIT_OVERFLOW = ("block", "drop", "drop_allow")
 
 
 def _load_json(path: Path) -> dict:
@@ -44,7 +64,21 @@ def load_context(path: Path) -> dict:
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
-    path = Path(args.policy)
+    from validation.loader import load_policy_files, policy_files
+    from validation.policy_validator import validate_policy_semantics
+    from validation.schema import Policy
+
+    if len(args.policies) > 1 or Path(args.policies[0]).is_dir():
+        try:
+            files = policy_files(args.policies)
+            load_policy_files(files, workers=args.workers)
+        except Exception as e:
+            print(f"Validation failed: {e}", file=sys.stderr)
+            return 1
+        print(f"OK: {len(files)} policy file(s)")
+        return 0
+
+    path = Path(args.policies[0])
     if not path.exists():
         print(f"Error: file not found: {path}", file=sys.stderr)
         return 1
@@ -60,6 +94,10 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 
 def cmd_evaluate(args: argparse.Namespace) -> int:
+    from engine.evaluator import evaluate_policy_decision
+    from validation.policy_validator import validate_policy_semantics
+    from validation.schema import Policy
+
     policy_path = Path(args.policy)
     context_path = Path(args.context)
     if not policy_path.exists():
@@ -73,7 +111,7 @@ def cmd_evaluate(args: argparse.Namespace) -> int:
         context = load_context(context_path)
         policy = Policy(**policy_data)
         validate_policy_semantics(policy)
-        result = evaluate_policy_decision(policy, context)
+        result = evaluate_policy_decision(policy, context, trace=args.trace)
         print(result.decision)
         if args.trace:
             for entry in result.trace:
@@ -85,23 +123,23 @@ def cmd_evaluate(args: argparse.Namespace) -> int:
 
 
 def cmd_evaluate_multi(args: argparse.Namespace) -> int:
+    from engine.policy_set import evaluate_policies_decision
+    from validation.loader import load_policy_files, policy_files
+
     context_path = Path(args.context)
     if not context_path.exists():
         print(f"Error: context file not found: {context_path}", file=sys.stderr)
         return 1
-    policies = []
-    for p in args.policies:
-        path = Path(p)
-        if not path.exists():
-            print(f"Error: policy file not found: {path}", file=sys.stderr)
-            return 1
-        policy_data = load_policy(path)
-        policies.append(Policy(**policy_data))
+    try:
+        policies = load_policy_files(policy_files(args.policies))
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
     try:
         context = load_context(context_path)
-        for policy in policies:
-            validate_policy_semantics(policy)
-        result = evaluate_policies_decision(policies, context)
+        result = evaluate_policies_decision(
+            policies, context, strategy=args.strategy, trace=args.trace
+        )
         print(result.decision)
         if args.trace:
             for entry in result.trace:
@@ -112,6 +150,251 @@ def cmd_evaluate_multi(args: argparse.Namespace) -> int:
         return 1
 
 
+def _load_policy_index(
+    paths: Iterable[str], strategy: ConflictStrategy = "deny_overrides"
+) -> PolicyIndex:
+    from engine.bundle import BUNDLE_SUFFIX, load_bundle
+    from engine.policy_index import PolicyIndex
+    from validation.loader import policy_files
+
+    files = policy_files(paths)
+    sources = [f for f in files if f.suffix != BUNDLE_SUFFIX]
+    loaded: Iterator[Any] = iter(())
+    if sources:
+        # Parsed and validated together (in parallel when there are many);
+        # bundles are spliced back in at their original position. A
+        # bundle-only invocation never imports Pydantic or PyYAML.
+        from validation.loader import load_policy_files
+
+        loaded = iter(load_policy_files(sources))
+    policies: list[Any] = []
+    for path in files:
+        if path.suffix == BUNDLE_SUFFIX:
+            policies.extend(load_bundle(path, strategy=strategy))
+        else:
+            policies.append(next(loaded))
+    return PolicyIndex(policies)
+
+
+def cmd_bundle(args: argparse.Namespace) -> int:
+    from engine.bundle import write_bundle
+    from validation.loader import load_policy_files, policy_files
+
+    try:
+        policies = load_policy_files(policy_files(args.paths), workers=args.workers)
+        if args.optimize:
+            from validation.analyzer import optimize_policies
+
+            policies = optimize_policies(policies)
+        # Pruning is only proven safe under deny_overrides; the header
+        # records it so the bundle is never evaluated with another strategy.
+        digest = write_bundle(
+            policies,
+            args.output,
+            optimized_for="deny_overrides" if args.optimize else None,
+        )
+    except Exception as e:
+        print(f"Bundle failed: {e}", file=sys.stderr)
+        return 1
+    print(f"Wrote {args.output}: {len(policies)} policies, sha256 {digest}")
+    return 0
+
+
+def cmd_analyze(args: argparse.Namespace) -> int:
+    from validation.analyzer import analyze_policies
+    from validation.loader import load_policy_files, policy_files
+
+    try:
+        policies = load_policy_files(policy_files(args.policies))
+        analysis = analyze_policies(policies)
+    except Exception as e:
+        print(f"Analysis failed: {e}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "policies": len(policies),
+                    "removable": analysis.removed,
+                    "findings": [f._asdict() for f in analysis.findings],
+                },
+                indent=2,
+            )
+        )
+        return 0
+    for finding in analysis.findings:
+        action = "removable" if finding.removable else "kept"
+        print(f"{finding.kind:<14}{finding.policy_id}: {finding.message} [{action}]")
+    print(
+        f"{len(policies)} policies, {len(analysis.findings)} finding(s), "
+        f"{analysis.removed} removable (deny_overrides)"
+    )
+    return 0
+
+
+def _read_jsonl(stream: IO[str]) -> Iterator[Any]:
+    for lineno, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {lineno}: invalid JSON ({e})") from e
+
+
+def _decision_record(result: Decision | DecisionSummary) -> dict[str, Any]:
+    from engine.summary import DecisionSummary
+
+    if isinstance(result, DecisionSummary):
+        return result.to_dict()
+    return result.model_dump(mode="json")
+
+
+def _evaluate_stream(
+    index: PolicyIndex,
+    contexts: Iterable[Any],
+    *,
+    trace: bool,
+    strategy: ConflictStrategy = "deny_overrides",
+    workers: int = 1,
+    chunk_size: int = 512,
+) -> Iterator[dict[str, Any]]:
+    from engine.errors import PolicyEvaluationError
+    from engine.policy_set import evaluate_policies_decision
+
+    if workers > 1:
+        from engine.parallel import evaluate_parallel
+
+        results = evaluate_parallel(
+            index,
+            contexts,
+            workers=workers,
+            chunk_size=chunk_size,
+            strategy=strategy,
+            trace=trace,
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, PolicyEvaluationError):
+                yield {"error": str(result)}
+            else:
+                yield _decision_record(result)
+        return
+
+    for context in contexts:
+        try:
+            result = evaluate_policies_decision(
+                index, context, strategy=strategy, trace=trace
+            )
+        except PolicyEvaluationError as e:
+            yield {"error": str(e)}
+            continue
+        yield _decision_record(result)
+
+
+def cmd_evaluate_stream(args: argparse.Namespace) -> int:
+    from contextlib import ExitStack
+
+    try:
+        index = _load_policy_index(args.policies, args.strategy)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    errors = 0
+    try:
+        with ExitStack() as stack:
+            source = (
+                sys.stdin
+                if args.input == "-"
+                else stack.enter_context(open(args.input, encoding="utf-8"))
+            )
+            sink = (
+                sys.stdout
+                if args.output == "-"
+                else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+            )
+            contexts = _read_jsonl(source)
+            records = _evaluate_stream(
+                index,
+                contexts,
+                trace=args.trace,
+                strategy=args.strategy,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+            )
+            for record in records:
+                errors += "error" in record
+                sink.write(json.dumps(record) + "\n")
+    except Exception as e:
+        print(f"Evaluation failed: {e}", file=sys.stderr)
+        return 1
+    if errors:
+        print(f"{errors} context(s) could not be evaluated", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def _serve(pdp, args: argparse.Namespace) -> None:
+    import asyncio
+
+    servers = []
+    if args.socket:
+        servers.append(await pdp.serve_unix(args.socket))
+        print(f"Serving on unix:{args.socket}", file=sys.stderr)
+    if args.port is not None or not args.socket:
+        port = 8181 if args.port is None else args.port
+        servers.append(await pdp.serve_http(args.host, port))
+        print(f"Serving on http://{args.host}:{port}", file=sys.stderr)
+    await asyncio.gather(*(server.serve_forever() for server in servers))
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    import asyncio
+
+    from engine.store import PolicyStore
+    from server.pdp import PolicyDecisionPoint
+
+    if args.metrics:
+        from engine import instrumentation
+
+        instrumentation.enable()
+    if bool(args.policies) == bool(args.watch):
+        print("Error: pass policy files or --watch DIR (not both)", file=sys.stderr)
+        return 1
+    audit = None
+    policies: PolicyIndex | PolicyStore
+    try:
+        if args.audit_log:
+            from engine.audit import AuditLog
+
+            audit = AuditLog(
+                args.audit_log,
+                sample_rate=args.audit_sample,
+                overflow=args.audit_overflow,
+            )
+        if args.watch:
+            store = PolicyStore(args.watch, poll_interval=args.poll_interval)
+            store.start()
+            policies = store
+        else:
+            policies = _load_policy_index(args.policies)
+        pdp = PolicyDecisionPoint(policies, audit=audit)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if audit is not None:
+        audit.start()
+    try:
+        asyncio.run(_serve(pdp, args))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if audit is not None:
+            audit.close()
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         prog="ace",
@@ -119,9 +402,19 @@ def main() -> int:
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    validate_parser = subparsers.add_parser("validate", help="Validate a policy file")
+    validate_parser = subparsers.add_parser(
+        "validate", help="Validate policy files or directories of policy files"
+    )
     validate_parser.add_argument(
-        "policy", help="Path to policy file (.json, .yaml, .yml)"
+        "policies",
+        nargs="+",
+        help="Policy files (.json, .yaml, .yml) or directories to scan recursively",
+    )
+    validate_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Parse and validate across this many processes (default: CPU count)",
     )
     validate_parser.set_defaults(func=cmd_validate)
 
@@ -137,19 +430,155 @@ def main() -> int:
 
     multi_parser = subparsers.add_parser(
         "evaluate-policies",
-        help="Evaluate multiple policies (deny-overrides) against a context",
+        help="Evaluate multiple policies against a context",
     )
     multi_parser.add_argument(
         "policies",
         nargs="+",
-        help="Paths to policy files",
+        help="Policy files or directories of policy files",
     )
     multi_parser.add_argument("context", help="Path to context file (.json)")
     multi_parser.add_argument(
         "-t", "--trace", action="store_true", help="Print evaluation trace"
     )
+    multi_parser.add_argument(
+        "-s",
+        "--strategy",
+        choices=STRATEGIES,
+        default="deny_overrides",
+        help="Combining algorithm (default: deny_overrides)",
+    )
     multi_parser.set_defaults(func=cmd_evaluate_multi)
 
+    stream_parser = subparsers.add_parser(
+        "evaluate-stream",
+        help="Evaluate JSONL contexts against policies, one decision per line",
+    )
+    stream_parser.add_argument(
+        "policies", nargs="+", help="Policy files, directories or .aceb bundles"
+    )
+    stream_parser.add_argument(
+        "-i",
+        "--input",
+        default="-",
+        help="JSONL file of contexts (default: stdin)",
+    )
+    stream_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="File to write JSONL decisions to (default: stdout)",
+    )
+    stream_parser.add_argument(
+        "-t", "--trace", action="store_true", help="Include evaluation trace"
+    )
+    stream_parser.add_argument(
+        "-s",
+        "--strategy",
+        choices=STRATEGIES,
+        default="deny_overrides",
+        help="Combining algorithm (default: deny_overrides)",
+    )
+    stream_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Evaluate in parallel across this many processes (default: 1)",
+    )
+    stream_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=512,
+        help="Contexts per parallel task (default: 512)",
+    )
+    stream_parser.set_defaults(func=cmd_evaluate_stream)
+
+    bundle_parser = subparsers.add_parser(
+        "bundle", help="Validate policies and write a precompiled bundle"
+    )
+    bundle_parser.add_argument(
+        "paths", nargs="+", help="Policy files or directories of policy files"
+    )
+    bundle_parser.add_argument(
+        "-o", "--output", required=True, help="Bundle file to write (.aceb)"
+    )
+    bundle_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Parse and validate across this many processes (default: CPU count)",
+    )
+    bundle_parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Drop policies that `ace analyze` proves removable (deny_overrides)",
+    )
+    bundle_parser.set_defaults(func=cmd_bundle)
+
+    analyze_parser = subparsers.add_parser(
+        "analyze",
+        help="Report duplicate, contradictory, shadowed and redundant policies",
+    )
+    analyze_parser.add_argument(
+        "policies", nargs="+", help="Policy files or directories of policy files"
+    )
+    analyze_parser.add_argument(
+        "--json", action="store_true", help="Print findings as JSON"
+    )
+    analyze_parser.set_defaults(func=cmd_analyze)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local policy decision point (Unix socket and/or HTTP)"
+    )
+    serve_parser.add_argument(
+        "policies", nargs="*", help="Policy files, directories or .aceb bundles"
+    )
+    serve_parser.add_argument(
+        "--watch",
+        metavar="DIR",
+        help="Load policies from DIR and hot-reload them when files change",
+    )
+    serve_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between --watch directory scans (default: 1.0)",
+    )
+    serve_parser.add_argument("--socket", help="Unix socket path (JSONL protocol)")
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="HTTP bind address (default: 127.0.0.1)"
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        help="HTTP port (default: 8181 when --socket is not given)",
+    )
+    serve_parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Record per-policy counters and expose them at GET /metrics",
+    )
+    serve_parser.add_argument(
+        "--audit-log",
+        metavar="PATH",
+        help="Append every decision to a rotating JSONL audit log at PATH",
+    )
+    serve_parser.add_argument(
+        "--audit-sample",
+        type=float,
+        default=0.0,
+        help="Fraction of non-DENY decisions logged with their full trace "
+        "(DENY decisions always are; default: 0)",
+    )
+    serve_parser.add_argument(
+        "--audit-overflow",
+        choices=AUDIT_OVERFLOW,
+        default="block",
+        help="What to do when the audit queue is full (default: block)",
+    )
+    serve_parser.set_defaults(func=cmd_serve)
+
     args = parser.parse_args()
     return args.func(args)
 
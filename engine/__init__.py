@@ -1,15 +1,61 @@
-from engine.decision import Decision, DecisionOutcome, TraceEntry
-from engine.errors import ContextValidationError, PolicyEvaluationError
-from engine.evaluator import evaluate_policy, evaluate_policy_decision
-from engine.policy_set import evaluate_policies_decision
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from engine import instrumentation
+    from engine.batch import evaluate_batch
+    from engine.cache import DecisionCache
+    from engine.compiler import CompiledPolicy, compile_policy
+    from engine.decision import Decision, DecisionOutcome, TraceEntry
+    from engine.errors import ContextValidationError, PolicyEvaluationError
+    from engine.evaluator import evaluate_policy, evaluate_policy_decision
+    from engine.policy_index import PolicyIndex
+    from engine.policy_set import evaluate_policies_decision
+    from engine.summary import DecisionSummary
+
+# Exports are imported on first access so that light entry points (the CLI,
+# bundle loading) do not pay for Pydantic and every engine module up front.
+_EXPORTS = {
+    "Decision": "engine.decision",
+    "DecisionOutcome": "engine.summary",
+    "DecisionSummary": "engine.summary",
+    "TraceEntry": "engine.decision",
+    "PolicyEvaluationError": "engine.errors",
+    "ContextValidationError": "engine.errors",
+    "PolicyIndex": "engine.policy_index",
+    "DecisionCache": "engine.cache",
+    "CompiledPolicy": "engine.compiler",
+    "compile_policy": "engine.compiler",
+    "evaluate_policy": "engine.evaluator",
+    "evaluate_policy_decision": "engine.evaluator",
+    "evaluate_policies_decision": "engine.policy_set",
+    "evaluate_batch": "engine.batch",
+}
 
 __all__ = [
     "Decision",
     "DecisionOutcome",
+    "DecisionSummary",
     "TraceEntry",
     "PolicyEvaluationError",
     "ContextValidationError",
+    "PolicyIndex",
+    "DecisionCache",
+    "CompiledPolicy",
+    "compile_policy",
     "evaluate_policy",
     "evaluate_policy_decision",
     "evaluate_policies_decision",
+    "evaluate_batch",
+    "instrumentation",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'engine' has no attribute '{name}'")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,254 @@
+"""On-demand attribute providers for request contexts.
+
+Callers pass the attributes they already have; an ``AttributeResolver``
+fetches the rest from registered providers before evaluation. Only fields
+read by the request's target bucket are considered, and only those missing
+from the context are fetched, with one ``fetch`` call per provider and a
+per-provider TTL cache in front. A field no provider returns stays missing
+and raises ``ContextValidationError`` exactly as before.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from engine.errors import ContextValidationError
+from engine.evaluator import resolve_field, resolve_parts
+from engine.policy_index import PolicyIndex
+from engine.policy_set import ConflictStrategy, evaluate_policies_decision
+from engine.summary import DecisionSummary
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+_ABSENT = object()
+
+
+class AttributeProvider(ABC):
+    """Source of the context fields under ``prefix`` (e.g. ``user`` or ``user.groups``).
+
+    ``key`` is the dotted path identifying the entity the attributes belong
+    to (e.g. ``user.id``); fetched values are cached per key value for
+    ``ttl`` seconds (not cached when ``ttl`` is None or the key is missing).
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        *,
+        key: Optional[str] = None,
+        ttl: Optional[float] = None,
+        maxsize: int = 10_000,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.prefix = prefix
+        self.key = key
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+    @abstractmethod
+    def fetch(self, paths: Sequence[str], context: dict[str, Any]) -> Mapping[str, Any]:
+        """Values for as many of ``paths`` as the provider knows, keyed by path."""
+
+
+class InMemoryProvider(AttributeProvider):
+    """Provider backed by a dict of records, keyed by the value at ``key``."""
+
+    def __init__(
+        self,
+        prefix: str,
+        records: Mapping[Hashable, dict[str, Any]],
+        *,
+        key: str,
+        ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__(prefix, key=key, ttl=ttl)
+        self.records = records
+        self.calls: list[tuple[str, ...]] = []
+
+    def fetch(self, paths: Sequence[str], context: dict[str, Any]) -> Mapping[str, Any]:
+        self.calls.append(tuple(paths))
+        assert self.key is not None
+        try:
+            record = self.records.get(resolve_field(self.key, context))
+        except (ContextValidationError, TypeError):
+            return {}
+        if record is None:
+            return {}
+        # Records hold the subtree under the provider's top-level name.
+        root = self.prefix.split(".")[0]
+        values = {}
+        for path in paths:
+            try:
+                values[path] = resolve_field(path, {root: record})
+            except ContextValidationError:
+                pass
+        return values
+
+
+class _ProviderCache:
+    def __init__(self, provider: AttributeProvider) -> None:
+        self.provider = provider
+        self.entries: OrderedDict[tuple[Hashable, str], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable, path: str, now: float) -> Any:
+        with self.lock:
+            entry = self.entries.get((key, path))
+            if entry is None:
+                return _ABSENT
+            expires_at, value = entry
+            if now >= expires_at:
+                del self.entries[key, path]
+                return _ABSENT
+            self.entries.move_to_end((key, path))
+            return value
+
+    def put(self, key: Hashable, values: dict[str, Any], now: float) -> None:
+        assert self.provider.ttl is not None
+        expires_at = now + self.provider.ttl
+        with self.lock:
+            for path, value in values.items():
+                self.entries[key, path] = (expires_at, value)
+                self.entries.move_to_end((key, path))
+            while len(self.entries) > self.provider.maxsize:
+                self.entries.popitem(last=False)
+
+
+def _assign(
+    result: dict[str, Any], parts: tuple[str, ...], value: Any, copied: set[int]
+) -> None:
+    # Copy-on-write along the path so the caller's context is never mutated.
+    node = result
+    for part in parts[:-1]:
+        child = node.get(part)
+        if child is None:
+            child = {}
+        elif not isinstance(child, dict):
+            return
+        elif id(child) not in copied:
+            child = dict(child)
+        copied.add(id(child))
+        node[part] = child
+        node = child
+    node[parts[-1]] = value
+
+
+class AttributeResolver:
+    """Completes contexts with the missing fields a policy set actually reads."""
+
+    def __init__(
+        self,
+        providers: Iterable[AttributeProvider] = (),
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._caches: dict[str, _ProviderCache] = {}
+        for provider in providers:
+            self.register(provider)
+
+    def register(self, provider: AttributeProvider) -> None:
+        if provider.prefix in self._caches:
+            raise ValueError(
+                f"a provider is already registered for '{provider.prefix}'"
+            )
+        self._caches[provider.prefix] = _ProviderCache(provider)
+
+    def _provider_for(self, field: str) -> Optional[_ProviderCache]:
+        # The longest registered prefix wins.
+        parts = field.split(".")
+        for end in range(len(parts), 0, -1):
+            cache = self._caches.get(".".join(parts[:end]))
+            if cache is not None:
+                return cache
+        return None
+
+    def complete(self, index: PolicyIndex, context: dict[str, Any]) -> dict[str, Any]:
+        """``context`` plus provider values for the missing fields its bucket reads.
+
+        Returns ``context`` itself when nothing is missing; otherwise a copy
+        (the caller's dicts are never modified). The target attributes
+        (``resource.type``, ``environment.env``) must be in ``context``.
+        """
+        bucket = index.candidates(context)
+        pending: dict[int, tuple[_ProviderCache, list[tuple[str, tuple[str, ...]]]]] = (
+            {}
+        )
+        for field, parts in index.fields(bucket):
+            try:
+                resolve_parts(parts, field, context)
+                continue
+            except ContextValidationError:
+                pass
+            cache = self._provider_for(field)
+            if cache is not None:
+                pending.setdefault(id(cache), (cache, []))[1].append((field, parts))
+        if not pending:
+            return context
+
+        found: list[tuple[tuple[str, ...], Any]] = []
+        now = self._clock()
+        for cache, fields in pending.values():
+            provider = cache.provider
+            key: Any = None
+            if provider.ttl is not None and provider.key is not None:
+                try:
+                    key = resolve_field(provider.key, context)
+                    hash(key)
+                except (ContextValidationError, TypeError):
+                    key = None
+            to_fetch = []
+            for field, parts in fields:
+                value = _ABSENT if key is None else cache.get(key, field, now)
+                if value is _ABSENT:
+                    to_fetch.append((field, parts))
+                elif value is not None:
+                    found.append((parts, value))
+            if not to_fetch:
+                continue
+            fetched = provider.fetch([field for field, _ in to_fetch], context)
+            if key is not None:
+                # Paths the provider did not return are cached as absent (None).
+                cache.put(key, {f: fetched.get(f) for f, _ in to_fetch}, now)
+            for field, parts in to_fetch:
+                value = fetched.get(field)
+                if value is not None:
+                    found.append((parts, value))
+
+        if not found:
+            return context
+        result = dict(context)
+        copied = {id(result)}
+        for parts, value in found:
+            _assign(result, parts, value, copied)
+        return result
+
+    def evaluate(
+        self,
+        index: PolicyIndex,
+        context: dict[str, Any],
+        *,
+        strategy: ConflictStrategy = "deny_overrides",
+        trace: bool = True,
+    ) -> Decision | DecisionSummary:
+        """``evaluate_policies_decision`` on the completed context."""
+        return evaluate_policies_decision(
+            index, self.complete(index, context), strategy=strategy, trace=trace
+        )
@@ -0,0 +1,321 @@
+"""Buffered decision audit log written by a background thread.
+
+``AuditLog.record`` is all the request path pays: a sampling check and a put
+on a bounded queue. A writer thread drains the queue in batches, appends one
+JSON line per decision and rotates the file by size, gzipping rotated
+segments. Every DENY and a ``sample_rate`` fraction of the other decisions
+carry the full trace. For those, ``record`` keeps the target and the values
+of the fields the request's bucket reads (about the cost of a
+``DecisionCache`` key), and the writer rebuilds the trace from them without
+touching the instrumentation counters; callers must not mutate those values
+in place afterwards. The recorded decision, ``policy_id`` and reason are
+always what gets written. A rebuilt trace is attached only if it reaches the
+same result, otherwise the entry is written without a trace and counted as a
+mismatch.
+
+When the queue is full, ``overflow`` decides: ``"block"`` applies
+backpressure (waiting up to ``block_timeout`` seconds, then dropping),
+``"drop"`` drops the new record, and ``"drop_allow"`` drops new non-DENY
+records but blocks for DENYs. Drops are counted in ``stats()``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import queue
+import random
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, get_args
+
+from engine.errors import ContextValidationError
+from engine.evaluator import resolve_parts
+from engine.policy_index import PolicyIndex
+from engine.policy_set import (
+    ConflictStrategy,
+    evaluate_policies_decision,
+    trace_policies,
+)
+from engine.summary import DecisionSummary
+from engine.target_matcher import context_target_key
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+OverflowPolicy = Literal["block", "drop", "drop_allow"]
+OVERFLOW_POLICIES: tuple[str, ...] = get_args(OverflowPolicy)
+
+# Target and (parts, value) pairs of the fields a trace rebuild reads.
+_Snapshot = tuple[Any, Any, list[tuple[tuple[str, ...], Any]]]
+
+# (timestamp, decision, index and context snapshot to rebuild the trace from,
+# strategy)
+_Entry = tuple[
+    float,
+    "Decision | DecisionSummary",
+    Optional[PolicyIndex],
+    Optional[_Snapshot],
+    ConflictStrategy,
+]
+
+_STOP = object()
+
+
+def _snapshot(index: PolicyIndex, context: Any) -> Optional[_Snapshot]:
+    """What a trace rebuild reads from ``context``, at about a cache key's cost."""
+    try:
+        resource_type, env = key = context_target_key(context)
+        bucket = index.bucket(key)
+    except (ContextValidationError, TypeError):
+        return None
+    values = []
+    for field, parts in index.fields(bucket):
+        try:
+            values.append((parts, resolve_parts(parts, field, context)))
+        except ContextValidationError:
+            # Left out, so the rebuild fails just as evaluation did.
+            pass
+    return resource_type, env, values
+
+
+def _rebuild_context(snapshot: _Snapshot) -> dict[str, Any]:
+    resource_type, env, values = snapshot
+    context: dict[str, Any] = {
+        "resource": {"type": resource_type},
+        "environment": {"env": env},
+    }
+    for parts, value in values:
+        node = context
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        # Copied so a nested field stored later lands in the rebuilt context,
+        # not in the caller's dict.
+        node[parts[-1]] = dict(value) if isinstance(value, dict) else value
+    return context
+
+
+class AuditLog:
+    """Asynchronous, size-rotated JSONL audit log of policy decisions."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        sample_rate: float = 0.0,
+        max_queue: int = 10_000,
+        overflow: OverflowPolicy = "block",
+        block_timeout: Optional[float] = None,
+        batch_size: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        backups: int = 5,
+        compress: bool = True,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unsupported overflow policy '{overflow}'")
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.compress = compress
+        self._rng = rng
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._file: Any = None
+        # Plain integers: the writer thread owns the write-side counters, and
+        # the request-side ones are approximate under concurrency.
+        self._stats = {
+            "recorded": 0,
+            "dropped": 0,
+            "traced": 0,
+            "written": 0,
+            "batches": 0,
+            "rotations": 0,
+            "mismatches": 0,
+            "errors": 0,
+        }
+
+    def stats(self) -> dict[str, int]:
+        return {**self._stats, "pending": self._queue.qsize()}
+
+    def record(
+        self,
+        result: Decision | DecisionSummary,
+        index: Optional[PolicyIndex] = None,
+        context: Any = None,
+        *,
+        strategy: ConflictStrategy = "deny_overrides",
+    ) -> bool:
+        """Queue ``result`` for writing; False if the overflow policy dropped it.
+
+        A decision-only result selected for tracing (every DENY, plus a
+        ``sample_rate`` sample) needs the ``index`` and ``context`` it was
+        evaluated from; without them it is written without a trace.
+        """
+        if self._thread is None:
+            raise RuntimeError("audit log is not running; call start() first")
+        snapshot = None
+        if (
+            index is not None
+            and isinstance(result, DecisionSummary)
+            and (result.decision == "DENY" or self._rng() < self.sample_rate)
+        ):
+            # The writer re-evaluates later; reassigning fields of the
+            # caller's context must not change what it sees.
+            snapshot = _snapshot(index, context)
+        if snapshot is None:
+            index = None
+        entry: _Entry = (time.time(), result, index, snapshot, strategy)
+        try:
+            if self.overflow == "drop" or (
+                self.overflow == "drop_allow" and result.decision != "DENY"
+            ):
+                self._queue.put_nowait(entry)
+            else:
+                self._queue.put(entry, timeout=self.block_timeout)
+        except queue.Full:
+            self._stats["dropped"] += 1
+            return False
+        self._stats["recorded"] += 1
+        return True
+
+    def evaluate(
+        self,
+        index: PolicyIndex,
+        context: Any,
+        *,
+        strategy: ConflictStrategy = "deny_overrides",
+    ) -> DecisionSummary:
+        """Decision-only evaluation, recorded in the audit log."""
+        result = evaluate_policies_decision(
+            index, context, strategy=strategy, trace=False
+        )
+        assert isinstance(result, DecisionSummary)
+        self.record(result, index, context, strategy=strategy)
+        return result
+
+    def _line(self, entry: _Entry) -> str:
+        timestamp, result, index, snapshot, strategy = entry
+        if isinstance(result, DecisionSummary):
+            data = result.to_dict()
+        else:
+            data = result.model_dump(mode="json")
+            if not data.get("trace"):
+                data.pop("trace", None)
+        if index is not None and snapshot is not None:
+            try:
+                rebuilt = trace_policies(
+                    index, _rebuild_context(snapshot), strategy, observe=False
+                )
+            except Exception:
+                rebuilt = None
+            if rebuilt is not None and (
+                rebuilt.decision,
+                rebuilt.policy_id,
+                rebuilt.reason,
+            ) == (result.decision, result.policy_id, result.reason):
+                data["trace"] = [e.model_dump(mode="json") for e in rebuilt.trace]
+            else:
+                self._stats["mismatches"] += 1
+        if data.get("trace"):
+            self._stats["traced"] += 1
+        return json.dumps({"timestamp": timestamp, **data}) + "\n"
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _rotate(self) -> None:
+        self._file.close()
+        suffix = ".gz" if self.compress else ""
+        for i in range(self.backups - 1, 0, -1):
+            source = Path(f"{self.path}.{i}{suffix}")
+            if source.exists():
+                os.replace(source, f"{self.path}.{i + 1}{suffix}")
+        if self.backups < 1:
+            self.path.unlink()
+        elif self.compress:
+            with (
+                open(self.path, "rb") as src,
+                gzip.open(f"{self.path}.1.gz", "wb") as dst,
+            ):
+                shutil.copyfileobj(src, dst)
+            self.path.unlink()
+        else:
+            os.replace(self.path, f"{self.path}.1")
+        self._stats["rotations"] += 1
+        self._open()
+
+    def _write(self, batch: list[_Entry]) -> None:
+        self._file.write("".join(self._line(entry) for entry in batch))
+        self._file.flush()
+        self._stats["written"] += len(batch)
+        self._stats["batches"] += 1
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _drain(self) -> None:
+        stopping = False
+        while not stopping:
+            # Whatever queued up while the last batch was written goes next.
+            item = self._queue.get()
+            batch: list[_Entry] = []
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._write(batch)
+                except (OSError, ValueError):
+                    self._stats["errors"] += 1
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every record queued so far has been written."""
+        self._queue.join()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._open()
+        self._thread = threading.Thread(
+            target=self._drain, name="audit-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Write every queued record, then stop the writer and close the file."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> AuditLog:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
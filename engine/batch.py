@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Literal, overload
+
+from engine import instrumentation
+from engine.compiler import CompiledPolicy
+from engine.errors import ContextValidationError
+from engine.evaluator import resolve_parts
+from engine.policy_index import Fields, PolicyIndex
+from engine.policy_set import (
+    ConflictStrategy,
+    combine_outcomes,
+    evaluate_policies_decision,
+)
+from engine.summary import DecisionSummary
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+# combine_outcomes never raises for these. only_one_applicable can, and its
+# error has to surface in context order, which the per-context loop gives.
+_COLUMNAR_STRATEGIES = ("deny_overrides", "permit_overrides", "first_applicable")
+
+
+def _resolve_columns(
+    fields: Fields,
+    rows: list[dict[str, Any]],
+    failed: list[bool],
+) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {}
+    for field, parts in fields:
+        column: list[Any] = []
+        for i, context in enumerate(rows):
+            try:
+                column.append(resolve_parts(parts, field, context))
+            except ContextValidationError:
+                failed[i] = True
+                column.append(None)
+        columns[field] = column
+    return columns
+
+
+def _passed_column(
+    plan: CompiledPolicy, columns: dict[str, list[Any]], size: int
+) -> list[bool]:
+    conditions = plan.conditions
+    passed = [conditions.mode_all] * size
+    for condition in conditions.items:
+        column = columns[condition.field]
+        fn, expected = condition.fn, condition.value
+        if conditions.mode_all:
+            passed = [p and fn(v, expected) for p, v in zip(passed, column)]
+        else:
+            passed = [p or fn(v, expected) for p, v in zip(passed, column)]
+    return passed
+
+
+def _evaluate_columnar(
+    index: PolicyIndex,
+    contexts: list[dict[str, Any]],
+    strategy: ConflictStrategy,
+) -> tuple[list[DecisionSummary | None], list[bool]]:
+    failed = [False] * len(contexts)
+    groups: dict[int, tuple[tuple[CompiledPolicy, ...], list[int]]] = {}
+    for i, context in enumerate(contexts):
+        try:
+            bucket = index.candidates(context)
+        except ContextValidationError:
+            failed[i] = True
+            continue
+        groups.setdefault(id(bucket), (bucket, []))[1].append(i)
+
+    results: list[DecisionSummary | None] = [None] * len(contexts)
+    for bucket, row_ids in groups.values():
+        rows = [contexts[i] for i in row_ids]
+        row_failed = [False] * len(rows)
+        columns = _resolve_columns(index.fields(bucket), rows, row_failed)
+        passed = [_passed_column(plan, columns, len(rows)) for plan in bucket]
+        for j, i in enumerate(row_ids):
+            if row_failed[j]:
+                failed[i] = True
+                continue
+            results[i] = combine_outcomes(bucket, [p[j] for p in passed], strategy)
+    return results, failed
+
+
+@overload
+def evaluate_batch(
+    policies: Iterable[Any] | PolicyIndex,
+    contexts: Iterable[dict[str, Any]],
+    *,
+    strategy: ConflictStrategy = ...,
+    trace: Literal[True] = ...,
+) -> list[Decision]: ...
+
+
+@overload
+def evaluate_batch(
+    policies: Iterable[Any] | PolicyIndex,
+    contexts: Iterable[dict[str, Any]],
+    *,
+    strategy: ConflictStrategy = ...,
+    trace: Literal[False],
+) -> list[DecisionSummary]: ...
+
+
+@overload
+def evaluate_batch(
+    policies: Iterable[Any] | PolicyIndex,
+    contexts: Iterable[dict[str, Any]],
+    *,
+    strategy: ConflictStrategy = ...,
+    trace: bool,
+) -> list[Decision | DecisionSummary]: ...
+
+
+def evaluate_batch(
+    policies: Iterable[Any] | PolicyIndex,
+    contexts: Iterable[dict[str, Any]],
+    *,
+    strategy: ConflictStrategy = "deny_overrides",
+    trace: bool = True,
+) -> list[Any]:
+    """Evaluate many contexts against one policy set.
+
+    Results are identical to calling ``evaluate_policies_decision`` once per
+    context with the same ``strategy`` and ``trace``, including which
+    exception is raised for the first invalid context. Traced results are
+    built per context; ``trace=False`` takes the columnar decision-only path.
+    """
+    if not isinstance(policies, PolicyIndex):
+        policies = list(policies)
+    contexts = list(contexts)
+
+    if trace or strategy not in _COLUMNAR_STRATEGIES or instrumentation.ENABLED:
+        return [
+            evaluate_policies_decision(
+                policies, context, strategy=strategy, trace=trace
+            )
+            for context in contexts
+        ]
+
+    index = policies if isinstance(policies, PolicyIndex) else PolicyIndex(policies)
+
+    try:
+        results, failed = _evaluate_columnar(index, contexts, strategy)
+    except ValueError:
+        # Operator errors must surface in context order; the per-context path
+        # raises the same error the sequential loop would.
+        return [
+            evaluate_policies_decision(index, context, strategy=strategy, trace=False)
+            for context in contexts
+        ]
+
+    if any(failed):
+        # Re-evaluate the first failing context to raise its exact error.
+        evaluate_policies_decision(
+            index, contexts[failed.index(True)], strategy=strategy, trace=False
+        )
+    return results
@@ -0,0 +1,133 @@
+"""Precompiled policy bundles for fast cold start.
+
+Layout (all integers big-endian)::
+
+    magic     4 bytes   b"ACEB"
+    version   uint16    BUNDLE_VERSION
+    optimized uint16    0, or 1 + the STRATEGIES index of the strategy the
+                        set was optimized for (``ace bundle --optimize``)
+    digest    32 bytes  SHA-256 of the payload
+    length    uint64    payload size in bytes
+    payload   JSON      [[policy_id, resource_type, environment, effect,
+                          mode_all, [[field, operator, value], ...]], ...]
+
+Bundles are written from policies that already passed structural and semantic
+validation, so loading skips YAML parsing and Pydantic entirely. An optimized
+bundle may have dropped policies that only matter under other strategies, so
+it can only be loaded for the strategy recorded in its header.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from engine.compiler import (
+    CompiledPolicy,
+    build_conditions,
+    compile_policy,
+    shared_target,
+)
+from engine.policy_index import PolicyIndex
+from engine.policy_set import STRATEGIES, ConflictStrategy
+
+BUNDLE_MAGIC = b"ACEB"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".aceb"
+
+_HEADER = struct.Struct(">4sHH32sQ")
+
+
+class BundleFormatError(ValueError):
+    pass
+
+
+def _encode(plan: CompiledPolicy) -> list[Any]:
+    return [
+        plan.policy_id,
+        plan.target.resource_type,
+        plan.target.environment,
+        plan.effect,
+        plan.conditions.mode_all,
+        [[c.field, c.operator, c.value] for c in plan.conditions.items],
+    ]
+
+
+def _decode(row: list[Any]) -> CompiledPolicy:
+    policy_id, resource_type, environment, effect, mode_all, conditions = row
+    return CompiledPolicy(
+        policy_id=policy_id,
+        target=shared_target(resource_type, environment),
+        effect=effect,
+        conditions=build_conditions(mode_all, map(tuple, conditions)),
+    )
+
+
+def write_bundle(
+    policies: Iterable[Any],
+    path: str | Path,
+    *,
+    optimized_for: Optional[ConflictStrategy] = None,
+) -> str:
+    """Write validated policies to ``path``; return the payload SHA-256 hex digest.
+
+    Pass ``optimized_for`` when ``policies`` were pruned for one strategy, so
+    the bundle refuses to load for any other.
+    """
+    optimized = 0 if optimized_for is None else STRATEGIES.index(optimized_for) + 1
+    rows = [_encode(compile_policy(policy)) for policy in policies]
+    try:
+        payload = json.dumps(rows, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise BundleFormatError(f"policy value cannot be bundled: {e}") from e
+    digest = hashlib.sha256(payload).digest()
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, optimized, digest, len(payload))
+        )
+        f.write(payload)
+    return digest.hex()
+
+
+def load_bundle(
+    path: str | Path,
+    *,
+    verify: bool = True,
+    strategy: ConflictStrategy = "deny_overrides",
+) -> PolicyIndex:
+    """Load the bundle at ``path`` for evaluation under ``strategy``."""
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            raise BundleFormatError(f"{path}: empty bundle file") from e
+    with data:
+        if len(data) < _HEADER.size:
+            raise BundleFormatError(f"{path}: truncated bundle header")
+        magic, version, optimized, digest, length = _HEADER.unpack_from(data)
+        if magic != BUNDLE_MAGIC:
+            raise BundleFormatError(f"{path}: not a policy bundle")
+        if version != BUNDLE_VERSION:
+            raise BundleFormatError(
+                f"{path}: unsupported bundle version {version} "
+                f"(expected {BUNDLE_VERSION})"
+            )
+        if optimized > len(STRATEGIES):
+            raise BundleFormatError(f"{path}: unknown optimization strategy")
+        if optimized and STRATEGIES[optimized - 1] != strategy:
+            raise BundleFormatError(
+                f"{path}: bundle was optimized for {STRATEGIES[optimized - 1]} "
+                f"and cannot be evaluated with {strategy}"
+            )
+        end = _HEADER.size + length
+        if len(data) != end:
+            raise BundleFormatError(f"{path}: bundle size does not match header")
+        payload = data[_HEADER.size : end]
+
+    if verify and hashlib.sha256(payload).digest() != digest:
+        raise BundleFormatError(f"{path}: bundle content hash mismatch")
+    return PolicyIndex(_decode(row) for row in json.loads(payload))
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from engine.errors import ContextValidationError
+from engine.evaluator import resolve_parts
+from engine.policy_index import PolicyIndex
+from engine.policy_set import ConflictStrategy, evaluate_policies_decision
+from engine.summary import DecisionSummary
+
+
+class DecisionCache:
+    """Opt-in LRU/TTL cache of decision-only results for a ``PolicyIndex``.
+
+    The key is the request's target plus the values of the condition fields
+    read by the policies in that target bucket, so attributes no applicable
+    policy reads (request ids, timestamps, ...) do not fragment the cache.
+    Entries are dropped automatically when a different index is evaluated.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, DecisionSummary]] = (
+            OrderedDict()
+        )
+        self._index: Optional[PolicyIndex] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+    def _key(
+        self, index: PolicyIndex, context: dict[str, Any], strategy: str
+    ) -> Optional[Hashable]:
+        try:
+            bucket = index.candidates(context)
+        except ContextValidationError:
+            return None
+        fields = index.fields(bucket)
+        try:
+            values = tuple(
+                resolve_parts(parts, field, context) for field, parts in fields
+            )
+            key = (strategy, id(bucket), values)
+            hash(key)
+        except (ContextValidationError, TypeError):
+            # Missing fields raise from evaluation; unhashable values bypass.
+            return None
+        return key
+
+    def evaluate(
+        self,
+        index: PolicyIndex,
+        context: dict[str, Any],
+        *,
+        strategy: ConflictStrategy = "deny_overrides",
+    ) -> DecisionSummary:
+        if index is not self._index:
+            with self._lock:
+                self._entries.clear()
+                self._index = index
+
+        key = self._key(index, context, strategy)
+        if key is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    expires_at, result = entry
+                    if self.ttl is None or self._clock() < expires_at:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        return result
+                    del self._entries[key]
+
+        self.misses += 1
+        result = evaluate_policies_decision(
+            index, context, strategy=strategy, trace=False
+        )
+        assert isinstance(result, DecisionSummary)
+        if key is not None:
+            expires_at = self._clock() + self.ttl if self.ttl is not None else 0.0
+            with self._lock:
+                self._entries[key] = (expires_at, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return result
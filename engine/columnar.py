@@ -0,0 +1,218 @@
+"""Vectorized evaluation over column tables (requires NumPy).
+
+A table maps dotted field paths (``user.role``, ``resource.type``,
+``environment.env``, ...) to equally sized columns, one row per request
+context. Missing values are ``None`` in an object column, or an absent column.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from engine.compiler import CompiledPolicy, compile_policy
+from engine.errors import ContextValidationError
+from engine.operators import equals
+from engine.policy_index import PolicyIndex
+from engine.policy_set import evaluate_policies_decision
+from engine.values import is_number
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_NUMERIC_KINDS = "iufb"
+_INT64 = (-(2**63), 2**63)
+_UINT64 = (0, 2**64)
+# Largest magnitude below which every integer is an exact float64.
+_FLOAT_EXACT = 2**53
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "NumPy is required for columnar evaluation. Install with: pip install numpy"
+        ) from exc
+    return numpy
+
+
+def _as_column(values: Any, np) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values
+    column = np.empty(len(values), dtype=object)
+    column[:] = list(values)
+    if not len(column):
+        return column
+    # A typed column is used only when every value round-trips exactly, so
+    # mixed int/float or out-of-range ints stay Python objects.
+    types = {type(v) for v in column}
+    if types == {str}:
+        return column.astype(str)
+    if types == {bool}:
+        return column.astype(bool)
+    if types == {float}:
+        return column.astype(np.float64)
+    if types == {int} and all(_INT64[0] <= v < _INT64[1] for v in column):
+        return column.astype(np.int64)
+    return column
+
+
+def _missing_mask(column: np.ndarray, np) -> np.ndarray:
+    if column.dtype.kind == "O":
+        return np.equal(column, None)
+    return np.zeros(len(column), dtype=bool)
+
+
+def _exact(value: Any, kind: str) -> bool:
+    """Whether NumPy compares the number ``value`` with a ``kind`` column exactly."""
+    if kind == "f":
+        return isinstance(value, float) or abs(value) <= _FLOAT_EXACT
+    if isinstance(value, float):
+        return False
+    low, high = _UINT64 if kind == "u" else _INT64
+    return low <= value < high
+
+
+def _compare(operator: str, fn, column: np.ndarray, value: Any, np) -> np.ndarray:
+    kind = column.dtype.kind
+    if kind in _NUMERIC_KINDS or kind == "U":
+        if kind in _NUMERIC_KINDS:
+
+            def compatible(v: Any) -> bool:
+                return is_number(v) and _exact(v, kind)
+
+            def inexact(v: Any) -> bool:
+                return is_number(v) and not _exact(v, kind)
+
+        else:
+
+            def compatible(v: Any) -> bool:
+                return isinstance(v, str)
+
+            def inexact(v: Any) -> bool:
+                return False
+
+        # Numbers NumPy would round are left to the scalar operator below.
+        if operator == "equals" and not inexact(value):
+            if compatible(value):
+                return np.asarray(column == value, dtype=bool)
+            if kind == "U" or value is None or isinstance(value, str):
+                return np.zeros(len(column), dtype=bool)
+        elif operator == "in" and value is not None and not isinstance(value, str):
+            try:
+                values = list(value)
+            except TypeError:
+                return np.zeros(len(column), dtype=bool)
+            if not any(inexact(v) for v in values):
+                candidates = [v for v in values if compatible(v)]
+                if not candidates:
+                    return np.zeros(len(column), dtype=bool)
+                return np.isin(column, candidates)
+        elif operator in ("gt", "lt") and kind in _NUMERIC_KINDS:
+            if not is_number(value):
+                return np.zeros(len(column), dtype=bool)
+            if _exact(value, kind):
+                return column > value if operator == "gt" else column < value
+
+    # Object columns and anything else fall back to the scalar operator.
+    if len(column) == 0:
+        return np.zeros(0, dtype=bool)
+    return np.frompyfunc(lambda a: bool(fn(a, value)), 1, 1)(column).astype(bool)
+
+
+def _row_context(table: Mapping[str, Any], row: int) -> dict[str, Any]:
+    context: dict[str, Any] = {}
+    for path, column in table.items():
+        node = context
+        *parents, leaf = path.split(".")
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = column[row]
+        if hasattr(node[leaf], "item"):
+            node[leaf] = node[leaf].item()
+    return context
+
+
+def evaluate_columns(
+    policies: Iterable[Any] | PolicyIndex, table: Mapping[str, Any]
+) -> np.ndarray:
+    """Evaluate every row of ``table`` and apply deny-overrides.
+
+    Returns an array of ``ALLOW`` / ``DENY`` / ``NOT_APPLICABLE`` strings that
+    agrees with ``evaluate_policies_decision`` row by row. Rows whose scalar
+    evaluation would raise cause the error of the first such row to be raised.
+    """
+    np = _require_numpy()
+    plans: tuple[CompiledPolicy, ...] = (
+        policies.policies
+        if isinstance(policies, PolicyIndex)
+        else tuple(compile_policy(policy) for policy in policies)
+    )
+    columns = {path: _as_column(values, np) for path, values in table.items()}
+    sizes = {len(column) for column in columns.values()}
+    if len(sizes) > 1:
+        raise ValueError("all table columns must have the same length")
+    size = sizes.pop() if sizes else 0
+
+    result = np.full(size, "NOT_APPLICABLE", dtype="<U14")
+    if not plans or size == 0:
+        return result
+
+    failed = np.zeros(size, dtype=bool)
+    target_columns = []
+    for path in ("resource.type", "environment.env"):
+        column = columns.get(path)
+        if column is None:
+            failed[:] = True
+            column = np.full(size, None, dtype=object)
+        else:
+            failed |= _missing_mask(column, np)
+        target_columns.append(column)
+
+    denied = np.zeros(size, dtype=bool)
+    allowed = np.zeros(size, dtype=bool)
+    for plan in plans:
+        rows = np.flatnonzero(
+            ~failed
+            & _compare("equals", equals, target_columns[0], plan.target[0], np)
+            & _compare("equals", equals, target_columns[1], plan.target[1], np)
+        )
+        if len(rows) == 0:
+            continue
+
+        values = []
+        for field, _ in plan.conditions.fields:
+            column = columns.get(field)
+            if column is None:
+                failed[rows] = True
+                column = np.full(size, None, dtype=object)
+            else:
+                failed[rows] |= _missing_mask(column[rows], np)
+            values.append(column[rows])
+
+        mode_all = plan.conditions.mode_all
+        passed = np.full(len(rows), mode_all, dtype=bool)
+        for condition in plan.conditions.items:
+            ok = _compare(
+                condition.operator,
+                condition.fn,
+                values[condition.slot],
+                condition.value,
+                np,
+            )
+            passed = passed & ok if mode_all else passed | ok
+
+        if plan.effect == "ALLOW":
+            allowed[rows[passed]] = True
+            denied[rows[~passed]] = True
+        else:
+            denied[rows] = True
+
+    if failed.any():
+        first = int(np.flatnonzero(failed)[0])
+        evaluate_policies_decision(plans, _row_context(table, first), trace=False)
+        raise ContextValidationError(f"row {first} is missing required fields")
+
+    result[allowed] = "ALLOW"
+    result[denied] = "DENY"
+    return result
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Callable, Hashable, Iterable, Optional
+from weakref import WeakValueDictionary, finalize
+
+from engine.operators import OPERATORS, in_
+from engine.summary import DecisionOutcome
+from engine.target_matcher import TargetKey
+from engine.values import value_key
+
+
+class CompiledCondition:
+    __slots__ = ("field", "operator", "fn", "value", "slot", "__weakref__")
+
+    def __init__(
+        self,
+        field: str,
+        operator: str,
+        fn: Callable[[Any, Any], bool],
+        value: Any,
+        slot: int,
+    ) -> None:
+        self.field = field
+        self.operator = operator
+        self.fn = fn
+        self.value = value
+        # Position of the resolved field value in CompiledConditions.fields.
+        self.slot = slot
+
+
+class CompiledConditions:
+    __slots__ = ("mode_all", "items", "fields")
+
+    def __init__(
+        self,
+        mode_all: bool,
+        items: tuple[CompiledCondition, ...],
+        fields: tuple[tuple[str, tuple[str, ...]], ...],
+    ) -> None:
+        self.mode_all = mode_all
+        self.items = items
+        # Distinct (field, path parts) pairs in first-use order.
+        self.fields = fields
+
+
+class CompiledPolicy:
+    __slots__ = ("policy_id", "target", "effect", "conditions")
+
+    def __init__(
+        self,
+        policy_id: Optional[str],
+        target: TargetKey,
+        effect: DecisionOutcome,
+        conditions: CompiledConditions,
+    ) -> None:
+        self.policy_id = policy_id
+        self.target = target
+        self.effect = effect
+        self.conditions = conditions
+
+    def __repr__(self) -> str:
+        return f"CompiledPolicy(policy_id={self.policy_id!r}, target={self.target!r})"
+
+
+class _Unsupported:
+    """Operator stand-in that raises when evaluated (picklable, unlike a closure)."""
+
+    __slots__ = ("operator",)
+
+    def __init__(self, operator: str) -> None:
+        self.operator = operator
+
+    def __call__(self, a: Any, b: Any) -> bool:
+        raise ValueError(f"Unsupported operator '{self.operator}'")
+
+
+class _Membership:
+    """``in`` against a list of hashable values, checked with one set probe.
+
+    Falls back to the linear ``in_`` for unhashable request values, so results
+    match ``in_`` on the original list.
+    """
+
+    __slots__ = ("members",)
+
+    def __init__(self, members: frozenset) -> None:
+        self.members = members
+
+    def __call__(self, a: Any, b: Any) -> bool:
+        try:
+            return a in self.members
+        except TypeError:
+            return bool(in_(a, b))
+
+
+# Compiled structures are immutable, so identical pieces are shared by every
+# policy that uses them: one (field, parts) pair per distinct field, one
+# TargetKey per target and one CompiledCondition per distinct condition.
+# Tuples cannot be weakly referenced, so the field and target tables are
+# bounded instead: once full they are cleared, which only costs sharing for
+# policies compiled afterwards (e.g. after many PolicyStore reloads).
+_SHARED_LIMIT = 65536
+_FIELDS: dict[str, tuple[str, tuple[str, ...]]] = {}
+_TARGETS: dict[tuple[str, str], TargetKey] = {}
+_CONDITIONS: WeakValueDictionary[Hashable, CompiledCondition] = WeakValueDictionary()
+
+
+def shared_field(field: str) -> tuple[str, tuple[str, ...]]:
+    pair = _FIELDS.get(field)
+    if pair is None:
+        if len(_FIELDS) >= _SHARED_LIMIT:
+            _FIELDS.clear()
+        # Interned so per-request resolution tables hit the identity fast path.
+        field = sys.intern(field)
+        parts = tuple(sys.intern(part) for part in field.split("."))
+        pair = _FIELDS[field] = (field, parts)
+    return pair
+
+
+def shared_target(resource_type: str, environment: str) -> TargetKey:
+    key = _TARGETS.get((resource_type, environment))
+    if key is None:
+        if len(_TARGETS) >= _SHARED_LIMIT:
+            _TARGETS.clear()
+        key = _TARGETS[resource_type, environment] = TargetKey(
+            sys.intern(resource_type), sys.intern(environment)
+        )
+    return key
+
+
+def _operator_fn(operator: str, value: Any) -> Callable[[Any, Any], bool]:
+    if operator == "in" and isinstance(value, (list, tuple, set, frozenset)):
+        try:
+            return _Membership(frozenset(value))
+        except TypeError:
+            pass
+    return OPERATORS.get(operator) or _Unsupported(operator)
+
+
+def build_conditions(
+    mode_all: bool, conditions: Iterable[tuple[str, str, Any]]
+) -> CompiledConditions:
+    slots: dict[str, int] = {}
+    fields: list[tuple[str, tuple[str, ...]]] = []
+    items: list[CompiledCondition] = []
+    for field, operator, value in conditions:
+        pair = shared_field(field)
+        field = pair[0]
+        slot = slots.get(field)
+        if slot is None:
+            slot = slots[field] = len(fields)
+            fields.append(pair)
+        # The condition holds ``value``, so an id-based key stays unique
+        # for as long as its cache entry lives.
+        key = (field, operator, value_key(value), slot)
+        condition = _CONDITIONS.get(key)
+        if condition is None:
+            operator = sys.intern(operator)
+            fn = _operator_fn(operator, value)
+            condition = _CONDITIONS[key] = CompiledCondition(
+                field, operator, fn, value, slot
+            )
+        items.append(condition)
+
+    return CompiledConditions(mode_all, tuple(items), tuple(fields))
+
+
+def compile_conditions(conditions) -> CompiledConditions:
+    condition_list = conditions.all if conditions.all is not None else conditions.any
+    mode_all = conditions.all is not None
+
+    if condition_list is None:
+        raise ValueError("conditions must define exactly one of 'all' or 'any'")
+
+    return build_conditions(
+        mode_all, ((c.field, c.operator, c.value) for c in condition_list)
+    )
+
+
+# Plans of policy models by ``id``; each entry is dropped when its model is
+# garbage collected, before the id can be reused.
+_COMPILED: dict[int, CompiledPolicy] = {}
+
+
+def compile_policy(policy) -> CompiledPolicy:
+    """Compile ``policy`` once per instance; later calls return the same plan.
+
+    Policies are treated as immutable once compiled: changes made to a model
+    after its first evaluation are not seen by later evaluations.
+    """
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    plan = _COMPILED.get(id(policy))
+    if plan is not None:
+        return plan
+    plan = CompiledPolicy(
+        policy_id=getattr(policy, "policy_id", None),
+        target=shared_target(policy.target.resource_type, policy.target.environment),
+        effect=getattr(policy.effect, "value", policy.effect),
+        conditions=compile_conditions(policy.conditions),
+    )
+    try:
+        finalize(policy, _COMPILED.pop, id(policy), None)
+    except TypeError:
+        # Not weak-referenceable, so it cannot be evicted: compile per call.
+        return plan
+    _COMPILED[id(policy)] = plan
+    return plan
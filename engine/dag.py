@@ -0,0 +1,211 @@
+"""Shared test network (decision DAG) for a whole policy set.
+
+``PolicyDAG`` compiles each target bucket into three layers, in the spirit of
+a Rete alpha/beta network:
+
+- field nodes: the distinct dotted paths read by the bucket;
+- test nodes: the distinct ``(field, operator, value)`` tests, shared by every
+  policy that contains them;
+- policy nodes: one ``all``/``any`` join per policy over its test nodes.
+
+Per request each field is resolved and each test is evaluated at most once.
+The policy nodes yield the pass/fail leaves that ``combine_outcomes``
+resolves. Fields and tests are still visited lazily in policy order, so
+errors are raised exactly as in sequential evaluation.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Optional
+
+from engine.compiler import CompiledPolicy, _Unsupported
+from engine.evaluator import resolve_parts
+from engine.policy_index import PolicyIndex
+from engine.policy_set import (
+    ConflictStrategy,
+    combine_outcomes,
+    evaluate_policies_decision,
+)
+from engine.summary import DecisionSummary
+from engine.values import value_key
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+
+class TestNode:
+    __slots__ = ("field_slot", "fn", "value")
+
+    def __init__(
+        self, field_slot: int, fn: Callable[[Any, Any], bool], value: Any
+    ) -> None:
+        self.field_slot = field_slot
+        self.fn = fn
+        self.value = value
+
+
+class PolicyNode:
+    __slots__ = ("mode_all", "fields", "tests")
+
+    def __init__(
+        self, mode_all: bool, fields: tuple[int, ...], tests: tuple[int, ...]
+    ) -> None:
+        self.mode_all = mode_all
+        # Field slots in first-use order, resolved before any test runs.
+        self.fields = fields
+        # Test slots in condition order.
+        self.tests = tests
+
+
+class BucketNetwork:
+    __slots__ = ("plans", "fields", "tests", "policies", "exact_errors_only")
+
+    def __init__(self, plans: tuple[CompiledPolicy, ...]) -> None:
+        self.plans = plans
+        field_slots: dict[str, int] = {}
+        test_slots: dict[Hashable, int] = {}
+        fields: list[tuple[str, tuple[str, ...]]] = []
+        tests: list[TestNode] = []
+        policies: list[PolicyNode] = []
+        for plan in plans:
+            conditions = plan.conditions
+            slots_for_policy = []
+            for field, parts in conditions.fields:
+                slot = field_slots.get(field)
+                if slot is None:
+                    slot = field_slots[field] = len(fields)
+                    fields.append((field, parts))
+                slots_for_policy.append(slot)
+            policy_tests = []
+            for condition in conditions.items:
+                field_slot = field_slots[condition.field]
+                key = (
+                    field_slot,
+                    condition.operator,
+                    value_key(condition.value),
+                )
+                slot = test_slots.get(key)
+                if slot is None:
+                    slot = test_slots[key] = len(tests)
+                    tests.append(TestNode(field_slot, condition.fn, condition.value))
+                policy_tests.append(slot)
+            policies.append(
+                PolicyNode(
+                    conditions.mode_all, tuple(slots_for_policy), tuple(policy_tests)
+                )
+            )
+        self.fields = tuple(fields)
+        self.tests = tuple(tests)
+        self.policies = tuple(policies)
+        # Without unsupported operators no test can raise, so evaluation may
+        # stop at a decisive policy once the remaining fields are resolved.
+        self.exact_errors_only = not any(
+            isinstance(test.fn, _Unsupported) for test in self.tests
+        )
+
+    def passed(
+        self, context: dict[str, Any], *, until_deny: bool = False
+    ) -> list[bool]:
+        """Pass/fail per policy, in bucket order.
+
+        With ``until_deny`` the list stops at the first policy that fails or
+        has a DENY effect, which is all ``deny_overrides`` needs.
+        """
+        until_deny = until_deny and self.exact_errors_only
+        fields = self.fields
+        tests = self.tests
+        values: list[Any] = [None] * len(fields)
+        resolved = [False] * len(fields)
+        results: list[Optional[bool]] = [None] * len(tests)
+        passed: list[bool] = []
+        decided = False
+        for position, node in enumerate(self.policies):
+            for slot in node.fields:
+                if not resolved[slot]:
+                    field, parts = fields[slot]
+                    # A missing field raises here, at the first policy that
+                    # reads it, and the request is abandoned.
+                    values[slot] = resolve_parts(parts, field, context)
+                    resolved[slot] = True
+            if decided:
+                continue
+            if until_deny and self.plans[position].effect != "ALLOW":
+                passed.append(True)
+                decided = True
+                continue
+            mode_all = node.mode_all
+            outcome = mode_all
+            for slot in node.tests:
+                result = results[slot]
+                if result is None:
+                    test = tests[slot]
+                    result = results[slot] = bool(
+                        test.fn(values[test.field_slot], test.value)
+                    )
+                if result != mode_all:
+                    outcome = result
+                    break
+            passed.append(outcome)
+            decided = until_deny and not outcome
+        return passed
+
+
+class PolicyDAG:
+    """Optional whole-set compiler sharing field resolution and tests per request.
+
+    Decisions are identical to ``evaluate_policies_decision`` on the same
+    policies; ``trace=True`` is delegated to the underlying ``PolicyIndex``.
+    """
+
+    def __init__(self, policies: Iterable[Any] | PolicyIndex) -> None:
+        self.index = (
+            policies if isinstance(policies, PolicyIndex) else PolicyIndex(policies)
+        )
+        self._networks = {
+            id(bucket): BucketNetwork(bucket)
+            for bucket in (self.index.bucket(key) for key in self.index.targets)
+        }
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def stats(self) -> dict[str, int]:
+        networks = self._networks.values()
+        return {
+            "policies": len(self.index),
+            "conditions": sum(
+                len(plan.conditions.items) for n in networks for plan in n.plans
+            ),
+            "fields": sum(len(n.fields) for n in networks),
+            "tests": sum(len(n.tests) for n in networks),
+        }
+
+    def outcomes(
+        self, context: dict[str, Any], *, until_deny: bool = False
+    ) -> tuple[tuple[CompiledPolicy, ...], list[bool]]:
+        """Applicable policies for ``context`` and whether each one's conditions pass.
+
+        ``until_deny`` truncates both at the first policy that fails or has a
+        DENY effect.
+        """
+        bucket = self.index.candidates(context)
+        if not bucket:
+            return (), []
+        passed = self._networks[id(bucket)].passed(context, until_deny=until_deny)
+        return bucket[: len(passed)], passed
+
+    def evaluate(
+        self,
+        context: dict[str, Any],
+        *,
+        strategy: ConflictStrategy = "deny_overrides",
+        trace: bool = False,
+    ) -> Decision | DecisionSummary:
+        if trace:
+            return evaluate_policies_decision(
+                self.index, context, strategy=strategy, trace=True
+            )
+        candidates, passed = self.outcomes(
+            context, until_deny=strategy == "deny_overrides"
+        )
+        return combine_outcomes(candidates, passed, strategy)
@@ -4,7 +4,9 @@ from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-DecisionOutcome = Literal["ALLOW", "DENY", "NOT_APPLICABLE"]
+from engine.summary import DecisionOutcome, DecisionSummary
+
+__all__ = ["Decision", "DecisionOutcome", "DecisionSummary", "TraceEntry"]
 
 
 class TraceEntry(BaseModel):
@@ -0,0 +1,103 @@
+"""Hash dispatch over the ``equals`` conditions of a target bucket.
+
+Many policies in a bucket often gate on the same field (``user.role equals
+admin``, ``user.role equals editor``, ...). ``build_dispatch`` merges those
+conditions into one dict per field mapping each value to the policies whose
+gate it passes, so one probe per field finds the first policy that cannot
+pass without evaluating the policies in between.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from engine.compiler import CompiledPolicy, _Unsupported
+from engine.operators import equals
+
+_EMPTY: frozenset[int] = frozenset()
+
+
+class EqualsDispatch:
+    __slots__ = ("field", "table", "gated")
+
+    def __init__(
+        self,
+        field: str,
+        table: dict[Any, frozenset[int]],
+        gated: tuple[int, ...],
+    ) -> None:
+        self.field = field
+        self.table = table
+        self.gated = gated
+
+    def first_miss(self, value: Any) -> Optional[int]:
+        """Position of the first gated policy whose ``equals`` fails for ``value``."""
+        try:
+            hits = self.table.get(value, _EMPTY)
+        except TypeError:
+            # An unhashable request value never equals a hashable policy value.
+            hits = _EMPTY
+        for position in self.gated:
+            if position not in hits:
+                return position
+        return None
+
+
+class BucketDispatch:
+    __slots__ = ("gates", "first_deny")
+
+    def __init__(self, gates: tuple[EqualsDispatch, ...], first_deny: int) -> None:
+        self.gates = gates
+        # Position of the first DENY-effect policy (bucket length if none).
+        self.first_deny = first_deny
+
+
+def build_dispatch(bucket: tuple[CompiledPolicy, ...]) -> Optional[BucketDispatch]:
+    """Merge ``equals`` conditions shared by ``all``-mode ALLOW policies of a bucket.
+
+    Returns None when no field is gated by at least two policies, or when the
+    bucket uses an unsupported operator (whose error must surface in order).
+    """
+    required: dict[str, dict[int, set[Any]]] = {}
+    for position, plan in enumerate(bucket):
+        conditions = plan.conditions
+        if any(isinstance(c.fn, _Unsupported) for c in conditions.items):
+            return None
+        if plan.effect != "ALLOW" or not conditions.mode_all:
+            continue
+        for condition in conditions.items:
+            if condition.fn is not equals:
+                continue
+            try:
+                hash(condition.value)
+            except TypeError:
+                continue
+            if condition.value != condition.value:
+                # NaN: a dict probe could match it by identity, equals never does.
+                continue
+            positions = required.setdefault(condition.field, {})
+            positions.setdefault(position, set()).add(condition.value)
+
+    gates = []
+    for field, by_position in required.items():
+        if len(by_position) < 2:
+            continue
+        table: dict[Any, set[int]] = {}
+        for position, values in by_position.items():
+            # Two different required values on one field can never both hold.
+            if len(values) == 1:
+                table.setdefault(next(iter(values)), set()).add(position)
+        gates.append(
+            EqualsDispatch(
+                field,
+                {value: frozenset(hits) for value, hits in table.items()},
+                tuple(sorted(by_position)),
+            )
+        )
+    if not gates:
+        return None
+
+    first_deny = next(
+        (i for i, plan in enumerate(bucket) if plan.effect != "ALLOW"), len(bucket)
+    )
+    return BucketDispatch(tuple(gates), first_deny)
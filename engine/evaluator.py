@@ -1,18 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Final, Literal, Optional, overload
 
-from engine.decision import Decision, TraceEntry
+from engine import instrumentation
+from engine.compiler import (
+    CompiledConditions,
+    CompiledPolicy,
+    compile_conditions,
+    compile_policy,
+)
 from engine.errors import ContextValidationError
-from engine.operators import OPERATORS
+from engine.summary import DecisionSummary
 from engine.target_matcher import target_matches
 
-DECISION_DENY = "DENY"
-DECISION_NOT_APPLICABLE = "NOT_APPLICABLE"
+if TYPE_CHECKING:
+    from engine.decision import Decision
 
+DECISION_DENY: Final = "DENY"
+DECISION_NOT_APPLICABLE: Final = "NOT_APPLICABLE"
 
-def resolve_field(path: str, context: dict[str, Any]) -> Any:
-    parts = path.split(".")
+# Per-request memo of resolved fields keyed by (interned) dotted path.
+ResolutionTable = dict[str, Any]
+
+_UNRESOLVED = object()
+_MISSING = object()
+
+
+def resolve_parts(parts: tuple[str, ...], path: str, context: dict[str, Any]) -> Any:
     value: Any = context
     for part in parts:
         if not isinstance(value, dict):
@@ -23,40 +38,172 @@ def resolve_field(path: str, context: dict[str, Any]) -> Any:
     return value
 
 
-def evaluate_conditions(conditions, context: dict[str, Any]) -> bool:
-    condition_list = conditions.all if conditions.all is not None else conditions.any
-    mode_all = conditions.all is not None
+def resolve_field(path: str, context: dict[str, Any]) -> Any:
+    return resolve_parts(tuple(path.split(".")), path, context)
 
-    if condition_list is None:
-        raise ValueError("conditions must define exactly one of 'all' or 'any'")
 
-    results: list[bool] = []
-    for condition in condition_list:
-        actual = resolve_field(condition.field, context)
-        operator_fn = OPERATORS.get(condition.operator)
-        if operator_fn is None:
-            raise ValueError(f"Unsupported operator '{condition.operator}'")
-        results.append(operator_fn(actual, condition.value))
+def resolve_cached(
+    parts: tuple[str, ...], path: str, context: dict[str, Any], table: ResolutionTable
+) -> Any:
+    """``resolve_parts`` memoized in ``table``; missing fields are memoized too."""
+    value = table.get(path, _UNRESOLVED)
+    if value is _UNRESOLVED:
+        try:
+            value = resolve_parts(parts, path, context)
+        except ContextValidationError:
+            value = _MISSING
+        table[path] = value
+    if value is _MISSING:
+        raise ContextValidationError(f"missing field '{path}'")
+    return value
 
-    return all(results) if mode_all else any(results)
+
+def _resolve_values(
+    conditions: CompiledConditions,
+    context: dict[str, Any],
+    table: Optional[ResolutionTable] = None,
+) -> list[Any]:
+    # Every field is resolved before any operator runs, so a missing field
+    # raises even when an earlier condition already decides the group.
+    if table is None:
+        return [
+            resolve_parts(parts, field, context) for field, parts in conditions.fields
+        ]
+    return [
+        resolve_cached(parts, field, context, table)
+        for field, parts in conditions.fields
+    ]
+
+
+def conditions_pass(
+    conditions: CompiledConditions,
+    context: dict[str, Any],
+    table: Optional[ResolutionTable] = None,
+) -> bool:
+    values = _resolve_values(conditions, context, table)
+    if conditions.mode_all:
+        for condition in conditions.items:
+            if not condition.fn(values[condition.slot], condition.value):
+                return False
+        return True
+    for condition in conditions.items:
+        if condition.fn(values[condition.slot], condition.value):
+            return True
+    return False
+
+
+def observed_conditions_pass(
+    plan: CompiledPolicy,
+    context: dict[str, Any],
+    table: Optional[ResolutionTable] = None,
+) -> bool:
+    """``conditions_pass`` for a target-matched policy, recording its counters."""
+    counters = instrumentation.counters(plan)
+    counters.evaluations += 1
+    counters.target_hits += 1
+    start = perf_counter_ns()
+    try:
+        values = _resolve_values(plan.conditions, context, table)
+        passed = mode_all = plan.conditions.mode_all
+        for i, condition in enumerate(plan.conditions.items):
+            if condition.fn(values[condition.slot], condition.value):
+                counters.condition_passes[i] += 1
+                if not mode_all:
+                    passed = True
+                    break
+            else:
+                counters.condition_failures[i] += 1
+                if mode_all:
+                    passed = False
+                    break
+        counters.matches += passed
+        return passed
+    except Exception:
+        counters.errors += 1
+        raise
+    finally:
+        counters.nanoseconds += perf_counter_ns() - start
+
+
+def evaluate_conditions(conditions, context: dict[str, Any]) -> bool:
+    if not isinstance(conditions, CompiledConditions):
+        conditions = compile_conditions(conditions)
+    return conditions_pass(conditions, context)
 
 
 def evaluate_policy(policy, context: dict[str, Any]) -> str:
-    if not target_matches(policy.target, context):
+    plan = compile_policy(policy)
+    if not target_matches(plan.target, context):
         return DECISION_NOT_APPLICABLE
 
-    if not evaluate_conditions(policy.conditions, context):
+    if not conditions_pass(plan.conditions, context):
         return DECISION_DENY
 
-    return policy.effect
+    return plan.effect
 
 
-def evaluate_policy_decision(policy, context: dict[str, Any]) -> Decision:
-    policy_id: Optional[str] = getattr(policy, "policy_id", None)
-    trace: list[TraceEntry] = []
+def _summarize_policy(plan: CompiledPolicy, context: dict[str, Any]) -> DecisionSummary:
+    if not target_matches(plan.target, context):
+        if instrumentation.ENABLED:
+            instrumentation.counters(plan).evaluations += 1
+        return DecisionSummary(
+            DECISION_NOT_APPLICABLE, plan.policy_id, "target mismatch"
+        )
+    if instrumentation.ENABLED:
+        passed = observed_conditions_pass(plan, context)
+    else:
+        passed = conditions_pass(plan.conditions, context)
+    if not passed:
+        return DecisionSummary(
+            DECISION_DENY, plan.policy_id, "conditions not satisfied"
+        )
+    return DecisionSummary(plan.effect, plan.policy_id, "conditions satisfied")
+
+
+@overload
+def evaluate_policy_decision(
+    policy, context: dict[str, Any], *, trace: Literal[True] = ...
+) -> Decision: ...
+
+
+@overload
+def evaluate_policy_decision(
+    policy, context: dict[str, Any], *, trace: Literal[False]
+) -> DecisionSummary: ...
+
+
+@overload
+def evaluate_policy_decision(
+    policy, context: dict[str, Any], *, trace: bool
+) -> Decision | DecisionSummary: ...
 
-    if not target_matches(policy.target, context):
-        trace.append(
+
+def evaluate_policy_decision(
+    policy, context: dict[str, Any], *, trace: bool = True
+) -> Decision | DecisionSummary:
+    plan = compile_policy(policy)
+    if not trace:
+        return _summarize_policy(plan, context)
+    return trace_policy(plan, context)
+
+
+def trace_policy(
+    plan: CompiledPolicy,
+    context: dict[str, Any],
+    table: Optional[ResolutionTable] = None,
+    *,
+    observe: bool = True,
+) -> Decision:
+    # Pydantic is only imported once a trace is actually requested.
+    from engine.decision import Decision, TraceEntry
+
+    policy_id = plan.policy_id
+    entries: list[TraceEntry] = []
+
+    if not target_matches(plan.target, context):
+        if observe and instrumentation.ENABLED:
+            instrumentation.counters(plan).evaluations += 1
+        entries.append(
             TraceEntry(
                 kind="target",
                 ok=False,
@@ -66,31 +213,21 @@ def evaluate_policy_decision(policy, context: dict[str, Any]) -> Decision:
         return Decision(
             decision=DECISION_NOT_APPLICABLE,
             policy_id=policy_id,
-            trace=trace,
+            trace=entries,
             reason="target mismatch",
         )
 
-    trace.append(TraceEntry(kind="target", ok=True))
-
-    condition_list = (
-        policy.conditions.all
-        if policy.conditions.all is not None
-        else policy.conditions.any
-    )
-    mode_all = policy.conditions.all is not None
-
-    if condition_list is None:
-        raise ValueError("conditions must define exactly one of 'all' or 'any'")
+    entries.append(TraceEntry(kind="target", ok=True))
 
+    start = perf_counter_ns()
+    # The traced path evaluates every condition so the explanation is complete.
+    values = _resolve_values(plan.conditions, context, table)
     results: list[bool] = []
-    for condition in condition_list:
-        actual = resolve_field(condition.field, context)
-        operator_fn = OPERATORS.get(condition.operator)
-        if operator_fn is None:
-            raise ValueError(f"Unsupported operator '{condition.operator}'")
-        ok = operator_fn(actual, condition.value)
+    for condition in plan.conditions.items:
+        actual = values[condition.slot]
+        ok = condition.fn(actual, condition.value)
         results.append(ok)
-        trace.append(
+        entries.append(
             TraceEntry(
                 kind="condition",
                 ok=ok,
@@ -101,18 +238,20 @@ def evaluate_policy_decision(policy, context: dict[str, Any]) -> Decision:
             )
         )
 
-    conditions_ok = all(results) if mode_all else any(results)
+    conditions_ok = all(results) if plan.conditions.mode_all else any(results)
+    if observe and instrumentation.ENABLED:
+        instrumentation.record(plan, results, conditions_ok, perf_counter_ns() - start)
     if not conditions_ok:
         return Decision(
             decision=DECISION_DENY,
             policy_id=policy_id,
-            trace=trace,
+            trace=entries,
             reason="conditions not satisfied",
         )
 
     return Decision(
-        decision=getattr(policy.effect, "value", policy.effect),
+        decision=plan.effect,
         policy_id=policy_id,
-        trace=trace,
+        trace=entries,
         reason="conditions satisfied",
     )
@@ -0,0 +1,153 @@
+"""Opt-in per-policy and per-condition evaluation counters.
+
+Disabled by default: the evaluation hot paths only check the module-level
+``ENABLED`` flag. When enabled, each policy gets one ``PolicyCounters`` the
+first time it is evaluated; later requests only increment integers in place.
+Counters are process-local and increments are not locked, so under
+concurrent threads the totals are approximate.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from engine.compiler import CompiledPolicy
+
+ENABLED = False
+
+
+class PolicyCounters:
+    __slots__ = (
+        "policy_id",
+        "conditions",
+        "evaluations",
+        "target_hits",
+        "matches",
+        "errors",
+        "nanoseconds",
+        "condition_passes",
+        "condition_failures",
+    )
+
+    def __init__(self, plan: CompiledPolicy) -> None:
+        self.policy_id = plan.policy_id
+        # (field, operator) per condition, for labelling only.
+        self.conditions = tuple((c.field, c.operator) for c in plan.conditions.items)
+        self.evaluations = 0
+        self.target_hits = 0
+        self.matches = 0
+        self.errors = 0
+        self.nanoseconds = 0
+        self.condition_passes = [0] * len(self.conditions)
+        self.condition_failures = [0] * len(self.conditions)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "evaluations": self.evaluations,
+            "target_hits": self.target_hits,
+            "matches": self.matches,
+            "errors": self.errors,
+            "nanoseconds": self.nanoseconds,
+            "conditions": [
+                {"field": field, "operator": operator, "passed": p, "failed": f}
+                for (field, operator), p, f in zip(
+                    self.conditions, self.condition_passes, self.condition_failures
+                )
+            ],
+        }
+
+
+_counters: dict[Optional[str], PolicyCounters] = {}
+
+
+def counters(plan: CompiledPolicy) -> PolicyCounters:
+    entry = _counters.get(plan.policy_id)
+    if entry is None or len(entry.conditions) != len(plan.conditions.items):
+        entry = _counters[plan.policy_id] = PolicyCounters(plan)
+    return entry
+
+
+def record(
+    plan: CompiledPolicy, results: list[bool], passed: bool, nanoseconds: int
+) -> None:
+    """Record one target-matched evaluation whose condition results are known."""
+    entry = counters(plan)
+    entry.evaluations += 1
+    entry.target_hits += 1
+    entry.matches += passed
+    entry.nanoseconds += nanoseconds
+    for i, ok in enumerate(results):
+        if ok:
+            entry.condition_passes[i] += 1
+        else:
+            entry.condition_failures[i] += 1
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+
+
+def reset() -> None:
+    _counters.clear()
+
+
+def snapshot() -> dict[Optional[str], dict[str, Any]]:
+    return {policy_id: entry.to_dict() for policy_id, entry in _counters.items()}
+
+
+def _label(value: Any) -> str:
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return text.replace("\n", "\\n")
+
+
+_POLICY_METRICS = (
+    ("evaluations", "ace_policy_evaluations_total", "Times a policy was considered."),
+    ("target_hits", "ace_policy_target_hits_total", "Times a policy target matched."),
+    ("matches", "ace_policy_matches_total", "Times a policy's conditions passed."),
+    ("errors", "ace_policy_errors_total", "Evaluations that raised an error."),
+)
+
+
+def to_prometheus() -> str:
+    """Render all counters in the Prometheus text exposition format."""
+    entries = list(_counters.values())
+    lines: list[str] = []
+    for attr, name, help_text in _POLICY_METRICS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for entry in entries:
+            labels = f'policy_id="{_label(entry.policy_id)}"'
+            lines.append(f"{name}{{{labels}}} {getattr(entry, attr)}")
+
+    name = "ace_policy_evaluation_seconds_total"
+    lines += [
+        f"# HELP {name} Cumulative time spent evaluating a policy.",
+        f"# TYPE {name} counter",
+    ]
+    for entry in entries:
+        labels = f'policy_id="{_label(entry.policy_id)}"'
+        lines.append(f"{name}{{{labels}}} {entry.nanoseconds / 1e9:.9f}")
+
+    name = "ace_condition_results_total"
+    lines += [
+        f"# HELP {name} Condition outcomes by policy and condition position.",
+        f"# TYPE {name} counter",
+    ]
+    for entry in entries:
+        for i, (field, operator) in enumerate(entry.conditions):
+            labels = (
+                f'policy_id="{_label(entry.policy_id)}",condition="{i}",'
+                f'field="{_label(field)}",operator="{_label(operator)}"'
+            )
+            lines.append(
+                f'{name}{{{labels},result="pass"}} {entry.condition_passes[i]}'
+            )
+            lines.append(
+                f'{name}{{{labels},result="fail"}} {entry.condition_failures[i]}'
+            )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from engine.batch import evaluate_batch
+from engine.compiler import compile_policy
+from engine.errors import PolicyEvaluationError
+from engine.policy_index import PolicyIndex
+from engine.policy_set import ConflictStrategy, evaluate_policies_decision
+from engine.summary import DecisionSummary
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+# Compiled once per worker process by _init_worker.
+_WORKER_INDEX: Optional[PolicyIndex] = None
+
+
+def _init_worker(policies: list[Any]) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = PolicyIndex(policies)
+
+
+def _evaluate_chunk(
+    contexts: list[dict[str, Any]],
+    strategy: ConflictStrategy,
+    trace: bool,
+    return_exceptions: bool,
+) -> list[Any]:
+    assert _WORKER_INDEX is not None
+    if not return_exceptions:
+        return evaluate_batch(_WORKER_INDEX, contexts, strategy=strategy, trace=trace)
+
+    results: list[Any] = []
+    for context in contexts:
+        try:
+            results.append(
+                evaluate_policies_decision(
+                    _WORKER_INDEX, context, strategy=strategy, trace=trace
+                )
+            )
+        except PolicyEvaluationError as e:
+            results.append(e)
+    return results
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def evaluate_parallel(
+    policies: Iterable[Any] | PolicyIndex,
+    contexts: Iterable[dict[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 512,
+    strategy: ConflictStrategy = "deny_overrides",
+    trace: bool = False,
+    return_exceptions: bool = False,
+) -> Iterator[Decision | DecisionSummary | PolicyEvaluationError]:
+    """Evaluate contexts across a process pool, yielding results in input order.
+
+    Each worker indexes the compiled policy set once at start-up; contexts are sent in
+    chunks and at most ``2 * workers`` chunks are in flight, so memory stays
+    bounded for arbitrarily long inputs. With ``return_exceptions=True``,
+    contexts that fail evaluation yield their ``PolicyEvaluationError`` instead
+    of stopping the run.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    # Workers receive compiled plans only, so they never unpickle (or keep)
+    # the Pydantic models; shared conditions stay shared through the pickle.
+    plans = list(
+        policies.policies
+        if isinstance(policies, PolicyIndex)
+        else map(compile_policy, policies)
+    )
+
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plans,)
+    ) as pool:
+        try:
+            for chunk in _chunks(contexts, chunk_size):
+                pending.append(
+                    pool.submit(
+                        _evaluate_chunk, chunk, strategy, trace, return_exceptions
+                    )
+                )
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
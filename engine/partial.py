@@ -0,0 +1,337 @@
+"""Partial evaluation: reduce a policy set to residual predicates over ``resource.*``.
+
+``partial_evaluate`` takes a context without its ``resource`` part (the user,
+environment, request, ...), decides every condition on those known fields
+once, and keeps only the conditions on ``resource.*`` fields. The result
+holds one ``Residual`` per resource type in the request's environment, so a
+listing page can filter resources with the residuals, in memory or pushed
+down to a datastore via ``to_expression``, instead of running one full
+evaluation per resource.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+from engine.compiler import CompiledConditions, CompiledPolicy, build_conditions
+from engine.errors import ContextValidationError, PolicyEvaluationError
+from engine.evaluator import (
+    ResolutionTable,
+    conditions_pass,
+    resolve_cached,
+    resolve_parts,
+)
+from engine.policy_index import Fields, PolicyIndex
+from engine.policy_set import ConflictStrategy, combine_outcomes
+from engine.summary import DecisionSummary
+
+RESOURCE = "resource"
+
+# ``True`` / ``False``, a condition ``{"field", "operator", "value"}``, or a
+# combination ``{"all": [...]}`` / ``{"any": [...]}``.
+Expression = Union[bool, dict[str, Any]]
+
+
+def _all(parts: Iterable[Expression]) -> Expression:
+    kept = []
+    for part in parts:
+        if part is False:
+            return False
+        if part is not True:
+            kept.append(part)
+    if not kept:
+        return True
+    return kept[0] if len(kept) == 1 else {"all": kept}
+
+
+def _any(parts: Iterable[Expression]) -> Expression:
+    kept = []
+    for part in parts:
+        if part is True:
+            return True
+        if part is not False:
+            kept.append(part)
+    if not kept:
+        return False
+    return kept[0] if len(kept) == 1 else {"any": kept}
+
+
+class ResidualPolicy:
+    __slots__ = ("plan", "constant", "conditions", "fields")
+
+    def __init__(
+        self,
+        plan: CompiledPolicy,
+        constant: Optional[bool],
+        conditions: Optional[CompiledConditions],
+    ) -> None:
+        self.plan = plan
+        # Whether the conditions pass, when the known fields already decide it.
+        self.constant = constant
+        # The undecided resource conditions otherwise.
+        self.conditions = conditions
+        # Every resource field the policy reads; full evaluation resolves (and
+        # may fail on) these even when the known fields decide the policy.
+        self.fields = tuple(
+            (field, parts)
+            for field, parts in plan.conditions.fields
+            if parts[0] == RESOURCE
+        )
+
+    def passes(self, context: dict[str, Any]) -> bool:
+        for field, parts in self.fields:
+            resolve_parts(parts, field, context)
+        if self.conditions is None:
+            assert self.constant is not None
+            return self.constant
+        return conditions_pass(self.conditions, context)
+
+    def allows(self) -> Expression:
+        """Expression for "this policy yields ALLOW"."""
+        if self.plan.effect != "ALLOW":
+            return False
+        if self.conditions is None:
+            assert self.constant is not None
+            return self.constant
+        leaves = [
+            {"field": c.field, "operator": c.operator, "value": c.value}
+            for c in self.conditions.items
+        ]
+        return _all(leaves) if self.conditions.mode_all else _any(leaves)
+
+
+def _reduce(
+    plan: CompiledPolicy, context: dict[str, Any], table: ResolutionTable
+) -> ResidualPolicy:
+    conditions = plan.conditions
+    values = {
+        field: resolve_cached(parts, field, context, table)
+        for field, parts in conditions.fields
+        if parts[0] != RESOURCE
+    }
+    mode_all = conditions.mode_all
+    pending = []
+    for condition in conditions.items:
+        if condition.field not in values:
+            pending.append((condition.field, condition.operator, condition.value))
+        elif bool(condition.fn(values[condition.field], condition.value)) != mode_all:
+            return ResidualPolicy(plan, not mode_all, None)
+    if not pending:
+        return ResidualPolicy(plan, mode_all, None)
+    return ResidualPolicy(plan, None, build_conditions(mode_all, pending))
+
+
+class Residual:
+    """What is left of one target bucket once the known fields are applied.
+
+    When a known field the bucket reads is missing, ``error`` holds the error
+    full evaluation raises for this resource type, after resolving the
+    resource fields in ``preceding`` (the ones the bucket reads first).
+    """
+
+    __slots__ = ("resource_type", "strategy", "policies", "plans", "error", "preceding")
+
+    def __init__(
+        self,
+        resource_type: str,
+        strategy: ConflictStrategy,
+        policies: tuple[ResidualPolicy, ...],
+        error: Optional[ContextValidationError] = None,
+        preceding: Fields = (),
+    ) -> None:
+        self.resource_type = resource_type
+        self.strategy = strategy
+        self.policies = policies
+        self.plans = tuple(p.plan for p in policies)
+        self.error = error
+        self.preceding = preceding
+
+    def _raise(self) -> None:
+        assert self.error is not None
+        raise type(self.error)(*self.error.args)
+
+    def evaluate(self, resource: dict[str, Any]) -> DecisionSummary:
+        """Same result as full evaluation with this ``resource`` in the context."""
+        context = {RESOURCE: resource}
+        if self.error is not None:
+            for field, parts in self.preceding:
+                resolve_parts(parts, field, context)
+            self._raise()
+        passed = [policy.passes(context) for policy in self.policies]
+        return combine_outcomes(self.plans, passed, self.strategy)
+
+    def mask(self, table: Mapping[str, Sequence[Any]]) -> list[bool]:
+        """Whether each row of a column table (``resource.*`` path -> values) is allowed.
+
+        Conditions are applied a column at a time. A row whose value is absent
+        (``None`` or no column) for a field its residual needs is not allowed.
+        """
+        if self.error is not None:
+            self._raise()
+        sizes = {len(column) for column in table.values()}
+        if len(sizes) > 1:
+            raise ValueError("all table columns must have the same length")
+        size = sizes.pop() if sizes else 0
+        missing = [False] * size
+        passed: list[list[bool]] = []
+        for policy in self.policies:
+            for field, _ in policy.fields:
+                column = table.get(field)
+                if column is None:
+                    missing = [True] * size
+                else:
+                    missing = [m or v is None for m, v in zip(missing, column)]
+            if policy.conditions is None:
+                assert policy.constant is not None
+                passed.append([policy.constant] * size)
+                continue
+            conditions = policy.conditions
+            column_passed = [conditions.mode_all] * size
+            for condition in conditions.items:
+                column = table.get(condition.field)
+                if column is None:
+                    column = [None] * size
+                fn, expected = condition.fn, condition.value
+                if conditions.mode_all:
+                    column_passed = [
+                        p and v is not None and bool(fn(v, expected))
+                        for p, v in zip(column_passed, column)
+                    ]
+                else:
+                    column_passed = [
+                        p or (v is not None and bool(fn(v, expected)))
+                        for p, v in zip(column_passed, column)
+                    ]
+            passed.append(column_passed)
+        plans = self.plans
+        allowed = []
+        for row in range(size):
+            if missing[row]:
+                allowed.append(False)
+                continue
+            result = combine_outcomes(plans, [p[row] for p in passed], self.strategy)
+            allowed.append(result.decision == "ALLOW")
+        return allowed
+
+    def to_expression(self) -> Expression:
+        """Boolean filter over ``resource.*`` fields selecting allowed resources."""
+        if self.error is not None:
+            self._raise()
+        allows = [policy.allows() for policy in self.policies]
+        if self.strategy == "deny_overrides":
+            return _all(allows)
+        if self.strategy == "permit_overrides":
+            return _any(allows)
+        if self.strategy == "only_one_applicable" and len(allows) > 1:
+            raise PolicyEvaluationError(
+                f"only_one_applicable: {len(allows)} policies apply to "
+                f"resource type '{self.resource_type}'"
+            )
+        if self.strategy in ("first_applicable", "only_one_applicable"):
+            return allows[0]
+        raise ValueError(f"unsupported strategy '{self.strategy}'")
+
+
+def _residual(
+    resource_type: str,
+    strategy: ConflictStrategy,
+    bucket: tuple[CompiledPolicy, ...],
+    fields: Fields,
+    context: dict[str, Any],
+    table: ResolutionTable,
+) -> Residual:
+    # Full evaluation resolves the bucket's fields in this order before any
+    # condition, so the first missing one decides the error.
+    preceding = []
+    for field, parts in fields:
+        if parts[0] == RESOURCE:
+            preceding.append((field, parts))
+            continue
+        try:
+            resolve_cached(parts, field, context, table)
+        except ContextValidationError as e:
+            return Residual(resource_type, strategy, (), e, tuple(preceding))
+    return Residual(
+        resource_type,
+        strategy,
+        tuple(_reduce(plan, context, table) for plan in bucket),
+    )
+
+
+class PartialEvaluation:
+    """Residuals for every resource type in one environment."""
+
+    __slots__ = ("environment", "residuals")
+
+    def __init__(self, environment: str, residuals: dict[str, Residual]) -> None:
+        self.environment = environment
+        self.residuals = residuals
+
+    def residual(self, resource_type: str) -> Optional[Residual]:
+        return self.residuals.get(resource_type)
+
+    def evaluate(self, resource: dict[str, Any]) -> DecisionSummary:
+        if not isinstance(resource, dict):
+            raise ContextValidationError("context.resource is required")
+        resource_type = resource.get("type")
+        if resource_type is None:
+            raise ContextValidationError("context.resource.type is required")
+        try:
+            residual = self.residuals.get(resource_type)
+        except TypeError:
+            residual = None
+        if residual is None:
+            return DecisionSummary("NOT_APPLICABLE", None, "no applicable policies")
+        return residual.evaluate(resource)
+
+    def filter(self, resources: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """The resources the request's subject is allowed to access."""
+        return [r for r in resources if self.evaluate(r).decision == "ALLOW"]
+
+    def to_expression(self) -> Expression:
+        return _any(
+            _all(
+                [
+                    {"field": "resource.type", "operator": "equals", "value": t},
+                    residual.to_expression(),
+                ]
+            )
+            for t, residual in self.residuals.items()
+        )
+
+
+def partial_evaluate(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
+    *,
+    strategy: ConflictStrategy = "deny_overrides",
+) -> PartialEvaluation:
+    """Decide everything ``context`` already determines; keep the ``resource.*`` rest.
+
+    ``context`` is a request context without ``resource`` (any ``resource``
+    key is ignored). A missing non-resource field only fails the resource
+    types whose policies read it: their residuals raise the missing-field
+    error from ``evaluate``, ``mask`` and ``to_expression``. For validated
+    policies, ``evaluate`` agrees with full evaluation of ``context`` plus
+    the resource, errors included.
+    """
+    index = policies if isinstance(policies, PolicyIndex) else PolicyIndex(policies)
+    if not isinstance(context, dict):
+        raise ContextValidationError("context must be an object")
+    environment = context.get("environment")
+    if not isinstance(environment, dict):
+        raise ContextValidationError("context.environment is required")
+    env = environment.get("env")
+    if env is None:
+        raise ContextValidationError("context.environment.env is required")
+
+    table: ResolutionTable = {}
+    residuals = {}
+    for key in index.targets:
+        if key.environment != env:
+            continue
+        bucket = index.bucket(key)
+        residuals[key.resource_type] = _residual(
+            key.resource_type, strategy, bucket, index.fields(bucket), context, table
+        )
+    return PartialEvaluation(env, residuals)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional
+
+from engine.compiler import CompiledPolicy, _Unsupported, compile_policy
+from engine.dispatch import BucketDispatch, build_dispatch
+from engine.target_matcher import TargetKey, context_target_key
+
+Fields = tuple[tuple[str, tuple[str, ...]], ...]
+
+
+def bucket_fields(bucket: tuple[CompiledPolicy, ...]) -> Fields:
+    """Distinct condition fields read by a bucket, in evaluation order."""
+    seen: set[str] = set()
+    fields: list[tuple[str, tuple[str, ...]]] = []
+    for plan in bucket:
+        for field, parts in plan.conditions.fields:
+            if field not in seen:
+                seen.add(field)
+                fields.append((field, parts))
+    return tuple(fields)
+
+
+class PolicyIndex:
+    """Compiled policies bucketed by target, built once and reused across requests.
+
+    Evaluation only visits the bucket whose ``(resource_type, environment)``
+    matches the request, in the same relative order as the input policies.
+    """
+
+    def __init__(self, policies: Iterable[Any]) -> None:
+        self._policies = tuple(compile_policy(policy) for policy in policies)
+        buckets: dict[TargetKey, list[CompiledPolicy]] = {}
+        for policy in self._policies:
+            buckets.setdefault(policy.target, []).append(policy)
+        self._buckets = {key: tuple(bucket) for key, bucket in buckets.items()}
+        self._fields = {
+            id(bucket): bucket_fields(bucket) for bucket in self._buckets.values()
+        }
+        self._dispatch = {
+            id(bucket): build_dispatch(bucket) for bucket in self._buckets.values()
+        }
+        self._unsupported = {
+            id(bucket)
+            for bucket in self._buckets.values()
+            if any(
+                isinstance(condition.fn, _Unsupported)
+                for plan in bucket
+                for condition in plan.conditions.items
+            )
+        }
+
+    def __len__(self) -> int:
+        return len(self._policies)
+
+    def __iter__(self) -> Iterator[CompiledPolicy]:
+        return iter(self._policies)
+
+    @property
+    def policies(self) -> tuple[CompiledPolicy, ...]:
+        return self._policies
+
+    @property
+    def targets(self) -> tuple[TargetKey, ...]:
+        return tuple(self._buckets)
+
+    def bucket(self, key: TargetKey) -> tuple[CompiledPolicy, ...]:
+        return self._buckets.get(key, ())
+
+    def fields(self, bucket: tuple[CompiledPolicy, ...]) -> Fields:
+        return self._fields.get(id(bucket), ())
+
+    def dispatch(self, bucket: tuple[CompiledPolicy, ...]) -> Optional[BucketDispatch]:
+        return self._dispatch.get(id(bucket))
+
+    def has_unsupported(self, bucket: tuple[CompiledPolicy, ...]) -> bool:
+        """Whether evaluating ``bucket`` may reach an unsupported operator."""
+        return id(bucket) in self._unsupported
+
+    def candidates(self, context: dict[str, Any]) -> tuple[CompiledPolicy, ...]:
+        if not self._policies:
+            return ()
+        key = context_target_key(context)
+        try:
+            return self._buckets.get(key, ())
+        except TypeError:
+            # Unhashable context values can never equal a string target.
+            return ()
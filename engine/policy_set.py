@@ -1,25 +1,321 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Literal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Literal,
+    Optional,
+    Sequence,
+    get_args,
+    overload,
+)
 
-from engine.decision import Decision, TraceEntry
-from engine.evaluator import evaluate_policy_decision
+from engine import instrumentation
+from engine.compiler import CompiledPolicy, _Unsupported, compile_policy
+from engine.dispatch import BucketDispatch
+from engine.errors import PolicyEvaluationError
+from engine.evaluator import (
+    ResolutionTable,
+    conditions_pass,
+    observed_conditions_pass,
+    resolve_parts,
+    trace_policy,
+)
+from engine.policy_index import PolicyIndex, bucket_fields
+from engine.summary import DecisionOutcome, DecisionSummary
+from engine.target_matcher import context_target_key
 
-ConflictStrategy = Literal["deny_overrides"]
+if TYPE_CHECKING:
+    from engine.decision import Decision
 
+ConflictStrategy = Literal[
+    "deny_overrides", "permit_overrides", "first_applicable", "only_one_applicable"
+]
+STRATEGIES: tuple[str, ...] = get_args(ConflictStrategy)
 
+Winner = tuple[Optional[int], DecisionOutcome, str]
+
+_NOT_APPLICABLE: Winner = (None, "NOT_APPLICABLE", "no applicable policies")
+
+
+def _candidates(
+    policies: Iterable[Any] | PolicyIndex, context: dict[str, Any]
+) -> tuple[CompiledPolicy, ...]:
+    if isinstance(policies, PolicyIndex):
+        return policies.candidates(context)
+    plans = [compile_policy(policy) for policy in policies]
+    if not plans:
+        return ()
+    key = context_target_key(context)
+    return tuple(plan for plan in plans if plan.target == key)
+
+
+def _check_only_one(candidates: Sequence[Any]) -> None:
+    if len(candidates) > 1:
+        raise PolicyEvaluationError(
+            f"only_one_applicable: {len(candidates)} policies apply to the request"
+        )
+
+
+def _winner(
+    candidates: Sequence[CompiledPolicy],
+    passed: Sequence[bool],
+    strategy: ConflictStrategy,
+) -> Winner:
+    """Position of the deciding candidate, the decision and its reason.
+
+    A candidate allows only when its effect is ALLOW and its conditions pass;
+    every other candidate denies. ``passed`` may stop early once it contains
+    the deciding candidate.
+    """
+    if not candidates:
+        return _NOT_APPLICABLE
+
+    if strategy == "deny_overrides":
+        for position, (plan, ok) in enumerate(zip(candidates, passed)):
+            if not ok or plan.effect != "ALLOW":
+                return position, "DENY", "deny overrides"
+        if passed:
+            return 0, "ALLOW", "allow (no denies matched)"
+        return _NOT_APPLICABLE
+
+    if strategy == "permit_overrides":
+        for position, (plan, ok) in enumerate(zip(candidates, passed)):
+            if ok and plan.effect == "ALLOW":
+                return position, "ALLOW", "permit overrides"
+        return 0, "DENY", "deny (no permits matched)"
+
+    if strategy in ("first_applicable", "only_one_applicable"):
+        if strategy == "only_one_applicable":
+            _check_only_one(candidates)
+        allowed = passed[0] and candidates[0].effect == "ALLOW"
+        return 0, "ALLOW" if allowed else "DENY", strategy.replace("_", " ")
+
+    raise ValueError(f"unsupported strategy '{strategy}'")
+
+
+def combine_outcomes(
+    candidates: Sequence[CompiledPolicy],
+    passed: Sequence[bool],
+    strategy: ConflictStrategy,
+) -> DecisionSummary:
+    position, decision, reason = _winner(candidates, passed, strategy)
+    policy_id = None if position is None else candidates[position].policy_id
+    return DecisionSummary(decision, policy_id, reason)
+
+
+def _short_circuit(
+    candidates: Sequence[CompiledPolicy],
+    context: dict[str, Any],
+    table: ResolutionTable,
+    strategy: ConflictStrategy,
+) -> DecisionSummary:
+    """Evaluate only the candidates that can still change the outcome.
+
+    The caller has already resolved every candidate field into ``table``, so
+    skipping policies cannot hide a missing-field error. A DENY-effect policy
+    denies without evaluating its conditions, which bounds the scan:
+
+    - ``deny_overrides`` stops at the first DENY-effect policy and evaluates
+      only the ALLOW policies before it, until one fails;
+    - ``permit_overrides`` evaluates only ALLOW policies, until one passes;
+    - ``first_applicable`` / ``only_one_applicable`` evaluate the first.
+    """
+    if strategy == "deny_overrides":
+        stop = next(
+            (i for i, plan in enumerate(candidates) if plan.effect != "ALLOW"),
+            len(candidates),
+        )
+        passed = []
+        for plan in candidates[:stop]:
+            ok = conditions_pass(plan.conditions, context, table)
+            passed.append(ok)
+            if not ok:
+                break
+        else:
+            if stop < len(candidates):
+                # The DENY-effect policy decides whatever its conditions say.
+                passed.append(True)
+    elif strategy == "permit_overrides":
+        passed = []
+        for plan in candidates:
+            passed.append(
+                plan.effect == "ALLOW"
+                and conditions_pass(plan.conditions, context, table)
+            )
+            if passed[-1]:
+                break
+    else:
+        if strategy == "only_one_applicable":
+            _check_only_one(candidates)
+        first = candidates[0]
+        passed = [
+            first.effect != "ALLOW" or conditions_pass(first.conditions, context, table)
+        ]
+    return combine_outcomes(candidates, passed, strategy)
+
+
+def _summarize_policies(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
+    strategy: ConflictStrategy,
+) -> DecisionSummary:
+    if instrumentation.ENABLED:
+        return _observe_policies(policies, context, strategy)
+    if isinstance(policies, PolicyIndex) and strategy == "deny_overrides":
+        bucket = policies.candidates(context)
+        dispatch = policies.dispatch(bucket)
+        if dispatch is not None:
+            return _summarize_dispatched(policies, bucket, dispatch, context)
+    candidates = _candidates(policies, context)
+    # Each distinct field is resolved at most once per request, in the order
+    # sequential evaluation would first need it, so errors are unchanged.
+    table: ResolutionTable = {}
+    if candidates and strategy in STRATEGIES:
+        if isinstance(policies, PolicyIndex):
+            fields = policies.fields(candidates)
+            unsupported = policies.has_unsupported(candidates)
+        else:
+            fields = bucket_fields(candidates)
+            unsupported = any(
+                isinstance(condition.fn, _Unsupported)
+                for plan in candidates
+                for condition in plan.conditions.items
+            )
+        # An unsupported operator raises when reached, so its error can only
+        # be reproduced by the full in-order scan below.
+        if not unsupported:
+            for field, parts in fields:
+                table[field] = resolve_parts(parts, field, context)
+            return _short_circuit(candidates, context, table, strategy)
+    passed = [conditions_pass(plan.conditions, context, table) for plan in candidates]
+    return combine_outcomes(candidates, passed, strategy)
+
+
+def _summarize_dispatched(
+    index: PolicyIndex,
+    bucket: tuple[CompiledPolicy, ...],
+    dispatch: BucketDispatch,
+    context: dict[str, Any],
+) -> DecisionSummary:
+    # Same outcome as combine_outcomes under deny_overrides: the first policy
+    # that fails or has a DENY effect wins. Every bucket field is resolved
+    # first so missing fields raise exactly as in sequential evaluation; the
+    # merged equals gates then bound how far the in-order scan has to go.
+    table: ResolutionTable = {
+        field: resolve_parts(parts, field, context)
+        for field, parts in index.fields(bucket)
+    }
+    stop = dispatch.first_deny
+    for gate in dispatch.gates:
+        miss = gate.first_miss(table[gate.field])
+        if miss is not None and miss < stop:
+            stop = miss
+    for position in range(stop):
+        plan = bucket[position]
+        if not conditions_pass(plan.conditions, context, table):
+            return DecisionSummary("DENY", plan.policy_id, "deny overrides")
+    if stop < len(bucket):
+        return DecisionSummary("DENY", bucket[stop].policy_id, "deny overrides")
+    return DecisionSummary("ALLOW", bucket[0].policy_id, "allow (no denies matched)")
+
+
+def _observe_policies(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
+    strategy: ConflictStrategy,
+) -> DecisionSummary:
+    candidates: Sequence[CompiledPolicy]
+    if isinstance(policies, PolicyIndex):
+        candidates = policies.candidates(context)
+    else:
+        matched: list[CompiledPolicy] = []
+        plans = [compile_policy(policy) for policy in policies]
+        key = context_target_key(context) if plans else None
+        for plan in plans:
+            if plan.target == key:
+                matched.append(plan)
+            else:
+                instrumentation.counters(plan).evaluations += 1
+        candidates = matched
+    table: ResolutionTable = {}
+    passed = [observed_conditions_pass(plan, context, table) for plan in candidates]
+    return combine_outcomes(candidates, passed, strategy)
+
+
+@overload
+def evaluate_policies_decision(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
+    *,
+    strategy: ConflictStrategy = ...,
+    trace: Literal[True] = ...,
+) -> Decision: ...
+
+
+@overload
+def evaluate_policies_decision(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
+    *,
+    strategy: ConflictStrategy = ...,
+    trace: Literal[False],
+) -> DecisionSummary: ...
+
+
+@overload
 def evaluate_policies_decision(
-    policies: Iterable[Any],
+    policies: Iterable[Any] | PolicyIndex,
     context: dict[str, Any],
     *,
+    strategy: ConflictStrategy = ...,
+    trace: bool,
+) -> Decision | DecisionSummary: ...
+
+
+def evaluate_policies_decision(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
+    *,
+    strategy: ConflictStrategy = "deny_overrides",
+    trace: bool = True,
+) -> Decision | DecisionSummary:
+    """Combine the decisions of ``policies`` for ``context`` under ``strategy``.
+
+    With a ``PolicyIndex`` only the request's target bucket is visited: the
+    decision, ``policy_id`` and reason match a linear scan of the same
+    policies, but the trace omits the NOT_APPLICABLE entries a linear scan
+    records for policies whose target does not match.
+    """
+    if not trace:
+        return _summarize_policies(policies, context, strategy)
+    return trace_policies(policies, context, strategy)
+
+
+def trace_policies(
+    policies: Iterable[Any] | PolicyIndex,
+    context: dict[str, Any],
     strategy: ConflictStrategy = "deny_overrides",
+    *,
+    observe: bool = True,
 ) -> Decision:
-    policies_list = list(policies)
+    """The traced ``evaluate_policies_decision``; ``observe=False`` skips counters."""
+    from engine.decision import Decision, TraceEntry
+
+    if isinstance(policies, PolicyIndex):
+        # Policies outside the request's target bucket are skipped entirely,
+        # so they do not appear in the trace.
+        policies_list = list(policies.candidates(context))
+    else:
+        policies_list = list(policies)
     traces: list[TraceEntry] = []
 
-    matched: list[Decision] = []
+    matched: list[tuple[CompiledPolicy, Decision]] = []
+    table: ResolutionTable = {}
     for policy in policies_list:
-        d = evaluate_policy_decision(policy, context)
+        plan = compile_policy(policy)
+        d = trace_policy(plan, context, table, observe=observe)
         traces.append(
             TraceEntry(
                 kind="policy",
@@ -29,40 +325,19 @@ def evaluate_policies_decision(
             )
         )
         if d.decision != "NOT_APPLICABLE":
-            matched.append(d)
-
-    if not matched:
-        return Decision(
-            decision="NOT_APPLICABLE",
-            policy_id=None,
-            trace=traces,
-            reason="no applicable policies",
-        )
-
-    if strategy != "deny_overrides":
-        raise ValueError(f"unsupported strategy '{strategy}'")
-
-    deny = next((d for d in matched if d.decision == "DENY"), None)
-    if deny is not None:
-        return Decision(
-            decision="DENY",
-            policy_id=deny.policy_id,
-            trace=traces + deny.trace,
-            reason="deny overrides",
-        )
-
-    allow = next((d for d in matched if d.decision == "ALLOW"), None)
-    if allow is not None:
-        return Decision(
-            decision="ALLOW",
-            policy_id=allow.policy_id,
-            trace=traces + allow.trace,
-            reason="allow (no denies matched)",
-        )
+            matched.append((plan, d))
 
+    position, decision, reason = _winner(
+        [plan for plan, _ in matched],
+        [d.decision == "ALLOW" for _, d in matched],
+        strategy,
+    )
+    if position is None:
+        return Decision(decision=decision, policy_id=None, trace=traces, reason=reason)
+    winner = matched[position][1]
     return Decision(
-        decision="NOT_APPLICABLE",
-        policy_id=None,
-        trace=traces,
-        reason="no applicable policies",
+        decision=decision,
+        policy_id=winner.policy_id,
+        trace=traces + winner.trace,
+        reason=reason,
     )
@@ -0,0 +1,155 @@
+"""Incremental re-evaluation of one evolving request context.
+
+A ``DecisionSession`` keeps the resolved field values and condition results
+of the last evaluation. ``update(delta)`` applies a JSON merge patch
+(RFC 7386: nested objects merge, ``null`` deletes) and re-evaluates only the
+conditions whose fields lie under a changed path; every other condition
+result is reused. Policies are still walked in order and fields checked
+before their conditions, so decisions and errors match a full
+``evaluate_policies_decision`` call on the session's ``PolicyIndex``.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from engine.compiler import CompiledPolicy
+from engine.errors import ContextValidationError
+from engine.evaluator import resolve_parts
+from engine.policy_index import PolicyIndex
+from engine.policy_set import (
+    ConflictStrategy,
+    combine_outcomes,
+    evaluate_policies_decision,
+)
+from engine.summary import DecisionSummary
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+Path = tuple[str, ...]
+
+_UNRESOLVED = object()
+_MISSING = object()
+
+
+def _merge(target: dict, delta: dict, prefix: Path, changed: list[Path]) -> None:
+    for key, value in delta.items():
+        path = prefix + (key,)
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _merge(current, value, path, changed)
+        elif value is None:
+            if key in target:
+                del target[key]
+                changed.append(path)
+        else:
+            target[key] = copy.deepcopy(value)
+            changed.append(path)
+
+
+def _overlaps(parts: Path, changed: list[Path]) -> bool:
+    return any(
+        parts[: len(path)] == path or path[: len(parts)] == parts for path in changed
+    )
+
+
+class DecisionSession:
+    """Re-authorizes a context that changes a little at a time.
+
+    Decision-only results are computed incrementally; ``trace=True`` falls
+    back to a full traced evaluation of the current context.
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[Any] | PolicyIndex,
+        context: dict[str, Any],
+        *,
+        strategy: ConflictStrategy = "deny_overrides",
+    ) -> None:
+        self.index = (
+            policies if isinstance(policies, PolicyIndex) else PolicyIndex(policies)
+        )
+        self.strategy = strategy
+        self._context = copy.deepcopy(context)
+        self._bucket: Optional[tuple[CompiledPolicy, ...]] = None
+        # field -> [(policy position, condition position), ...] for the bucket.
+        self._dependents: dict[str, list[tuple[int, int]]] = {}
+        self._parts: dict[str, tuple[str, ...]] = {}
+        self._values: dict[str, Any] = {}
+        self._results: dict[tuple[int, int], bool] = {}
+        self.evaluated = 0
+        self.reused = 0
+
+    @property
+    def context(self) -> dict[str, Any]:
+        """The session's current context (treat as read-only)."""
+        return self._context
+
+    def _enter(self, bucket: tuple[CompiledPolicy, ...]) -> None:
+        self._bucket = bucket
+        self._values.clear()
+        self._results.clear()
+        self._dependents = {}
+        self._parts = {}
+        for i, plan in enumerate(bucket):
+            self._parts.update(plan.conditions.fields)
+            for j, condition in enumerate(plan.conditions.items):
+                self._dependents.setdefault(condition.field, []).append((i, j))
+
+    def _passed(self, position: int, plan: CompiledPolicy) -> bool:
+        conditions = plan.conditions
+        values = []
+        for field, parts in conditions.fields:
+            value = self._values.get(field, _UNRESOLVED)
+            if value is _UNRESOLVED:
+                try:
+                    value = resolve_parts(parts, field, self._context)
+                except ContextValidationError:
+                    value = _MISSING
+                self._values[field] = value
+            if value is _MISSING:
+                raise ContextValidationError(f"missing field '{field}'")
+            values.append(value)
+
+        mode_all = conditions.mode_all
+        for j, condition in enumerate(conditions.items):
+            result = self._results.get((position, j))
+            if result is None:
+                result = bool(condition.fn(values[condition.slot], condition.value))
+                self._results[position, j] = result
+                self.evaluated += 1
+            else:
+                self.reused += 1
+            if result != mode_all:
+                return result
+        return mode_all
+
+    def evaluate(self, *, trace: bool = False) -> Decision | DecisionSummary:
+        if trace:
+            return evaluate_policies_decision(
+                self.index, self._context, strategy=self.strategy, trace=True
+            )
+        bucket = self.index.candidates(self._context)
+        if bucket is not self._bucket:
+            self._enter(bucket)
+        passed = [self._passed(i, plan) for i, plan in enumerate(bucket)]
+        return combine_outcomes(bucket, passed, self.strategy)
+
+    def update(
+        self, delta: dict[str, Any], *, trace: bool = False
+    ) -> Decision | DecisionSummary:
+        """Merge ``delta`` into the context and re-evaluate what it affects."""
+        if not isinstance(delta, dict):
+            raise ContextValidationError("context delta must be an object")
+        changed: list[Path] = []
+        _merge(self._context, delta, (), changed)
+        if changed:
+            for field in list(self._values):
+                if _overlaps(self._parts[field], changed):
+                    del self._values[field]
+                    for key in self._dependents.get(field, ()):
+                        self._results.pop(key, None)
+        return self.evaluate(trace=trace)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+from validation.loader import POLICY_SUFFIXES, load_policy_file
+from validation.policy_validator import PolicyValidationError
+
+from engine.compiler import CompiledPolicy, compile_policy
+from engine.policy_index import PolicyIndex
+
+FileStamp = tuple[int, int]
+
+
+class PolicyStore:
+    """Hot-reloading policy set backed by a directory of policy files.
+
+    ``store.index`` always refers to a complete, validated ``PolicyIndex``.
+    ``refresh()`` re-parses only files whose size or mtime changed, builds a
+    new index off to the side and swaps it in with a single reference
+    assignment, so readers never block and never see a partial set. If any
+    changed file is invalid, the previous index stays live and the error is
+    kept in ``last_error``.
+    """
+
+    def __init__(self, directory: str | Path, *, poll_interval: float = 1.0) -> None:
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.version = 0
+        self.last_error: Optional[Exception] = None
+        self._files: dict[Path, tuple[FileStamp, CompiledPolicy]] = {}
+        self._index = PolicyIndex([])
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.refresh()
+        if self.last_error is not None:
+            raise self.last_error
+
+    @property
+    def index(self) -> PolicyIndex:
+        return self._index
+
+    def _scan(self) -> dict[Path, FileStamp]:
+        stamps: dict[Path, FileStamp] = {}
+        for path in sorted(self.directory.rglob("*")):
+            if path.suffix.lower() in POLICY_SUFFIXES and path.is_file():
+                stat = path.stat()
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def refresh(self) -> bool:
+        """Reload changed files; return True if a new index was swapped in."""
+        with self._refresh_lock:
+            try:
+                stamps = self._scan()
+            except OSError as e:
+                self.last_error = e
+                return False
+
+            files: dict[Path, tuple[FileStamp, CompiledPolicy]] = {}
+            for path, stamp in stamps.items():
+                previous = self._files.get(path)
+                if previous is not None and previous[0] == stamp:
+                    files[path] = previous
+                    continue
+                try:
+                    files[path] = (stamp, compile_policy(load_policy_file(path)))
+                except Exception as e:
+                    self.last_error = PolicyValidationError(f"{path}: {e}")
+                    return False
+
+            self.last_error = None
+            if files.keys() == self._files.keys() and all(
+                files[path][1] is self._files[path][1] for path in files
+            ):
+                return False
+
+            index = PolicyIndex(plan for _, plan in files.values())
+            self._files = files
+            self._index = index
+            self.version += 1
+            return True
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="policy-store-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> PolicyStore:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+DecisionOutcome = Literal["ALLOW", "DENY", "NOT_APPLICABLE"]
+
+
+class DecisionSummary:
+    """Trace-free decision result for the decision-only evaluation path."""
+
+    __slots__ = ("decision", "policy_id", "reason")
+
+    def __init__(
+        self,
+        decision: DecisionOutcome,
+        policy_id: Optional[str] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        self.decision = decision
+        self.policy_id = policy_id
+        self.reason = reason
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DecisionSummary):
+            return NotImplemented
+        return (
+            self.decision == other.decision
+            and self.policy_id == other.policy_id
+            and self.reason == other.reason
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DecisionSummary(decision={self.decision!r}, "
+            f"policy_id={self.policy_id!r}, reason={self.reason!r})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "decision": self.decision,
+            "policy_id": self.policy_id,
+            "reason": self.reason,
+        }
+
+    def to_decision(self) -> Decision:
+        from engine.decision import Decision
+
+        return Decision(
+            decision=self.decision, policy_id=self.policy_id, reason=self.reason
+        )
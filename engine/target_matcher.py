@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+from typing import NamedTuple
+
 from engine.errors import ContextValidationError
 
 
-def target_matches(target, context) -> bool:
+class TargetKey(NamedTuple):
+    resource_type: str
+    environment: str
+
+
+def target_key(target) -> TargetKey:
+    return TargetKey(target.resource_type, target.environment)
+
+
+def _context_target(context) -> tuple[str, str]:
+    if not isinstance(context, dict):
+        raise ContextValidationError("context must be an object")
     resource = context.get("resource")
     if not isinstance(resource, dict):
         raise ContextValidationError("context.resource is required")
@@ -18,6 +31,17 @@ def target_matches(target, context) -> bool:
     if env is None:
         raise ContextValidationError("context.environment.env is required")
 
+    return resource_type, env
+
+
+def context_target_key(context) -> TargetKey:
+    return TargetKey(*_context_target(context))
+
+
+def target_matches(target, context) -> bool:
+    # A plain tuple: building a TargetKey per call is measurable here.
+    resource_type, env = _context_target(context)
+
     if target.resource_type != resource_type:
         return False
 
@@ -0,0 +1,39 @@
+"""Helpers for comparing condition values across policies."""
+
+from __future__ import annotations
+
+from typing import Any, Hashable
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def value_key(value: Any) -> Hashable:
+    """Hashable key equal for structurally equal values of the same types.
+
+    Type-tagged so 1, 1.0 and True get different keys. Lists, tuples, dicts
+    and sets are keyed by content; dict items by ``repr`` of the key, so
+    mixed key types never need ordering. Other unhashable values fall back
+    to ``id``, which is only unique while the value is alive: keep a
+    reference to it for as long as the key is in use.
+    """
+    cls = type(value)
+    if cls in _SCALARS:
+        return (cls, value)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(value_key(v) for v in value))
+    if isinstance(value, dict):
+        items = sorted(
+            ((repr(k), value_key(v)) for k, v in value.items()), key=lambda i: i[0]
+        )
+        return (dict, tuple(items))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(value_key(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+    return (type(value), value)
@@ -0,0 +1,3 @@
+from server.pdp import PolicyDecisionPoint
+
+__all__ = ["PolicyDecisionPoint"]
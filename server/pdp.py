@@ -0,0 +1,209 @@
+"""Asyncio policy decision point (PDP) serving JSON evaluation requests.
+
+Two transports share one request format:
+
+- Unix socket: newline-delimited JSON, one response line per request line.
+  Requests may be pipelined; responses come back in request order.
+- Localhost HTTP/1.1: ``POST /evaluate`` with a JSON body, ``GET /health`` and
+  ``GET /metrics`` (Prometheus text, see ``engine.instrumentation``).
+  Connections are kept alive, so requests may be pipelined there too.
+
+A request is ``{"context": {...}}`` or ``{"contexts": [...]}`` with optional
+``"trace": true`` and an ``"id"`` that is echoed back. With an ``AuditLog``
+every successful decision is also queued for the audit log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from engine.audit import AuditLog
+from engine.store import PolicyStore
+
+from engine import (
+    DecisionSummary,
+    PolicyEvaluationError,
+    PolicyIndex,
+    evaluate_batch,
+    evaluate_policies_decision,
+    instrumentation,
+)
+
+if TYPE_CHECKING:
+    from engine.decision import Decision
+
+STREAM_LIMIT = 16 * 1024 * 1024
+
+_HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+def _record(result: Decision | DecisionSummary) -> dict[str, Any]:
+    if isinstance(result, DecisionSummary):
+        return result.to_dict()
+    return result.model_dump(mode="json")
+
+
+class PolicyDecisionPoint:
+    """Evaluates JSON requests against a policy set compiled once."""
+
+    def __init__(
+        self,
+        policies: Iterable[Any] | PolicyIndex | PolicyStore,
+        *,
+        audit: Optional[AuditLog] = None,
+    ) -> None:
+        self.audit = audit
+        self._store: Optional[PolicyStore] = None
+        if isinstance(policies, PolicyStore):
+            self._store = policies
+            self._index = policies.index
+        elif isinstance(policies, PolicyIndex):
+            self._index = policies
+        else:
+            self._index = PolicyIndex(policies)
+
+    @property
+    def index(self) -> PolicyIndex:
+        # With a PolicyStore, each request picks up the latest swapped-in set.
+        return self._store.index if self._store is not None else self._index
+
+    def _evaluate_one(
+        self, index: PolicyIndex, context: Any, trace: bool
+    ) -> dict[str, Any]:
+        try:
+            result = evaluate_policies_decision(index, context, trace=trace)
+        except PolicyEvaluationError as e:
+            return {"error": str(e)}
+        if self.audit is not None:
+            self.audit.record(result, index, context)
+        return _record(result)
+
+    def _evaluate_many(
+        self, index: PolicyIndex, contexts: list[Any], trace: bool
+    ) -> list[dict[str, Any]]:
+        try:
+            results = evaluate_batch(index, contexts, trace=trace)
+        except PolicyEvaluationError:
+            # Report errors per context instead of failing the whole batch.
+            return [self._evaluate_one(index, context, trace) for context in contexts]
+        if self.audit is not None:
+            for context, result in zip(contexts, results):
+                self.audit.record(result, index, context)
+        return [_record(result) for result in results]
+
+    def handle(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"error": "request must be a JSON object"}
+        trace = bool(request.get("trace", False))
+        index = self.index
+        if "contexts" in request:
+            contexts = request["contexts"]
+            if not isinstance(contexts, list):
+                response: dict[str, Any] = {"error": "'contexts' must be a list"}
+            else:
+                response = {"decisions": self._evaluate_many(index, contexts, trace)}
+        elif "context" in request:
+            response = self._evaluate_one(index, request["context"], trace)
+        else:
+            response = {"error": "request must contain 'context' or 'contexts'"}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def handle_json(self, payload: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(payload)
+        except ValueError as e:
+            return {"error": f"invalid JSON ({e})"}
+        return self.handle(request)
+
+    async def _serve_lines(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                response = self.handle_json(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method: str, path: str, body: bytes) -> tuple[int, dict | str]:
+        if path == "/metrics":
+            if method != "GET":
+                return 405, {"error": "method not allowed"}
+            return 200, instrumentation.to_prometheus()
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "method not allowed"}
+            return 200, {"status": "ok", "policies": len(self.index)}
+        if path == "/evaluate":
+            if method != "POST":
+                return 405, {"error": "method not allowed"}
+            response = self.handle_json(body)
+            return (400 if "error" in response else 200), response
+        return 404, {"error": "not found"}
+
+    async def _serve_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while request_line := await reader.readline():
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = self._route(method, path, body)
+                if isinstance(payload, str):
+                    content_type = "text/plain; version=0.0.4"
+                    data = payload.encode()
+                else:
+                    content_type = "application/json"
+                    data = json.dumps(payload).encode()
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                head = (
+                    f"{version} {status} {_HTTP_REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                writer.write(head.encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(
+            self._serve_lines, path=path, limit=STREAM_LIMIT
+        )
+
+    async def serve_http(
+        self, host: str = "127.0.0.1", port: int = 8181
+    ) -> asyncio.AbstractServer:
+        return await asyncio.start_server(
+            self._serve_http, host=host, port=port, limit=STREAM_LIMIT
+        )
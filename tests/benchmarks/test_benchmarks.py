@@ -0,0 +1,71 @@
+from benchmarks.generators import generate_contexts, generate_policies
+from benchmarks.runner import compare, measure, memory_stats, percentile
+from validation.policy_validator import validate_policy_semantics
+from validation.schema import Policy
+
+from engine import evaluate_batch
+
+
+def test_generated_policies_are_valid_and_deterministic():
+    policies = generate_policies(50, conditions=4, targets=6, seed=7)
+
+    assert policies == generate_policies(50, conditions=4, targets=6, seed=7)
+    assert len({p["policy_id"] for p in policies}) == 50
+    targets = {tuple(p["target"].values()) for p in policies}
+    assert len(targets) == 6
+    for data in policies:
+        validate_policy_semantics(Policy(**data))
+
+
+def test_generated_operator_mix_is_respected():
+    policies = generate_policies(20, operators={"in": 1.0}, seed=1)
+
+    operators = {
+        c["operator"]
+        for p in policies
+        for group in p["conditions"].values()
+        for c in group
+    }
+    assert operators == {"in"}
+
+
+def test_generated_contexts_evaluate_without_errors():
+    policies = [Policy(**p) for p in generate_policies(30, targets=4)]
+    contexts = generate_contexts(200, targets=4)
+
+    results = evaluate_batch(policies, contexts, trace=False)
+
+    assert len(results) == 200
+    assert {r.decision for r in results} <= {"ALLOW", "DENY"}
+
+
+def test_measure_reports_percentiles_and_throughput():
+    stats = measure(lambda: None, iterations=50, ops=10)
+
+    assert stats["iterations"] == 50
+    assert stats["p50_us"] <= stats["p90_us"] <= stats["p99_us"] <= stats["max_us"]
+    assert stats["throughput_ops"] > 0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {"results": {"a": {"p50_us": 10.0}, "b": {"p50_us": 10.0}}}
+    current = {
+        "results": {
+            "a": {"p50_us": 12.0},
+            "b": {"p50_us": 20.0},
+            "new": {"p50_us": 1.0},
+        }
+    }
+
+    regressions = compare(baseline, current, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b: p50_us 10.00 -> 20.00")
+
+
+def test_memory_stats_reports_bytes_per_policy():
+    stats = memory_stats(200)
+
+    assert stats["policies"] == 200
+    assert 0 < stats["compiled_bytes_per_policy"] < stats["model_bytes_per_policy"]
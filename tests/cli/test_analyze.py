@@ -0,0 +1,79 @@
+import json
+import sys
+
+from cli.main import main
+from engine.bundle import load_bundle
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["ace", *argv])
+    return main()
+
+
+def _write_policies(directory):
+    deny = valid_policy()
+    deny["policy_id"] = "a.deny"
+    deny["effect"] = "DENY"
+    shadowed = valid_policy()
+    shadowed["policy_id"] = "b.shadowed"
+    for data in (deny, shadowed):
+        path = directory / f"{data['policy_id']}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_analyze_reports_findings(tmp_path, monkeypatch, capsys):
+    _write_policies(tmp_path)
+
+    rc = _run(monkeypatch, "analyze", str(tmp_path))
+
+    out = capsys.readouterr().out
+    assert rc == 0
+    assert "shadowed" in out and "b.shadowed" in out and "[removable]" in out
+    assert out.strip().endswith(
+        "2 policies, 1 finding(s), 1 removable (deny_overrides)"
+    )
+
+
+def test_analyze_json(tmp_path, monkeypatch, capsys):
+    _write_policies(tmp_path)
+
+    rc = _run(monkeypatch, "analyze", str(tmp_path), "--json")
+
+    report = json.loads(capsys.readouterr().out)
+    assert rc == 0
+    assert report["removable"] == 1
+    assert report["findings"][0]["kind"] == "shadowed"
+
+
+def test_bundle_optimize_drops_removable_policies(tmp_path, monkeypatch):
+    _write_policies(tmp_path)
+    output = tmp_path / "policies.aceb"
+
+    rc = _run(monkeypatch, "bundle", str(tmp_path), "-o", str(output), "--optimize")
+
+    assert rc == 0
+    assert [plan.policy_id for plan in load_bundle(output)] == ["a.deny"]
+
+
+def test_optimized_bundle_refuses_other_strategies(tmp_path, monkeypatch, capsys):
+    _write_policies(tmp_path)
+    output = tmp_path / "policies.aceb"
+    requests = tmp_path / "requests.jsonl"
+    requests.write_text(json.dumps(base_context()) + "\n", encoding="utf-8")
+    _run(monkeypatch, "bundle", str(tmp_path), "-o", str(output), "--optimize")
+    capsys.readouterr()
+
+    rc = _run(
+        monkeypatch,
+        "evaluate-stream",
+        str(output),
+        "-i",
+        str(requests),
+        "-s",
+        "permit_overrides",
+    )
+
+    assert rc == 1
+    assert "optimized for deny_overrides" in capsys.readouterr().err
@@ -0,0 +1,119 @@
+import json
+import sys
+from pathlib import Path
+
+from cli.main import main
+from tests.fixtures.context import base_context
+
+POLICY = str(Path(__file__).resolve().parents[2] / "examples" / "policy.yaml")
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["ace", *argv])
+    return main()
+
+
+def test_evaluate_stream_writes_one_decision_per_line(tmp_path, monkeypatch):
+    viewer = base_context()
+    viewer["user"]["role"] = "viewer"
+    source = tmp_path / "requests.jsonl"
+    source.write_text(
+        "\n".join(json.dumps(c) for c in [base_context(), viewer]) + "\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "decisions.jsonl"
+
+    rc = _run(
+        monkeypatch, "evaluate-stream", POLICY, "-i", str(source), "-o", str(output)
+    )
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert rc == 0
+    assert [r["decision"] for r in records] == ["ALLOW", "DENY"]
+    assert "trace" not in records[0]
+
+
+def test_evaluate_stream_reports_invalid_contexts_and_continues(
+    tmp_path, monkeypatch, capsys
+):
+    missing = base_context()
+    del missing["user"]["role"]
+    source = tmp_path / "requests.jsonl"
+    source.write_text(
+        "\n".join(json.dumps(c) for c in [missing, base_context()]), encoding="utf-8"
+    )
+
+    rc = _run(monkeypatch, "evaluate-stream", POLICY, "-i", str(source), "--trace")
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert rc == 1
+    assert records[0] == {"error": "missing field 'user.role'"}
+    assert records[1]["decision"] == "ALLOW"
+    assert records[1]["trace"]
+
+
+def test_evaluate_stream_parallel_matches_serial(tmp_path, monkeypatch, capsys):
+    contexts = []
+    for i in range(10):
+        context = base_context()
+        context["user"]["role"] = "admin" if i % 2 else "viewer"
+        contexts.append(context)
+    source = tmp_path / "requests.jsonl"
+    source.write_text("\n".join(json.dumps(c) for c in contexts), encoding="utf-8")
+
+    _run(monkeypatch, "evaluate-stream", POLICY, "-i", str(source))
+    serial = capsys.readouterr().out
+    _run(
+        monkeypatch,
+        "evaluate-stream",
+        POLICY,
+        "-i",
+        str(source),
+        "--workers",
+        "2",
+        "--chunk-size",
+        "3",
+    )
+
+    assert capsys.readouterr().out == serial
+
+
+def test_evaluate_stream_applies_strategy(tmp_path, monkeypatch):
+    viewer = base_context()
+    viewer["user"]["role"] = "viewer"
+    source = tmp_path / "requests.jsonl"
+    source.write_text(json.dumps(viewer) + "\n", encoding="utf-8")
+    output = tmp_path / "decisions.jsonl"
+
+    rc = _run(
+        monkeypatch,
+        "evaluate-stream",
+        POLICY,
+        "-i",
+        str(source),
+        "-o",
+        str(output),
+        "--strategy",
+        "permit_overrides",
+    )
+
+    record = json.loads(output.read_text())
+    assert rc == 0
+    assert (record["decision"], record["reason"]) == (
+        "DENY",
+        "deny (no permits matched)",
+    )
+
+
+def test_cli_strategies_mirror_engine():
+    from cli.main import STRATEGIES
+    from engine.policy_set import STRATEGIES as ENGINE_STRATEGIES
+
+    assert STRATEGIES == ENGINE_STRATEGIES
+
+
+def test_cli_audit_overflow_mirrors_engine():
+    from cli.main import AUDIT_OVERFLOW
+    from engine.audit import OVERFLOW_POLICIES
+
+    assert AUDIT_OVERFLOW == OVERFLOW_POLICIES
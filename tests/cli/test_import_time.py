@@ -0,0 +1,114 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from tests.fixtures.context import base_context
+
+ROOT = Path(__file__).resolve().parents[2]
+POLICY = str(ROOT / "examples" / "policy.yaml")
+
+HEAVY = ("pydantic", "yaml", "asyncio", "concurrent.futures", "numpy")
+
+RUN_CLI = "import sys; from cli.main import main; sys.argv[0] = 'ace'; sys.exit(main())"
+SUBCOMMANDS = [
+    "validate",
+    "evaluate",
+    "evaluate-policies",
+    "evaluate-stream",
+    "bundle",
+    "analyze",
+    "serve",
+]
+
+
+def _import_times(*argv):
+    """Run ``ace`` under ``-X importtime``; return {module: cumulative microseconds}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUN_CLI, *argv],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return proc, times
+
+
+def _loaded(times, *packages):
+    return sorted(
+        name
+        for name in times
+        if any(name == p or name.startswith(p + ".") for p in packages)
+    )
+
+
+def _heavy(times):
+    return _loaded(times, *HEAVY)
+
+
+def test_top_level_help_is_within_import_budget():
+    proc, times = _import_times("--help")
+
+    assert proc.returncode == 0
+    assert not _heavy(times)
+    assert not _loaded(times, "engine", "validation")
+
+
+@pytest.mark.parametrize("command", SUBCOMMANDS)
+def test_subcommand_help_imports_nothing_heavy(command):
+    proc, times = _import_times(command, "--help")
+
+    assert proc.returncode == 0
+    assert not _heavy(times)
+
+
+def test_validate_json_policy_skips_yaml_and_server(tmp_path):
+    policy = tmp_path / "policy.json"
+    policy.write_text(
+        json.dumps(
+            {
+                "policy_id": "p.v1",
+                "target": {"resource_type": "document", "environment": "prod"},
+                "conditions": {
+                    "all": [{"field": "user.role", "operator": "equals", "value": "a"}]
+                },
+                "effect": "ALLOW",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    proc, times = _import_times("validate", str(policy))
+
+    assert proc.returncode == 0
+    assert "pydantic" in times
+    assert not _loaded(times, "yaml", "asyncio")
+
+
+def test_evaluate_stream_from_bundle_skips_pydantic_and_yaml(tmp_path):
+    bundle = tmp_path / "policies.aceb"
+    proc, _ = _import_times("bundle", POLICY, "-o", str(bundle))
+    assert proc.returncode == 0
+    requests = tmp_path / "requests.jsonl"
+    requests.write_text(json.dumps(base_context()) + "\n", encoding="utf-8")
+
+    proc, times = _import_times("evaluate-stream", str(bundle), "-i", str(requests))
+
+    assert proc.returncode == 0
+    assert json.loads(proc.stdout)["decision"] == "ALLOW"
+    assert not _heavy(times)
+
+
+def test_engine_all_matches_lazy_exports():
+    import engine
+
+    assert set(engine.__all__) == set(engine._EXPORTS) | {"instrumentation"}
+    assert len(engine.__all__) == len(set(engine.__all__))
+    for name in engine._EXPORTS:
+        assert getattr(engine, name) is not None
@@ -0,0 +1,33 @@
+import json
+import sys
+
+from cli.main import main
+from tests.fixtures.policy import valid_policy
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["ace", *argv])
+    return main()
+
+
+def test_validate_directory_reports_all_invalid_files(tmp_path, monkeypatch, capsys):
+    for name, operator in [("a.json", "equals"), ("b.json", "nope"), ("c.json", "x")]:
+        data = valid_policy()
+        data["conditions"]["all"][0]["operator"] = operator
+        (tmp_path / name).write_text(json.dumps(data), encoding="utf-8")
+
+    rc = _run(monkeypatch, "validate", str(tmp_path))
+
+    err = capsys.readouterr().err
+    assert rc == 1
+    assert "2 policy file(s) failed validation" in err
+    assert "b.json" in err and "c.json" in err
+
+
+def test_validate_directory_ok(tmp_path, monkeypatch, capsys):
+    (tmp_path / "a.json").write_text(json.dumps(valid_policy()), encoding="utf-8")
+
+    rc = _run(monkeypatch, "validate", str(tmp_path), "--workers", "1")
+
+    assert rc == 0
+    assert capsys.readouterr().out.strip() == "OK: 1 policy file(s)"
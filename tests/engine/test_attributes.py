@@ -0,0 +1,187 @@
+import pytest
+from engine.attributes import AttributeProvider, AttributeResolver, InMemoryProvider
+from engine.errors import ContextValidationError
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import PolicyIndex, evaluate_policies_decision
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _policy(policy_id, conditions, resource_type="document"):
+    data = valid_policy()
+    data["policy_id"] = policy_id
+    data["target"]["resource_type"] = resource_type
+    data["conditions"] = {
+        "all": [{"field": f, "operator": op, "value": v} for f, op, v in conditions]
+    }
+    return Policy(**data)
+
+
+USERS = {
+    "1": {"department": "eng", "clearance": 4, "groups": "staff"},
+    "2": {"department": "sales", "clearance": 1, "groups": "none"},
+}
+
+
+def _index():
+    return PolicyIndex(
+        [
+            _policy(
+                "doc",
+                [("user.department", "equals", "eng"), ("user.clearance", "gt", 3)],
+            ),
+            _policy("report", [("user.groups", "equals", "staff")], "report"),
+        ]
+    )
+
+
+def _request(user_id="1", resource_type="document"):
+    context = base_context()
+    context["user"] = {"id": user_id}
+    context["resource"]["type"] = resource_type
+    return context
+
+
+def test_missing_fields_are_fetched_in_one_batched_call():
+    provider = InMemoryProvider("user", USERS, key="user.id")
+    resolver = AttributeResolver([provider])
+
+    result = resolver.evaluate(_index(), _request(), trace=False)
+
+    assert result.decision == "ALLOW"
+    assert provider.calls == [("user.department", "user.clearance")]
+
+
+def test_only_fields_of_the_matched_bucket_are_fetched():
+    provider = InMemoryProvider("user", USERS, key="user.id")
+    resolver = AttributeResolver([provider])
+
+    resolver.complete(_index(), _request(resource_type="report"))
+
+    assert provider.calls == [("user.groups",)]
+
+
+def test_supplied_fields_are_not_fetched_and_context_is_not_mutated():
+    provider = InMemoryProvider("user", USERS, key="user.id")
+    resolver = AttributeResolver([provider])
+    context = _request()
+    context["user"]["department"] = "sales"
+
+    completed = resolver.complete(_index(), context)
+
+    assert provider.calls == [("user.clearance",)]
+    assert completed["user"] == {"id": "1", "department": "sales", "clearance": 4}
+    assert context["user"] == {"id": "1", "department": "sales"}
+    assert completed["resource"] is context["resource"]
+
+
+def test_complete_context_is_returned_as_is():
+    provider = InMemoryProvider("user", USERS, key="user.id")
+    resolver = AttributeResolver([provider])
+    context = _request()
+    context["user"].update(department="eng", clearance=5)
+
+    assert resolver.complete(_index(), context) is context
+    assert provider.calls == []
+
+
+def test_matches_evaluation_of_a_fully_populated_context():
+    index = _index()
+    resolver = AttributeResolver([InMemoryProvider("user", USERS, key="user.id")])
+    for user_id in USERS:
+        for resource_type in ("document", "report", "other"):
+            full = _request(user_id, resource_type)
+            full["user"].update(USERS[user_id])
+            expected = evaluate_policies_decision(index, full, trace=False)
+            result = resolver.evaluate(
+                index, _request(user_id, resource_type), trace=False
+            )
+            assert result == expected
+
+
+def test_ttl_cache_serves_repeat_requests_until_expiry():
+    clock = Clock()
+    provider = InMemoryProvider("user", USERS, key="user.id", ttl=60)
+    resolver = AttributeResolver([provider], clock=clock)
+    index = _index()
+
+    resolver.complete(index, _request())
+    resolver.complete(index, _request())
+    resolver.complete(index, _request("2"))
+    assert len(provider.calls) == 2
+
+    clock.now = 60
+    resolver.complete(index, _request())
+    assert len(provider.calls) == 3
+
+
+def test_cache_only_fetches_paths_not_yet_cached():
+    provider = InMemoryProvider("user", USERS, key="user.id", ttl=60)
+    resolver = AttributeResolver([provider], clock=Clock())
+
+    resolver.complete(_index(), _request())
+    resolver.complete(_index(), _request(resource_type="report"))
+    resolver.complete(_index(), _request())
+
+    assert provider.calls == [("user.department", "user.clearance"), ("user.groups",)]
+
+
+def test_unknown_attribute_still_raises_missing_field():
+    resolver = AttributeResolver([InMemoryProvider("user", USERS, key="user.id")])
+
+    with pytest.raises(ContextValidationError, match="missing field"):
+        resolver.evaluate(_index(), _request("unknown"), trace=False)
+
+
+def test_longest_prefix_wins_and_providers_are_batched_separately():
+    class Groups(AttributeProvider):
+        def __init__(self):
+            super().__init__("user.groups")
+            self.calls = []
+
+        def fetch(self, paths, context):
+            self.calls.append(tuple(paths))
+            return {"user.groups": "staff"}
+
+    users = InMemoryProvider("user", USERS, key="user.id")
+    groups = Groups()
+    resolver = AttributeResolver([users, groups])
+    index = PolicyIndex(
+        [
+            _policy(
+                "p",
+                [
+                    ("user.department", "equals", "eng"),
+                    ("user.groups", "equals", "staff"),
+                ],
+            )
+        ]
+    )
+
+    assert resolver.evaluate(index, _request(), trace=False).decision == "ALLOW"
+    assert users.calls == [("user.department",)]
+    assert groups.calls == [("user.groups",)]
+
+
+def test_duplicate_prefix_is_rejected():
+    resolver = AttributeResolver([InMemoryProvider("user", USERS, key="user.id")])
+
+    with pytest.raises(ValueError, match="already registered"):
+        resolver.register(InMemoryProvider("user", USERS, key="user.id"))
+
+
+def test_provider_without_fetch_cannot_be_constructed():
+    class Incomplete(AttributeProvider):
+        pass
+
+    with pytest.raises(TypeError, match="fetch"):
+        Incomplete("user")
@@ -0,0 +1,191 @@
+import gzip
+import json
+import threading
+import time
+
+import pytest
+from engine.audit import AuditLog
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import PolicyIndex, evaluate_policies_decision, instrumentation
+
+
+def _index():
+    return PolicyIndex([Policy(**valid_policy())])
+
+
+def _viewer():
+    context = base_context()
+    context["user"]["role"] = "viewer"
+    return context
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_deny_is_always_traced_and_allow_is_sampled(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    index = _index()
+    samples = iter([0.9, 0.1])
+    with AuditLog(path, sample_rate=0.5, rng=lambda: next(samples)) as audit:
+        audit.evaluate(index, base_context())
+        audit.evaluate(index, base_context())
+        audit.evaluate(index, _viewer())
+
+    records = _read(path)
+    assert [r["decision"] for r in records] == ["ALLOW", "ALLOW", "DENY"]
+    assert "trace" not in records[0]
+    expected = evaluate_policies_decision(index, base_context(), trace=True)
+    assert records[1]["trace"] == expected.model_dump(mode="json")["trace"]
+    assert records[2]["trace"]
+    assert audit.stats()["traced"] == 2
+
+
+def test_traced_decisions_are_written_as_is(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    decision = evaluate_policies_decision(_index(), base_context(), trace=True)
+    with AuditLog(path) as audit:
+        audit.record(decision)
+
+    (record,) = _read(path)
+    assert record["policy_id"] == "test.policy.v1"
+    assert record["trace"] == decision.model_dump(mode="json")["trace"]
+    assert isinstance(record["timestamp"], float)
+
+
+def _blocked(audit):
+    # Hold the writer inside its first batch so the queue fills up.
+    release = threading.Event()
+    write = audit._write
+
+    def slow_write(batch):
+        release.wait()
+        write(batch)
+
+    audit._write = slow_write
+    return release
+
+
+def _wait_until_taken(audit):
+    while audit._queue.qsize():
+        time.sleep(0.001)
+
+
+@pytest.mark.parametrize("overflow", ["drop", "drop_allow"])
+def test_full_queue_drops_new_allows(tmp_path, overflow):
+    path = tmp_path / "audit.jsonl"
+    summary = evaluate_policies_decision(_index(), base_context(), trace=False)
+    audit = AuditLog(path, max_queue=1, overflow=overflow)
+    release = _blocked(audit)
+    audit.start()
+    assert audit.record(summary)
+    _wait_until_taken(audit)
+    assert audit.record(summary)
+
+    assert not audit.record(summary)
+    release.set()
+    audit.close()
+    assert [r["decision"] for r in _read(path)] == ["ALLOW", "ALLOW"]
+    assert audit.stats()["dropped"] == 1
+
+
+def test_drop_allow_blocks_for_denies_until_the_timeout(tmp_path):
+    index = _index()
+    allow = evaluate_policies_decision(index, base_context(), trace=False)
+    deny = evaluate_policies_decision(index, _viewer(), trace=False)
+    audit = AuditLog(
+        tmp_path / "audit.jsonl", max_queue=1, overflow="drop_allow", block_timeout=0.01
+    )
+    release = _blocked(audit)
+    audit.start()
+    audit.record(allow)
+    _wait_until_taken(audit)
+    audit.record(allow)
+
+    assert not audit.record(allow)
+    assert not audit.record(deny)
+    release.set()
+    assert audit.record(deny)
+    audit.close()
+    assert audit.stats()["dropped"] == 2
+
+
+def test_context_changed_after_record_does_not_change_the_entry(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    index = _index()
+    context = _viewer()
+    audit = AuditLog(path)
+    release = _blocked(audit)
+    audit.start()
+    result = audit.evaluate(index, context)
+    _wait_until_taken(audit)
+    context["user"]["role"] = "admin"
+    release.set()
+    audit.close()
+
+    (record,) = _read(path)
+    assert (record["decision"], record["reason"]) == (result.decision, result.reason)
+    assert {"field": "user.role", "actual": "viewer"}.items() <= record["trace"][
+        -1
+    ].items()
+
+
+def test_trace_is_dropped_when_it_disagrees_with_the_recorded_decision(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    index = _index()
+    deny = evaluate_policies_decision(index, _viewer(), trace=False)
+    with AuditLog(path) as audit:
+        # Not the context ``deny`` came from: re-evaluation yields ALLOW.
+        audit.record(deny, index, base_context())
+
+    (record,) = _read(path)
+    assert record["decision"] == "DENY"
+    assert record["policy_id"] == deny.policy_id
+    assert "trace" not in record
+    assert audit.stats()["mismatches"] == 1
+
+
+def test_trace_rebuild_does_not_touch_instrumentation_counters(tmp_path):
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        with AuditLog(tmp_path / "audit.jsonl") as audit:
+            audit.evaluate(_index(), _viewer())
+        assert audit.stats()["traced"] == 1
+        assert instrumentation.snapshot()["test.policy.v1"]["evaluations"] == 1
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def test_rotation_compresses_old_segments(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    summary = evaluate_policies_decision(_index(), base_context(), trace=False)
+    with AuditLog(path, max_bytes=1, backups=2, batch_size=1) as audit:
+        for _ in range(4):
+            audit.record(summary)
+            audit.flush()
+
+    assert audit.stats()["rotations"] == 4
+    assert not (tmp_path / "audit.jsonl.3.gz").exists()
+    for name in ("audit.jsonl.1.gz", "audit.jsonl.2.gz"):
+        lines = gzip.decompress((tmp_path / name).read_bytes()).splitlines()
+        assert [json.loads(line)["decision"] for line in lines] == ["ALLOW"]
+    assert path.read_text() == ""
+
+
+def test_record_requires_a_running_log(tmp_path):
+    summary = evaluate_policies_decision(_index(), base_context(), trace=False)
+
+    with pytest.raises(RuntimeError, match="not running"):
+        AuditLog(tmp_path / "audit.jsonl").record(summary)
+
+
+def test_invalid_options_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="sample_rate"):
+        AuditLog(tmp_path / "a.jsonl", sample_rate=2)
+    with pytest.raises(ValueError, match="overflow"):
+        AuditLog(tmp_path / "a.jsonl", overflow="spill")
@@ -0,0 +1,102 @@
+import pytest
+from engine.errors import ContextValidationError
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import PolicyIndex, batch, evaluate_batch, evaluate_policies_decision
+
+
+def _policies():
+    allow = valid_policy()
+    allow["conditions"] = {
+        "any": [
+            {"field": "user.role", "operator": "equals", "value": "admin"},
+            {"field": "user.level", "operator": "gt", "value": 3},
+        ]
+    }
+    deny = valid_policy()
+    deny["policy_id"] = "deny.contractor.v1"
+    deny["conditions"]["all"] = [
+        {"field": "user.kind", "operator": "in", "value": ["contractor"]}
+    ]
+    deny["effect"] = "DENY"
+    image = valid_policy()
+    image["policy_id"] = "image.allow.v1"
+    image["target"]["resource_type"] = "image"
+    return [Policy(**allow), Policy(**deny), Policy(**image)]
+
+
+def _contexts():
+    contexts = []
+    for role, level, kind, resource_type in [
+        ("admin", 1, "employee", "document"),
+        ("viewer", 5, "employee", "document"),
+        ("viewer", 1, "contractor", "document"),
+        ("admin", 1, "employee", "image"),
+        ("viewer", 1, "employee", "video"),
+    ]:
+        context = base_context()
+        context["user"].update(role=role, level=level, kind=kind)
+        context["resource"]["type"] = resource_type
+        contexts.append(context)
+    return contexts
+
+
+@pytest.mark.parametrize("trace", [False, True])
+def test_batch_matches_per_context_evaluation(trace):
+    policies = _policies()
+    contexts = _contexts()
+
+    expected = [evaluate_policies_decision(policies, c, trace=trace) for c in contexts]
+
+    assert evaluate_batch(policies, contexts, trace=trace) == expected
+    if not trace:
+        # Indexed traces omit the NOT_APPLICABLE policies outside the bucket.
+        assert evaluate_batch(PolicyIndex(policies), contexts, trace=False) == expected
+
+
+@pytest.mark.parametrize(
+    "strategy", ["deny_overrides", "permit_overrides", "first_applicable"]
+)
+def test_batch_evaluates_strategies_by_column(strategy, monkeypatch):
+    policies = _policies()
+    contexts = _contexts()
+    expected = [
+        evaluate_policies_decision(policies, c, strategy=strategy, trace=False)
+        for c in contexts
+    ]
+
+    def per_context(*args, **kwargs):
+        raise AssertionError("fell back to per-context evaluation")
+
+    monkeypatch.setattr(batch, "evaluate_policies_decision", per_context)
+
+    assert (
+        evaluate_batch(policies, contexts, strategy=strategy, trace=False) == expected
+    )
+
+
+def test_batch_defaults_match_per_context_defaults():
+    policies = _policies()
+    contexts = _contexts()
+
+    assert [r.model_dump() for r in evaluate_batch(policies, contexts)] == [
+        evaluate_policies_decision(policies, c).model_dump() for c in contexts
+    ]
+
+
+@pytest.mark.parametrize(
+    "strategy", ["deny_overrides", "permit_overrides", "first_applicable"]
+)
+def test_batch_raises_error_of_first_invalid_context(strategy):
+    contexts = _contexts()
+    del contexts[1]["user"]["kind"]
+    del contexts[3]["environment"]
+
+    with pytest.raises(ContextValidationError, match="missing field 'user.kind'"):
+        evaluate_batch(_policies(), contexts, strategy=strategy, trace=False)
+
+
+def test_batch_of_no_contexts_is_empty():
+    assert evaluate_batch(_policies(), []) == []
@@ -0,0 +1,65 @@
+import pytest
+from engine.bundle import BundleFormatError, load_bundle, write_bundle
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import evaluate_policies_decision
+
+
+def _policies():
+    deny = valid_policy()
+    deny["policy_id"] = "deny.contractor.v1"
+    deny["conditions"] = {
+        "any": [{"field": "user.kind", "operator": "in", "value": ["contractor"]}]
+    }
+    deny["effect"] = "DENY"
+    return [Policy(**valid_policy()), Policy(**deny)]
+
+
+def test_bundle_round_trip_preserves_decisions(tmp_path):
+    policies = _policies()
+    path = tmp_path / "policies.aceb"
+
+    digest = write_bundle(policies, path)
+    index = load_bundle(path)
+
+    assert len(digest) == 64
+    assert [p.policy_id for p in index] == [p.policy_id for p in policies]
+    for kind in ("employee", "contractor"):
+        context = base_context()
+        context["user"]["kind"] = kind
+        assert evaluate_policies_decision(
+            index, context, trace=False
+        ) == evaluate_policies_decision(policies, context, trace=False)
+
+
+def test_bundle_rejects_tampered_payload(tmp_path):
+    path = tmp_path / "policies.aceb"
+    write_bundle(_policies(), path)
+    data = bytearray(path.read_bytes())
+    data[-3] ^= 0x01
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(BundleFormatError, match="hash mismatch"):
+        load_bundle(path)
+
+
+def test_bundle_rejects_other_files(tmp_path):
+    path = tmp_path / "policy.aceb"
+    path.write_bytes(b"policy_id: nope\n" * 10)
+
+    with pytest.raises(BundleFormatError, match="not a policy bundle"):
+        load_bundle(path)
+
+
+def test_optimized_bundle_loads_only_for_its_strategy(tmp_path):
+    optimized = tmp_path / "optimized.aceb"
+    plain = tmp_path / "plain.aceb"
+    write_bundle(_policies(), optimized, optimized_for="deny_overrides")
+    write_bundle(_policies(), plain)
+
+    assert len(load_bundle(optimized)) == 2
+    with pytest.raises(BundleFormatError, match="optimized for deny_overrides"):
+        load_bundle(optimized, strategy="permit_overrides")
+    assert len(load_bundle(plain, strategy="permit_overrides")) == 2
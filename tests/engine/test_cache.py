@@ -0,0 +1,92 @@
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import DecisionCache, PolicyIndex, evaluate_policies_decision
+
+
+def _index():
+    return PolicyIndex([Policy(**valid_policy())])
+
+
+def test_cache_ignores_attributes_policies_do_not_read():
+    index = _index()
+    cache = DecisionCache()
+    first = base_context()
+    first["request"] = {"id": "a"}
+    second = base_context()
+    second["request"] = {"id": "b"}
+
+    assert cache.evaluate(index, first).decision == "ALLOW"
+    assert cache.evaluate(index, second).decision == "ALLOW"
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_cache_result_matches_uncached_evaluation():
+    index = _index()
+    cache = DecisionCache()
+    context = base_context()
+    context["user"]["role"] = "viewer"
+
+    cache.evaluate(index, context)
+
+    assert cache.evaluate(index, context) == evaluate_policies_decision(
+        index, context, trace=False
+    )
+    assert cache.hits == 1
+
+
+def test_cache_evicts_least_recently_used():
+    index = _index()
+    cache = DecisionCache(maxsize=2)
+    contexts = [base_context() for _ in range(3)]
+    for context, role in zip(contexts, ["admin", "viewer", "owner"]):
+        context["user"]["role"] = role
+        cache.evaluate(index, context)
+
+    assert cache.evictions == 1
+
+    cache.evaluate(index, contexts[2])
+    cache.evaluate(index, contexts[0])
+
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_cache_entries_expire_after_ttl():
+    now = [0.0]
+    cache = DecisionCache(ttl=10, clock=lambda: now[0])
+    index = _index()
+
+    cache.evaluate(index, base_context())
+    now[0] = 5
+    cache.evaluate(index, base_context())
+    now[0] = 20
+    cache.evaluate(index, base_context())
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_invalidates_when_policy_set_changes():
+    cache = DecisionCache()
+    cache.evaluate(_index(), base_context())
+
+    cache.evaluate(_index(), base_context())
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 1)
+
+
+def test_unhashable_values_bypass_cache():
+    data = valid_policy()
+    data["conditions"]["all"][0] = {
+        "field": "user.groups",
+        "operator": "equals",
+        "value": ["eng"],
+    }
+    index = PolicyIndex([Policy(**data)])
+    cache = DecisionCache()
+    context = base_context()
+    context["user"]["groups"] = ["eng"]
+
+    assert cache.evaluate(index, context).decision == "ALLOW"
+    assert len(cache) == 0
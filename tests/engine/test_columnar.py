@@ -0,0 +1,129 @@
+import random
+
+import pytest
+from engine.errors import ContextValidationError
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import evaluate_policies_decision
+
+np = pytest.importorskip("numpy")
+
+from engine.columnar import evaluate_columns  # noqa: E402
+
+
+def _policies():
+    allow = valid_policy()
+    allow["conditions"] = {
+        "all": [
+            {"field": "user.role", "operator": "in", "value": ["admin", "owner"]},
+            {"field": "resource.sensitivity", "operator": "lt", "value": 3},
+        ]
+    }
+    any_allow = valid_policy()
+    any_allow["policy_id"] = "image.any.v1"
+    any_allow["target"]["resource_type"] = "image"
+    any_allow["conditions"] = {
+        "any": [
+            {"field": "user.role", "operator": "equals", "value": "viewer"},
+            {"field": "resource.sensitivity", "operator": "gt", "value": 1},
+        ]
+    }
+    deny = valid_policy()
+    deny["policy_id"] = "deny.secret.v1"
+    deny["conditions"]["all"] = [
+        {"field": "resource.sensitivity", "operator": "gt", "value": 4}
+    ]
+    deny["effect"] = "DENY"
+    return [Policy(**allow), Policy(**any_allow), Policy(**deny)]
+
+
+def _table(rows=200, seed=7):
+    rng = random.Random(seed)
+    return {
+        "user.role": [rng.choice(["admin", "owner", "viewer"]) for _ in range(rows)],
+        "resource.type": [
+            rng.choice(["document", "image", "video"]) for _ in range(rows)
+        ],
+        "resource.sensitivity": [rng.randint(0, 6) for _ in range(rows)],
+        "environment.env": [rng.choice(["prod", "staging"]) for _ in range(rows)],
+    }
+
+
+def _row(table, i):
+    context = {"user": {}, "resource": {}, "environment": {}}
+    for path, column in table.items():
+        group, field = path.split(".")
+        context[group][field] = column[i]
+    return context
+
+
+def test_columnar_agrees_with_scalar_evaluator():
+    policies = _policies()
+    table = _table()
+
+    decisions = evaluate_columns(policies, table)
+
+    expected = [
+        evaluate_policies_decision(policies, _row(table, i), trace=False).decision
+        for i in range(200)
+    ]
+    assert decisions.tolist() == expected
+
+
+def test_columnar_accepts_numpy_columns():
+    policies = _policies()
+    table = _table()
+    arrays = {path: np.asarray(column) for path, column in table.items()}
+
+    assert (
+        evaluate_columns(policies, arrays) == evaluate_columns(policies, table)
+    ).all()
+
+
+def test_columnar_raises_for_missing_field_in_applicable_row():
+    table = _table(rows=5)
+    table["resource.type"] = ["document"] * 5
+    table["environment.env"] = ["prod"] * 5
+    table["resource.sensitivity"][2] = None
+
+    with pytest.raises(ContextValidationError, match="resource.sensitivity"):
+        evaluate_columns(_policies(), table)
+
+
+@pytest.mark.parametrize(
+    "levels, value",
+    [
+        ([2**53, 0.5], 2**53 + 1),
+        ([2**53 + 1, 3], float(2**53)),
+        ([float(2**53), 0.5], 2**53 + 1),
+        ([2**64, 1], 2**64 + 1),
+    ],
+)
+def test_columnar_compares_large_numbers_exactly(levels, value):
+    data = valid_policy()
+    data["conditions"] = {
+        "all": [{"field": "user.level", "operator": "equals", "value": value}]
+    }
+    policies = [Policy(**data)]
+    table = {
+        "user.level": levels,
+        "resource.type": ["document"] * len(levels),
+        "environment.env": ["prod"] * len(levels),
+    }
+
+    decisions = evaluate_columns(policies, table)
+
+    expected = [
+        evaluate_policies_decision(
+            policies,
+            {
+                "user": {"level": level},
+                "resource": {"type": "document"},
+                "environment": {"env": "prod"},
+            },
+            trace=False,
+        ).decision
+        for level in levels
+    ]
+    assert decisions.tolist() == expected
@@ -0,0 +1,139 @@
+import gc
+
+import pytest
+from engine.compiler import compile_policy
+from engine.errors import ContextValidationError
+from engine.evaluator import evaluate_policy, evaluate_policy_decision
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import compiler
+
+
+def test_compile_policy_presplits_fields_and_binds_operators():
+    data = valid_policy()
+    data["conditions"]["all"].append(
+        {"field": "user.role", "operator": "in", "value": ["admin", "owner"]}
+    )
+
+    plan = compile_policy(Policy(**data))
+
+    assert plan.policy_id == "test.policy.v1"
+    assert plan.effect == "ALLOW"
+    assert plan.target == ("document", "prod")
+    assert plan.conditions.mode_all is True
+    assert plan.conditions.fields == (("user.role", ("user", "role")),)
+    assert [c.slot for c in plan.conditions.items] == [0, 0]
+
+
+def test_compile_policy_is_idempotent():
+    plan = compile_policy(Policy(**valid_policy()))
+
+    assert compile_policy(plan) is plan
+
+
+def test_each_policy_model_is_compiled_once():
+    policy = Policy(**valid_policy())
+    plan = compile_policy(policy)
+
+    assert compile_policy(policy) is plan
+    assert compile_policy(Policy(**valid_policy())) is not plan
+
+    key = id(policy)
+    del policy
+    gc.collect()
+    assert key not in compiler._COMPILED
+
+
+def test_compiled_plan_matches_model_evaluation():
+    policy = Policy(**valid_policy())
+    plan = compile_policy(policy)
+
+    for role in ("admin", "viewer"):
+        context = base_context()
+        context["user"]["role"] = role
+        assert evaluate_policy(plan, context) == evaluate_policy(policy, context)
+        assert (
+            evaluate_policy_decision(plan, context).model_dump()
+            == evaluate_policy_decision(policy, context).model_dump()
+        )
+
+
+def test_short_circuit_still_raises_for_missing_fields():
+    data = valid_policy()
+    data["conditions"] = {
+        "any": [
+            {"field": "user.role", "operator": "equals", "value": "admin"},
+            {"field": "user.department", "operator": "equals", "value": "eng"},
+        ]
+    }
+    plan = compile_policy(Policy(**data))
+
+    with pytest.raises(ContextValidationError, match="user.department"):
+        evaluate_policy(plan, base_context())
+
+
+def test_unsupported_operator_raises_only_when_evaluated():
+    data = valid_policy()
+    data["conditions"]["all"][0]["operator"] = "contains"
+    plan = compile_policy(Policy(**data))
+
+    context = base_context()
+    context["resource"]["type"] = "image"
+    assert evaluate_policy(plan, context) == "NOT_APPLICABLE"
+
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        evaluate_policy(plan, base_context())
+
+
+def _policy_with(policy_id, *conditions):
+    data = valid_policy()
+    data["policy_id"] = policy_id
+    data["conditions"] = {
+        "all": [{"field": f, "operator": op, "value": v} for f, op, v in conditions]
+    }
+    return compile_policy(Policy(**data))
+
+
+def test_identical_pieces_are_shared_across_policies():
+    a = _policy_with("a", ("user.role", "in", ["admin", "editor"]))
+    b = _policy_with("b", ("user.role", "in", ["admin", "editor"]))
+
+    assert a.target is b.target
+    assert a.conditions.fields[0] is b.conditions.fields[0]
+    assert a.conditions.items[0] is b.conditions.items[0]
+
+
+def test_conditions_differing_in_value_type_or_slot_are_not_shared():
+    one = _policy_with("one", ("user.level", "equals", 1))
+    true = _policy_with("true", ("user.level", "equals", True))
+    listed = _policy_with("listed", ("user.level", "in", [1]))
+    listed_true = _policy_with("listed_true", ("user.level", "in", [True]))
+    second = _policy_with(
+        "second", ("user.role", "equals", "admin"), ("user.level", "equals", 1)
+    )
+
+    assert one.conditions.items[0] is not true.conditions.items[0]
+    assert true.conditions.items[0].value is True
+    assert listed.conditions.items[0] is not listed_true.conditions.items[0]
+    assert second.conditions.items[1].slot == 1
+    assert one.conditions.items[0] is not second.conditions.items[1]
+
+
+def test_conditions_with_dict_values_are_shared_by_content():
+    a = _policy_with("a", ("user.meta", "equals", {1: "a", "b": "c"}))
+    b = _policy_with("b", ("user.meta", "equals", {"b": "c", 1: "a"}))
+
+    assert a.conditions.items[0] is b.conditions.items[0]
+
+
+def test_shared_tables_are_bounded(monkeypatch):
+    monkeypatch.setattr(compiler, "_FIELDS", {})
+    monkeypatch.setattr(compiler, "_SHARED_LIMIT", 2)
+    plans = [_policy_with(f"p{i}", (f"user.attr{i}", "equals", i)) for i in range(5)]
+
+    assert len(compiler._FIELDS) <= 2
+    assert [c.field for p in plans for c in p.conditions.items] == [
+        f"user.attr{i}" for i in range(5)
+    ]
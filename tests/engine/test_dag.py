@@ -0,0 +1,94 @@
+import random
+
+import pytest
+from engine.dag import PolicyDAG
+from tests.fixtures.context import base_context
+from tests.fixtures.evaluation import outcome
+from tests.fixtures.policy import random_policies, valid_policy
+from validation.schema import Policy
+
+from engine import PolicyEvaluationError, evaluate_policies_decision
+
+TESTS = [
+    ("user.role", "equals", "admin"),
+    ("user.role", "equals", "viewer"),
+    ("user.role", "in", ["admin", "editor"]),
+    ("user.level", "gt", 3),
+    ("user.level", "lt", 7),
+    ("user.level", "equals", 1),
+    ("user.level", "equals", True),
+    ("resource.owner", "equals", "alice"),
+    ("user.team", "equals", "red"),
+]
+ENVIRONMENTS = ("prod", "staging")
+
+
+def _random_context(rng):
+    context = base_context()
+    context["environment"]["env"] = rng.choice(ENVIRONMENTS)
+    context["user"]["role"] = rng.choice(["admin", "editor", "viewer"])
+    context["user"]["level"] = rng.choice([1, 2, 5, 9, True])
+    context["resource"]["owner"] = rng.choice(["alice", "bob"])
+    if rng.random() < 0.7:
+        context["user"]["team"] = "red"
+    return context
+
+
+def test_dag_matches_naive_evaluation():
+    rng = random.Random(42)
+    for _ in range(100):
+        policies = random_policies(
+            rng, rng.randint(1, 12), TESTS, max_conditions=4, environments=ENVIRONMENTS
+        )
+        dag = PolicyDAG(policies)
+        for _ in range(20):
+            context = _random_context(rng)
+            expected = outcome(
+                lambda: evaluate_policies_decision(policies, context, trace=False)
+            )
+            assert outcome(lambda: dag.evaluate(context)) == expected
+
+
+def test_dag_shares_tests_across_policies():
+    policies = []
+    for i in range(100):
+        data = valid_policy()
+        data["policy_id"] = f"p{i}"
+        data["conditions"]["all"].append(
+            {"field": "user.id", "operator": "in", "value": [str(i % 5)]}
+        )
+        policies.append(Policy(**data))
+
+    dag = PolicyDAG(policies)
+
+    assert dag.stats() == {"policies": 100, "conditions": 200, "fields": 2, "tests": 6}
+    candidates, passed = dag.outcomes(base_context())
+    assert len(candidates) == 100
+    assert passed.count(True) == 20
+    # deny_overrides only needs the leaves up to the first failing policy.
+    assert dag.outcomes(base_context(), until_deny=True)[1] == [False]
+    assert dag.evaluate(base_context()).policy_id == "p0"
+
+
+def test_dag_trace_and_not_applicable():
+    dag = PolicyDAG([Policy(**valid_policy())])
+    context = base_context()
+
+    assert dag.evaluate(context, trace=True) == evaluate_policies_decision(
+        [Policy(**valid_policy())], context
+    )
+    context["resource"]["type"] = "image"
+    assert dag.evaluate(context).decision == "NOT_APPLICABLE"
+
+
+def test_dag_raises_like_sequential_evaluation():
+    unsupported = valid_policy()
+    unsupported["conditions"]["all"][0]["operator"] = "matches"
+    missing = valid_policy()
+    missing["conditions"]["all"][0]["field"] = "user.team"
+    policies = [Policy(**unsupported), Policy(**missing)]
+
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        PolicyDAG(policies).evaluate(base_context())
+    with pytest.raises(PolicyEvaluationError, match="user.team"):
+        PolicyDAG(policies[::-1]).evaluate(base_context())
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import make_policy, random_policies
+
+from engine import (
+    ContextValidationError,
+    PolicyIndex,
+    compile_policy,
+    evaluate_policies_decision,
+)
+
+ROLES = ["admin", "editor", "viewer", 1, True, 1.0]
+
+
+TESTS = [("user.role", "equals", role) for role in ROLES] + [
+    ("user.id", "in", ids) for ids in (["1", "2"], ["1", "3"], ["2", "3"])
+]
+
+
+def test_dispatch_matches_sequential_evaluation():
+    rng = random.Random(0)
+    for _ in range(200):
+        policies = random_policies(
+            rng,
+            rng.randint(2, 8),
+            TESTS,
+            effects=("ALLOW",) * 9 + ("DENY",),
+            modes=("all",) * 4 + ("any",),
+        )
+        index = PolicyIndex(policies)
+        for role in ROLES + ["other", ["admin"]]:
+            context = base_context()
+            context["user"]["role"] = role
+            context["user"]["id"] = rng.choice(["1", "2", "3"])
+            assert evaluate_policies_decision(
+                index, context, trace=False
+            ) == evaluate_policies_decision(policies, context, trace=False)
+
+
+def test_dispatch_is_built_for_shared_equals_fields():
+    policies = [
+        make_policy("p0", [("user.role", "equals", "admin")]),
+        make_policy(
+            "p1", [("user.role", "equals", "editor"), ("user.id", "equals", "1")]
+        ),
+    ]
+    index = PolicyIndex(policies)
+
+    bucket = index.candidates(base_context())
+    dispatch = index.dispatch(bucket)
+
+    assert [gate.field for gate in dispatch.gates] == ["user.role"]
+    assert dispatch.gates[0].first_miss("admin") == 1
+    assert dispatch.gates[0].first_miss("editor") == 0
+    single = PolicyIndex(policies[:1])
+    assert single.dispatch(single.candidates(base_context())) is None
+
+
+def test_dispatch_still_raises_for_missing_fields_of_skipped_policies():
+    policies = [
+        make_policy("p0", [("user.role", "equals", "viewer")]),
+        make_policy(
+            "p1", [("user.role", "equals", "editor"), ("user.team", "equals", "x")]
+        ),
+    ]
+    index = PolicyIndex(policies)
+
+    with pytest.raises(ContextValidationError, match="user.team"):
+        evaluate_policies_decision(index, base_context(), trace=False)
+
+
+def test_in_uses_set_membership_with_identical_results():
+    users = [str(n) for n in range(1000)]
+    plan = compile_policy(make_policy("p0", [("user.id", "in", users)]))
+    condition = plan.conditions.items[0]
+
+    assert condition.value is users
+    assert condition.fn("999", users)
+    assert not condition.fn("1000", users)
+    # Unhashable request values fall back to the linear scan.
+    nested = compile_policy(make_policy("p1", [("user.id", "in", [["a"], "b"])]))
+    assert nested.conditions.items[0].fn(["a"], [["a"], "b"])
+    fallback = compile_policy(make_policy("p2", [("user.id", "in", ["a", "b"])]))
+    assert not fallback.conditions.items[0].fn(["a"], ["a", "b"])
+    # Strings keep substring semantics.
+    text = compile_policy(make_policy("p3", [("user.id", "in", "abc")]))
+    assert text.conditions.items[0].fn("bc", "abc")
@@ -1,6 +1,7 @@
 import pytest
+from engine.decision import DecisionSummary
 from engine.errors import ContextValidationError
-from engine.evaluator import evaluate_policy
+from engine.evaluator import evaluate_policy, evaluate_policy_decision
 from tests.fixtures.context import base_context
 from tests.fixtures.policy import valid_policy
 from validation.schema import Policy
@@ -105,3 +106,17 @@ def test_any_conditions_deny_when_none_match():
     context = base_context()
 
     assert evaluate_policy(policy, context) == "DENY"
+
+
+def test_decision_without_trace_returns_summary():
+    policy = Policy(**valid_policy())
+    context = base_context()
+    context["user"]["role"] = "viewer"
+
+    result = evaluate_policy_decision(policy, context, trace=False)
+    full = evaluate_policy_decision(policy, context)
+
+    assert isinstance(result, DecisionSummary)
+    assert result.decision == full.decision == "DENY"
+    assert result.reason == full.reason
+    assert result.to_decision() == full.model_copy(update={"trace": []})
@@ -0,0 +1,98 @@
+import pytest
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import (
+    ContextValidationError,
+    PolicyIndex,
+    evaluate_batch,
+    evaluate_policies_decision,
+    evaluate_policy_decision,
+    instrumentation,
+)
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def _policies():
+    staging = valid_policy()
+    staging["policy_id"] = "staging.v1"
+    staging["target"]["environment"] = "staging"
+    two = valid_policy()
+    two["policy_id"] = "two.v1"
+    two["conditions"] = {
+        "all": [
+            {"field": "user.role", "operator": "equals", "value": "viewer"},
+            {"field": "user.id", "operator": "equals", "value": "1"},
+        ]
+    }
+    return [Policy(**valid_policy()), Policy(**staging), Policy(**two)]
+
+
+def test_disabled_by_default_records_nothing():
+    instrumentation.reset()
+    evaluate_policies_decision(_policies(), base_context(), trace=False)
+
+    assert instrumentation.snapshot() == {}
+
+
+def test_counts_target_hits_matches_and_short_circuited_conditions(enabled):
+    policies = _policies()
+    for _ in range(3):
+        evaluate_policies_decision(policies, base_context(), trace=False)
+
+    stats = instrumentation.snapshot()
+    assert stats["test.policy.v1"]["evaluations"] == 3
+    assert stats["test.policy.v1"]["target_hits"] == 3
+    assert stats["test.policy.v1"]["matches"] == 3
+    assert stats["staging.v1"]["evaluations"] == 3
+    assert stats["staging.v1"]["target_hits"] == 0
+    two = stats["two.v1"]
+    assert two["matches"] == 0
+    assert [(c["passed"], c["failed"]) for c in two["conditions"]] == [(0, 3), (0, 0)]
+    assert two["nanoseconds"] > 0
+
+
+def test_traced_index_and_batch_paths_are_recorded(enabled):
+    index = PolicyIndex(_policies())
+    evaluate_policy_decision(_policies()[0], base_context(), trace=True)
+    evaluate_policies_decision(index, base_context(), trace=True)
+    evaluate_batch(index, [base_context(), base_context()], trace=False)
+
+    stats = instrumentation.snapshot()
+    assert stats["test.policy.v1"]["evaluations"] == 4
+    # Traced evaluation runs every condition.
+    assert stats["two.v1"]["conditions"][1]["passed"] == 1
+    # Only the request's target bucket is evaluated through an index.
+    assert "staging.v1" not in stats
+
+
+def test_errors_are_counted(enabled):
+    context = base_context()
+    del context["user"]["role"]
+
+    with pytest.raises(ContextValidationError):
+        evaluate_policies_decision(_policies(), context, trace=False)
+
+    assert instrumentation.snapshot()["test.policy.v1"]["errors"] == 1
+
+
+def test_prometheus_export(enabled):
+    evaluate_policies_decision(_policies(), base_context(), trace=False)
+
+    text = instrumentation.to_prometheus()
+
+    assert "# TYPE ace_policy_evaluations_total counter" in text
+    assert 'ace_policy_evaluations_total{policy_id="test.policy.v1"} 1' in text
+    assert (
+        'ace_condition_results_total{policy_id="two.v1",condition="0",'
+        'field="user.role",operator="equals",result="fail"} 1'
+    ) in text
@@ -0,0 +1,46 @@
+import pytest
+from engine.errors import ContextValidationError
+from engine.parallel import evaluate_parallel
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import PolicyIndex, evaluate_policies_decision
+
+
+def _contexts():
+    contexts = []
+    for i in range(25):
+        context = base_context()
+        context["user"]["role"] = "admin" if i % 3 else "viewer"
+        context["resource"]["type"] = "document" if i % 5 else "image"
+        contexts.append(context)
+    return contexts
+
+
+def test_parallel_preserves_input_order():
+    policies = [Policy(**valid_policy())]
+    contexts = _contexts()
+
+    results = list(evaluate_parallel(policies, contexts, workers=2, chunk_size=4))
+
+    assert results == [
+        evaluate_policies_decision(policies, c, trace=False) for c in contexts
+    ]
+
+
+def test_parallel_returns_or_raises_evaluation_errors():
+    index = PolicyIndex([Policy(**valid_policy())])
+    contexts = _contexts()
+    del contexts[7]["user"]["role"]
+
+    results = list(
+        evaluate_parallel(
+            index, contexts, workers=2, chunk_size=4, return_exceptions=True
+        )
+    )
+    assert isinstance(results[7], ContextValidationError)
+    assert results[8].decision == "ALLOW"
+
+    with pytest.raises(ContextValidationError, match="missing field 'user.role'"):
+        list(evaluate_parallel(index, contexts, workers=2, chunk_size=4))
@@ -0,0 +1,167 @@
+import random
+
+import pytest
+from engine.errors import ContextValidationError, PolicyEvaluationError
+from engine.operators import OPERATORS
+from engine.partial import partial_evaluate
+from engine.policy_set import STRATEGIES
+from tests.fixtures.context import base_context
+from tests.fixtures.evaluation import outcome
+from tests.fixtures.policy import random_policies, valid_policy
+from validation.schema import Policy
+
+from engine import evaluate_policies_decision
+
+TESTS = [
+    ("user.role", "equals", "admin"),
+    ("user.role", "in", ["admin", "editor"]),
+    ("user.level", "gt", 3),
+    ("resource.owner", "equals", "alice"),
+    ("resource.owner", "in", ["alice", "bob"]),
+    ("resource.size", "lt", 100),
+    ("resource.tier", "equals", "gold"),
+]
+
+
+def _random_resource(rng):
+    resource = {
+        "type": rng.choice(["document", "image", "video"]),
+        "owner": rng.choice(["alice", "bob", "carol"]),
+        "size": rng.choice([10, 500]),
+    }
+    if rng.random() < 0.8:
+        resource["tier"] = rng.choice(["gold", "silver"])
+    return resource
+
+
+def _matches(expression, resource):
+    if isinstance(expression, bool):
+        return expression
+    if "all" in expression:
+        return all(_matches(e, resource) for e in expression["all"])
+    if "any" in expression:
+        return any(_matches(e, resource) for e in expression["any"])
+    value = resource.get(expression["field"].split(".", 1)[1])
+    return value is not None and OPERATORS[expression["operator"]](
+        value, expression["value"]
+    )
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_residuals_match_full_evaluation(strategy):
+    rng = random.Random(strategy)
+    for _ in range(100):
+        policies = random_policies(
+            rng, rng.randint(1, 6), TESTS, resource_types=("document", "image")
+        )
+        context = base_context()
+        del context["resource"]
+        context["user"]["role"] = rng.choice(["admin", "editor", "viewer"])
+        context["user"]["level"] = rng.choice([1, 5])
+        if rng.random() < 0.2:
+            del context["user"]["level"]
+        partial = partial_evaluate(policies, context, strategy=strategy)
+        try:
+            expression = partial.to_expression()
+        except PolicyEvaluationError:
+            # only_one_applicable with several policies on some resource type.
+            expression = None
+
+        for _ in range(10):
+            resource = _random_resource(rng)
+            full = {**context, "resource": resource}
+            expected = outcome(
+                lambda: evaluate_policies_decision(
+                    policies, full, strategy=strategy, trace=False
+                )
+            )
+            assert outcome(lambda: partial.evaluate(resource)) == expected
+            if expression is not None and not isinstance(expected[0], type):
+                assert _matches(expression, resource) == (expected[0] == "ALLOW")
+
+
+def test_residual_keeps_only_resource_conditions():
+    data = valid_policy()
+    data["conditions"]["all"].append(
+        {"field": "resource.owner", "operator": "equals", "value": "alice"}
+    )
+    context = base_context()
+    del context["resource"]
+
+    partial = partial_evaluate([Policy(**data)], context)
+
+    assert partial.to_expression() == {
+        "all": [
+            {"field": "resource.type", "operator": "equals", "value": "document"},
+            {"field": "resource.owner", "operator": "equals", "value": "alice"},
+        ]
+    }
+    context["user"]["role"] = "viewer"
+    assert partial_evaluate([Policy(**data)], context).to_expression() is False
+
+
+def test_filter_and_mask_select_allowed_resources():
+    data = valid_policy()
+    data["conditions"]["all"].append(
+        {"field": "resource.owner", "operator": "in", "value": ["alice", "bob"]}
+    )
+    context = base_context()
+    del context["resource"]
+    partial = partial_evaluate([Policy(**data)], context)
+    resources = [
+        {"type": "document", "owner": "alice"},
+        {"type": "document", "owner": "carol"},
+        {"type": "image", "owner": "bob"},
+    ]
+
+    assert partial.filter(resources) == [resources[0]]
+    mask = partial.residual("document").mask(
+        {"resource.owner": ["alice", "carol", None, "bob"]}
+    )
+    assert mask == [True, False, False, True]
+
+
+def test_missing_known_field_fails_only_the_residuals_that_read_it():
+    image = valid_policy()
+    image["policy_id"] = "image"
+    image["target"]["resource_type"] = "image"
+    image["conditions"]["all"].insert(
+        0, {"field": "resource.owner", "operator": "equals", "value": "alice"}
+    )
+    image["conditions"]["all"].append(
+        {"field": "user.team", "operator": "equals", "value": "red"}
+    )
+    policies = [Policy(**valid_policy()), Policy(**image)]
+    context = base_context()
+    del context["resource"]
+
+    partial = partial_evaluate(policies, context)
+
+    document = {"type": "document"}
+    full = {**context, "resource": document}
+    assert partial.evaluate(document) == evaluate_policies_decision(
+        policies, full, trace=False
+    )
+    assert partial.residual("document").to_expression() is True
+    residual = partial.residual("image")
+    # A resource field read before the missing one still fails first.
+    cases = [
+        ({"type": "image"}, "resource.owner"),
+        ({"type": "image", "owner": "alice"}, "user.team"),
+    ]
+    for resource, field in cases:
+        with pytest.raises(ContextValidationError, match=field):
+            evaluate_policies_decision(
+                policies, {**context, "resource": resource}, trace=False
+            )
+        with pytest.raises(ContextValidationError, match=field):
+            partial.evaluate(resource)
+    with pytest.raises(ContextValidationError, match="user.team"):
+        residual.mask({"resource.owner": ["alice"]})
+    with pytest.raises(ContextValidationError, match="user.team"):
+        partial.to_expression()
+
+
+def test_partial_evaluate_requires_the_environment():
+    with pytest.raises(ContextValidationError, match="environment.env"):
+        partial_evaluate([Policy(**valid_policy())], {"user": {}, "environment": {}})
@@ -0,0 +1,90 @@
+import pytest
+from engine.errors import ContextValidationError
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+from engine import PolicyIndex, evaluate_policies_decision
+
+
+def _policy(policy_id, resource_type="document", environment="prod", **overrides):
+    data = valid_policy()
+    data["policy_id"] = policy_id
+    data["target"] = {"resource_type": resource_type, "environment": environment}
+    data.update(overrides)
+    return Policy(**data)
+
+
+def _policies():
+    return [
+        _policy("doc.prod.allow.v1"),
+        _policy("image.prod.allow.v1", resource_type="image"),
+        _policy("doc.staging.deny.v1", environment="staging", effect="DENY"),
+        _policy("doc.prod.deny.v1", effect="DENY"),
+    ]
+
+
+def test_index_buckets_policies_by_target():
+    index = PolicyIndex(_policies())
+
+    candidates = index.candidates(base_context())
+
+    assert [p.policy_id for p in candidates] == [
+        "doc.prod.allow.v1",
+        "doc.prod.deny.v1",
+    ]
+    assert len(index) == 4
+
+
+def test_index_returns_same_decision_as_linear_scan():
+    policies = _policies()
+    index = PolicyIndex(policies)
+
+    contexts = [base_context() for _ in range(3)]
+    contexts[1]["resource"]["type"] = "image"
+    contexts[2]["environment"]["env"] = "dev"
+
+    for context in contexts:
+        expected = evaluate_policies_decision(policies, context)
+        result = evaluate_policies_decision(index, context)
+        assert result.decision == expected.decision
+        assert result.policy_id == expected.policy_id
+        assert result.reason == expected.reason
+
+
+def test_index_trace_only_covers_target_bucket():
+    policies = _policies()
+
+    linear = evaluate_policies_decision(policies, base_context())
+    result = evaluate_policies_decision(PolicyIndex(policies), base_context())
+
+    # The linear scan also traces the non-matching policies as NOT_APPLICABLE;
+    # the index never visits them. Only the trace differs, not the decision.
+    assert [(e.policy_id, e.detail) for e in linear.trace if e.kind == "policy"] == [
+        ("doc.prod.allow.v1", "ALLOW"),
+        ("image.prod.allow.v1", "NOT_APPLICABLE"),
+        ("doc.staging.deny.v1", "NOT_APPLICABLE"),
+        ("doc.prod.deny.v1", "DENY"),
+    ]
+    policy_entries = [e.policy_id for e in result.trace if e.kind == "policy"]
+    assert policy_entries == ["doc.prod.allow.v1", "doc.prod.deny.v1"]
+    assert (result.decision, result.policy_id, result.reason) == (
+        linear.decision,
+        linear.policy_id,
+        linear.reason,
+    )
+
+
+def test_index_raises_when_context_missing_required_target_fields():
+    index = PolicyIndex(_policies())
+    context = base_context()
+    del context["environment"]["env"]
+
+    with pytest.raises(ContextValidationError):
+        evaluate_policies_decision(index, context)
+
+
+def test_empty_index_is_not_applicable():
+    result = evaluate_policies_decision(PolicyIndex([]), {})
+
+    assert result.decision == "NOT_APPLICABLE"
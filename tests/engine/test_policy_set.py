@@ -1,10 +1,16 @@
+import random
+
 import pytest
-from engine.errors import ContextValidationError
+from engine.errors import ContextValidationError, PolicyEvaluationError
+from engine.evaluator import evaluate_policy
+from engine.policy_set import STRATEGIES
+from engine.summary import DecisionSummary
 from tests.fixtures.context import base_context
-from tests.fixtures.policy import valid_policy
+from tests.fixtures.evaluation import outcome
+from tests.fixtures.policy import random_policies, valid_policy
 from validation.schema import Policy
 
-from engine import evaluate_policies_decision
+from engine import PolicyIndex, evaluate_policies_decision
 
 
 def test_policy_set_not_applicable_when_no_policy_matches_target():
@@ -46,3 +52,185 @@ def test_policy_set_raises_when_context_missing_required_target_fields():
 
     with pytest.raises(ContextValidationError):
         evaluate_policies_decision([policy], context)
+
+
+@pytest.mark.parametrize("role", ["admin", "viewer"])
+def test_policy_set_summary_matches_traced_decision(role):
+    allow_policy = Policy(**valid_policy())
+    deny_data = valid_policy()
+    deny_data["policy_id"] = "deny.guest.document.prod.v1"
+    deny_data["conditions"]["all"][0]["value"] = "guest"
+    deny_data["effect"] = "DENY"
+    policies = [allow_policy, Policy(**deny_data)]
+    context = base_context()
+    context["user"]["role"] = role
+
+    full = evaluate_policies_decision(policies, context)
+    summary = evaluate_policies_decision(policies, context, trace=False)
+
+    assert (summary.decision, summary.policy_id, summary.reason) == (
+        full.decision,
+        full.policy_id,
+        full.reason,
+    )
+
+
+class _CountingDict(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = []
+
+    def get(self, key, default=None):
+        self.lookups.append(key)
+        return super().get(key, default)
+
+
+@pytest.mark.parametrize("trace", [False, True])
+def test_policy_set_resolves_each_field_once_per_request(trace):
+    policies = []
+    for i in range(50):
+        data = valid_policy()
+        data["policy_id"] = f"p{i}"
+        policies.append(Policy(**data))
+    context = base_context()
+    user = context["user"] = _CountingDict(context["user"])
+
+    result = evaluate_policies_decision(policies, context, trace=trace)
+
+    assert result.decision == "ALLOW"
+    assert user.lookups == ["role"]
+
+
+def test_policy_set_memoized_missing_field_raises_like_sequential_evaluation():
+    unsupported = valid_policy()
+    unsupported["policy_id"] = "unsupported"
+    unsupported["conditions"]["all"][0]["operator"] = "matches"
+    missing = valid_policy()
+    missing["conditions"]["all"][0]["field"] = "user.team"
+    context = base_context()
+
+    with pytest.raises(ContextValidationError, match="user.team"):
+        evaluate_policies_decision(
+            [Policy(**missing), Policy(**missing)], context, trace=False
+        )
+    # The first policy's operator error still wins over a later missing field.
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        evaluate_policies_decision(
+            [Policy(**unsupported), Policy(**missing)], context, trace=False
+        )
+
+
+TESTS = [
+    ("user.role", "equals", "admin"),
+    ("user.role", "equals", "viewer"),
+    ("user.team", "equals", "admin"),
+    ("user.team", "equals", "viewer"),
+]
+
+
+def _reference(policies, context, strategy):
+    # Every policy evaluated in order, then the strategy applied.
+    decisions = [(p.policy_id, evaluate_policy(p, context)) for p in policies]
+    applicable = [(pid, d) for pid, d in decisions if d != "NOT_APPLICABLE"]
+    if not applicable:
+        return DecisionSummary("NOT_APPLICABLE", None, "no applicable policies")
+    if strategy == "deny_overrides":
+        deny = [pid for pid, d in applicable if d == "DENY"]
+        if deny:
+            return DecisionSummary("DENY", deny[0], "deny overrides")
+        return DecisionSummary("ALLOW", applicable[0][0], "allow (no denies matched)")
+    if strategy == "permit_overrides":
+        allow = [pid for pid, d in applicable if d == "ALLOW"]
+        if allow:
+            return DecisionSummary("ALLOW", allow[0], "permit overrides")
+        return DecisionSummary("DENY", applicable[0][0], "deny (no permits matched)")
+    if strategy == "only_one_applicable" and len(applicable) > 1:
+        raise PolicyEvaluationError(
+            f"only_one_applicable: {len(applicable)} policies apply to the request"
+        )
+    pid, decision = applicable[0]
+    return DecisionSummary(decision, pid, strategy.replace("_", " "))
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_short_circuit_strategies_match_full_evaluation(strategy):
+    rng = random.Random(strategy)
+    for _ in range(200):
+        policies = random_policies(
+            rng,
+            rng.randint(1, 6),
+            TESTS,
+            max_conditions=1,
+            effects=("ALLOW", "DENY"),
+            modes=("all",),
+            environments=("prod", "staging"),
+        )
+        index = PolicyIndex(policies)
+        context = base_context()
+        context["user"]["role"] = rng.choice(["admin", "viewer"])
+        if rng.random() < 0.5:
+            context["user"]["team"] = "viewer"
+
+        expected = outcome(lambda: _reference(policies, context, strategy))
+        for source in (policies, index):
+            for trace in (False, True):
+                assert (
+                    outcome(
+                        lambda: evaluate_policies_decision(
+                            source, context, strategy=strategy, trace=trace
+                        )
+                    )
+                    == expected
+                )
+
+
+def test_deny_overrides_stops_at_first_deny_policy():
+    deny = valid_policy()
+    deny["policy_id"] = "deny"
+    deny["effect"] = "DENY"
+    later = valid_policy()
+    later["policy_id"] = "later"
+    later["conditions"]["all"][0]["field"] = "user.id"
+    later["conditions"]["all"][0]["value"] = "1"
+    context = base_context()
+    user = context["user"] = _CountingDict(context["user"])
+
+    result = evaluate_policies_decision(
+        [Policy(**deny), Policy(**later)], context, trace=False
+    )
+
+    assert (result.decision, result.policy_id) == ("DENY", "deny")
+    # Fields of skipped policies are still resolved, so errors do not change.
+    assert user.lookups == ["role", "id"]
+
+
+@pytest.mark.parametrize("trace", [False, True])
+def test_permit_overrides_and_first_applicable(trace):
+    deny = valid_policy()
+    deny["policy_id"] = "deny"
+    deny["effect"] = "DENY"
+    allow = valid_policy()
+    allow["policy_id"] = "allow"
+    policies = [Policy(**deny), Policy(**allow)]
+
+    permit = evaluate_policies_decision(
+        policies, base_context(), strategy="permit_overrides", trace=trace
+    )
+    first = evaluate_policies_decision(
+        policies, base_context(), strategy="first_applicable", trace=trace
+    )
+
+    assert (permit.decision, permit.policy_id, permit.reason) == (
+        "ALLOW",
+        "allow",
+        "permit overrides",
+    )
+    assert (first.decision, first.policy_id, first.reason) == (
+        "DENY",
+        "deny",
+        "first applicable",
+    )
+    with pytest.raises(PolicyEvaluationError, match="2 policies"):
+        evaluate_policies_decision(
+            policies, base_context(), strategy="only_one_applicable", trace=trace
+        )
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+from engine.errors import ContextValidationError
+from engine.session import DecisionSession
+from tests.fixtures.context import base_context
+from tests.fixtures.evaluation import outcome
+from tests.fixtures.policy import random_policies, valid_policy
+from validation.schema import Policy
+
+from engine import PolicyIndex, evaluate_policies_decision
+
+TESTS = [
+    ("user.role", "equals", "admin"),
+    ("user.role", "in", ["admin", "editor"]),
+    ("user.level", "gt", 3),
+    ("user.level", "lt", 7),
+    ("resource.owner", "equals", "alice"),
+    ("user.team", "equals", "red"),
+    ("user.profile.tier", "equals", "gold"),
+]
+
+
+def _random_delta(rng):
+    choice = rng.randrange(7)
+    if choice == 0:
+        return {"environment": {"env": rng.choice(["prod", "staging"])}}
+    if choice == 1:
+        return {"user": {"role": rng.choice(["admin", "editor", "viewer"])}}
+    if choice == 2:
+        return {"user": {"level": rng.choice([1, 5, 9])}}
+    if choice == 3:
+        return {"user": {"team": rng.choice(["red", "blue", None])}}
+    if choice == 4:
+        return {"user": {"profile": rng.choice([{"tier": "gold"}, None, "flat"])}}
+    if choice == 5:
+        return {"resource": {"owner": rng.choice(["alice", "bob"])}}
+    return {"request_id": str(rng.random())}
+
+
+def _context():
+    context = base_context()
+    context["user"].update(level=5, team="red", profile={"tier": "gold"})
+    context["resource"]["owner"] = "alice"
+    return context
+
+
+def test_session_matches_full_evaluation_after_each_delta():
+    rng = random.Random(7)
+    for _ in range(50):
+        index = PolicyIndex(
+            random_policies(
+                rng, rng.randint(1, 10), TESTS, environments=("prod", "staging")
+            )
+        )
+        session = DecisionSession(index, _context())
+        for _ in range(20):
+            delta = _random_delta(rng)
+            result = outcome(lambda: session.update(delta))
+            expected = outcome(
+                lambda: evaluate_policies_decision(index, session.context, trace=False)
+            )
+            assert result == expected
+
+
+def test_session_reuses_unaffected_conditions():
+    data = valid_policy()
+    data["conditions"] = {
+        "all": [
+            {"field": "user.role", "operator": "equals", "value": "admin"},
+            {"field": "resource.owner", "operator": "equals", "value": "alice"},
+        ]
+    }
+    session = DecisionSession([Policy(**data)], _context())
+    assert session.evaluate().decision == "ALLOW"
+    assert (session.evaluated, session.reused) == (2, 0)
+
+    assert session.update({"request_id": "r2"}).decision == "ALLOW"
+    assert (session.evaluated, session.reused) == (2, 2)
+
+    assert session.update({"resource": {"owner": "bob"}}).decision == "DENY"
+    assert (session.evaluated, session.reused) == (3, 3)
+
+
+def test_session_does_not_alias_caller_context():
+    context = base_context()
+    session = DecisionSession([Policy(**valid_policy())], context)
+    delta = {"user": {"role": "viewer"}}
+    session.update(delta)
+    assert context["user"]["role"] == "admin"
+    delta["user"]["role"] = "admin"
+    assert session.context["user"]["role"] == "viewer"
+
+
+def test_session_null_deletes_field():
+    session = DecisionSession([Policy(**valid_policy())], base_context())
+    with pytest.raises(ContextValidationError, match="user.role"):
+        session.update({"user": {"role": None}})
+    assert session.update({"user": {"role": "admin"}}).decision == "ALLOW"
+
+
+def test_session_trace_matches_full_trace():
+    index = PolicyIndex([Policy(**valid_policy())])
+    session = DecisionSession(index, base_context())
+    assert session.update({"user": {"role": "viewer"}}, trace=True) == (
+        evaluate_policies_decision(index, session.context)
+    )
+
+
+def test_session_rejects_non_object_delta():
+    session = DecisionSession([Policy(**valid_policy())], base_context())
+    with pytest.raises(ContextValidationError):
+        session.update(["user"])
@@ -0,0 +1,92 @@
+import json
+import time
+
+import pytest
+from engine.store import PolicyStore
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.policy_validator import PolicyValidationError
+
+from engine import evaluate_policies_decision
+
+
+def _write(path, **overrides):
+    data = valid_policy()
+    data.update(overrides)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _decide(store):
+    return evaluate_policies_decision(store.index, base_context(), trace=False)
+
+
+def test_store_loads_directory(tmp_path):
+    _write(tmp_path / "allow.json")
+    (tmp_path / "README.md").write_text("not a policy", encoding="utf-8")
+
+    store = PolicyStore(tmp_path)
+
+    assert len(store.index) == 1
+    assert _decide(store).decision == "ALLOW"
+
+
+def test_store_rejects_invalid_initial_set(tmp_path):
+    (tmp_path / "broken.json").write_text("{}", encoding="utf-8")
+
+    with pytest.raises(PolicyValidationError, match="broken.json"):
+        PolicyStore(tmp_path)
+
+
+def test_refresh_reparses_only_changed_files(tmp_path):
+    _write(tmp_path / "a.json")
+    _write(tmp_path / "b.json", policy_id="b.v1")
+    store = PolicyStore(tmp_path)
+    old_index = store.index
+    unchanged = store.index.policies[0]
+
+    _write(tmp_path / "b.json", policy_id="b.deny.v1", effect="DENY")
+
+    assert store.refresh() is True
+    assert store.index is not old_index
+    assert store.index.policies[0] is unchanged
+    assert _decide(store).policy_id == "b.deny.v1"
+    assert store.refresh() is False
+
+
+def test_invalid_edit_keeps_last_good_set(tmp_path):
+    _write(tmp_path / "a.json")
+    store = PolicyStore(tmp_path)
+    good = store.index
+
+    (tmp_path / "a.json").write_text('{"policy_id": "broken"}', encoding="utf-8")
+
+    assert store.refresh() is False
+    assert store.index is good
+    assert "a.json" in str(store.last_error)
+
+    _write(tmp_path / "a.json", policy_id="fixed.v1")
+    assert store.refresh() is True
+    assert store.last_error is None
+
+
+def test_removed_files_drop_out_of_the_set(tmp_path):
+    _write(tmp_path / "a.json")
+    _write(tmp_path / "b.json", policy_id="b.v1")
+    store = PolicyStore(tmp_path)
+
+    (tmp_path / "b.json").unlink()
+
+    assert store.refresh() is True
+    assert [p.policy_id for p in store.index] == ["test.policy.v1"]
+
+
+def test_watcher_swaps_in_changes(tmp_path):
+    _write(tmp_path / "a.json")
+    with PolicyStore(tmp_path, poll_interval=0.01) as store:
+        version = store.version
+        _write(tmp_path / "a.json", effect="DENY", policy_id="now.deny.v1")
+        deadline = time.monotonic() + 5
+        while store.version == version and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert _decide(store).decision == "DENY"
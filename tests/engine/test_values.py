@@ -0,0 +1,19 @@
+from engine.values import value_key
+
+
+def test_value_key_separates_types_and_keys_containers_by_content():
+    assert len({value_key(1), value_key(1.0), value_key(True)}) == 3
+    assert value_key([1, "a"]) == value_key([1, "a"]) != value_key((1, "a"))
+    assert value_key({1: "a", "b": [2]}) == value_key({"b": [2], 1: "a"})
+    assert value_key({1: "a"}) != value_key({"1": "a"})
+    assert value_key({"x", "y"}) == value_key({"y", "x"})
+
+
+def test_value_key_falls_back_to_identity_for_unhashables():
+    class Opaque:
+        __hash__ = None
+
+    value = Opaque()
+
+    assert value_key([value]) == value_key([value])
+    assert value_key([value]) != value_key([Opaque()])
@@ -0,0 +1,10 @@
+from engine.errors import PolicyEvaluationError
+
+
+def outcome(fn):
+    """``fn()`` as ``(decision, policy_id, reason)``, or ``(error type, message)``."""
+    try:
+        result = fn()
+    except PolicyEvaluationError as e:
+        return type(e), str(e)
+    return result.decision, result.policy_id, result.reason
@@ -16,3 +16,52 @@ def valid_policy():
         },
         "effect": "ALLOW",
     }
+
+
+def make_policy(
+    policy_id,
+    conditions,
+    effect="ALLOW",
+    mode="all",
+    resource_type="document",
+    environment="prod",
+):
+    from validation.schema import Policy
+
+    data = valid_policy()
+    data["policy_id"] = policy_id
+    data["target"] = {"resource_type": resource_type, "environment": environment}
+    data["conditions"] = {
+        mode: [{"field": f, "operator": op, "value": v} for f, op, v in conditions]
+    }
+    data["effect"] = effect
+    return Policy(**data)
+
+
+def random_policies(
+    rng,
+    count,
+    tests,
+    *,
+    max_conditions=3,
+    effects=("ALLOW", "ALLOW", "DENY"),
+    modes=("all", "any"),
+    resource_types=("document",),
+    environments=("prod",),
+):
+    """``count`` policies ``p0``.. built from ``(field, operator, value)`` ``tests``.
+
+    Repeating an entry in ``tests``, ``effects``, ``modes``, ``resource_types``
+    or ``environments`` weights it.
+    """
+    return [
+        make_policy(
+            f"p{i}",
+            rng.sample(tests, k=rng.randint(1, max_conditions)),
+            rng.choice(effects),
+            rng.choice(modes),
+            rng.choice(resource_types),
+            rng.choice(environments),
+        )
+        for i in range(count)
+    ]
@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+from server.pdp import PolicyDecisionPoint
+from tests.fixtures.context import base_context
+from tests.fixtures.policy import valid_policy
+from validation.schema import Policy
+
+
+def _pdp():
+    return PolicyDecisionPoint([Policy(**valid_policy())])
+
+
+def _viewer():
+    context = base_context()
+    context["user"]["role"] = "viewer"
+    return context
+
+
+def test_handle_single_and_batched_requests():
+    pdp = _pdp()
+
+    single = pdp.handle({"id": 1, "context": base_context()})
+    batch = pdp.handle({"contexts": [base_context(), _viewer(), {}]})
+
+    assert single["decision"] == "ALLOW"
+    assert single["id"] == 1
+    assert [d.get("decision") for d in batch["decisions"]] == ["ALLOW", "DENY", None]
+    assert "error" in batch["decisions"][2]
+
+
+def test_unix_socket_answers_pipelined_requests_in_order(tmp_path):
+    path = str(tmp_path / "pdp.sock")
+
+    async def scenario():
+        server = await _pdp().serve_unix(path)
+        async with server:
+            reader, writer = await asyncio.open_unix_connection(path)
+            requests = [
+                {"id": i, "context": base_context() if i % 2 else _viewer()}
+                for i in range(4)
+            ]
+            writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in requests]
+            writer.close()
+            return responses
+
+    responses = asyncio.run(scenario())
+
+    assert [r["id"] for r in responses] == [0, 1, 2, 3]
+    assert [r["decision"] for r in responses] == ["DENY", "ALLOW", "DENY", "ALLOW"]
+
+
+def test_http_evaluate_and_health():
+    async def scenario():
+        server = await _pdp().serve_http(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = json.dumps({"context": base_context(), "trace": True}).encode()
+            writer.write(
+                b"POST /evaluate HTTP/1.1\r\nHost: localhost\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+                + b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n"
+            )
+            await writer.drain()
+            raw = await reader.read()
+            writer.close()
+            return raw.decode()
+
+    raw = asyncio.run(scenario())
+    first, second = raw.split("HTTP/1.1 200 OK")[1:]
+
+    decision = json.loads(first.split("\r\n\r\n", 1)[1])
+    assert decision["decision"] == "ALLOW"
+    assert decision["trace"]
+    assert json.loads(second.split("\r\n\r\n", 1)[1]) == {"status": "ok", "policies": 1}
+
+
+def test_http_metrics_endpoint():
+    from engine import instrumentation
+
+    instrumentation.reset()
+    instrumentation.enable()
+    pdp = _pdp()
+
+    try:
+        pdp.handle({"context": base_context()})
+        status, body = pdp._route("GET", "/metrics", b"")
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+    assert status == 200
+    assert 'ace_policy_matches_total{policy_id="test.policy.v1"} 1' in body
+
+
+def test_decisions_are_recorded_in_the_audit_log(tmp_path):
+    from engine.audit import AuditLog
+
+    path = tmp_path / "audit.jsonl"
+    with AuditLog(path) as audit:
+        pdp = PolicyDecisionPoint([Policy(**valid_policy())], audit=audit)
+        pdp.handle({"context": base_context()})
+        pdp.handle({"contexts": [_viewer(), {}]})
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["decision"] for r in records] == ["ALLOW", "DENY"]
+    assert "trace" not in records[0]
+    assert records[1]["trace"]
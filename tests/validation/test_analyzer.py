@@ -0,0 +1,115 @@
+import random
+
+import pytest
+from tests.fixtures.context import base_context
+from tests.fixtures.evaluation import outcome
+from tests.fixtures.policy import make_policy, random_policies
+from validation.analyzer import analyze_policies, optimize_policies
+from validation.policy_validator import PolicyValidationError
+
+from engine import evaluate_policies_decision
+
+TESTS = [
+    ("user.role", "equals", "admin"),
+    ("user.role", "equals", "viewer"),
+    ("user.role", "in", ["admin", "editor"]),
+    ("user.role", "in", ["admin"]),
+    ("user.level", "gt", 3),
+    ("user.level", "gt", 7),
+    ("user.level", "lt", 5),
+    ("user.level", "equals", 9),
+    ("user.team", "equals", "red"),
+]
+
+
+def _random_policies(rng, count):
+    policies = []
+    for policy in random_policies(
+        rng,
+        count,
+        TESTS,
+        effects=("ALLOW", "ALLOW", "ALLOW", "DENY"),
+        modes=("all", "all", "any"),
+        environments=("prod", "prod", "staging"),
+    ):
+        policies.append(policy)
+        if rng.random() < 0.2:
+            copy_id = f"{policy.policy_id}.copy"
+            policies.append(policy.model_copy(update={"policy_id": copy_id}))
+    return policies
+
+
+def test_optimized_set_decides_like_the_full_set():
+    rng = random.Random(23)
+    removed = 0
+    for _ in range(300):
+        policies = _random_policies(rng, rng.randint(1, 8))
+        kept = optimize_policies(policies)
+        removed += len(policies) - len(kept)
+        for _ in range(10):
+            context = base_context()
+            context["user"]["role"] = rng.choice(["admin", "editor", "viewer"])
+            context["user"]["level"] = rng.choice([1, 4, 6, 9])
+            if rng.random() < 0.7:
+                context["user"]["team"] = rng.choice(["red", "blue"])
+            assert outcome(
+                lambda: evaluate_policies_decision(kept, context, trace=False)
+            ) == outcome(
+                lambda: evaluate_policies_decision(policies, context, trace=False)
+            )
+    assert removed > 0
+
+
+def test_analyzer_reports_each_kind():
+    policies = [
+        make_policy("a", [("user.role", "equals", "admin")]),
+        make_policy("b", [("user.role", "in", ["admin", "editor"])]),
+        make_policy("c", [("user.role", "equals", "admin")]),
+        make_policy("x", [("user.level", "gt", 10), ("user.level", "lt", 5)]),
+        make_policy("d", [("user.role", "equals", "viewer")]),
+        make_policy("e", [("user.team", "equals", "red")], "DENY"),
+    ]
+
+    analysis = analyze_policies(policies)
+
+    assert [
+        (f.kind, f.policy_id, f.related, f.removable) for f in analysis.findings
+    ] == [
+        ("redundant", "b", "a", True),
+        ("duplicate", "c", "a", True),
+        ("contradiction", "x", None, False),
+        ("shadowed", "d", "x", True),
+        ("shadowed", "e", "x", False),
+    ]
+    assert "user.team" in analysis.findings[-1].message
+    assert [p.policy_id for p in analysis.kept] == ["a", "x", "e"]
+    assert analysis.removed == 3
+
+
+def test_different_targets_never_interact():
+    deny = make_policy("deny", [("user.role", "equals", "admin")], "DENY")
+    other = make_policy("other", [("user.role", "equals", "admin")])
+    other.target.resource_type = "image"
+
+    assert analyze_policies([deny, other]).findings == []
+
+
+def test_analyzer_rejects_invalid_policies():
+    policy = make_policy("bad", [("user.role", "matches", "admin")])
+
+    with pytest.raises(PolicyValidationError, match="Unsupported operator"):
+        analyze_policies([policy])
+
+
+def test_analyzer_keys_dict_and_set_values():
+    policies = [
+        make_policy("a", [("user.meta", "equals", {1: "a", "b": "c"})]),
+        make_policy("b", [("user.meta", "equals", {"b": "c", 1: "a"})]),
+        make_policy("c", [("user.tags", "equals", {"x", "y"})]),
+    ]
+
+    findings = analyze_policies(policies).findings
+
+    assert [(f.kind, f.policy_id, f.related) for f in findings] == [
+        ("duplicate", "b", "a")
+    ]
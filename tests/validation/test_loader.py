@@ -0,0 +1,75 @@
+import json
+
+import pytest
+import yaml
+from tests.fixtures.policy import valid_policy
+from validation.loader import (
+    PolicyLoadError,
+    _yaml_loader,
+    load_policy_directory,
+    load_policy_files,
+    policy_files,
+)
+
+
+def _write_policies(directory, count, *, broken=()):
+    for i in range(count):
+        data = valid_policy()
+        data["policy_id"] = f"p{i:03d}"
+        if i in broken:
+            data["conditions"]["all"][0]["operator"] = "matches"
+        suffix = ".yaml" if i % 2 else ".json"
+        text = yaml.safe_dump(data) if i % 2 else json.dumps(data)
+        (directory / f"policy{i:03d}{suffix}").write_text(text, encoding="utf-8")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_policy_directory_preserves_file_order(tmp_path, workers):
+    _write_policies(tmp_path, 70)
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    policies = load_policy_directory(tmp_path, workers=workers)
+
+    assert [p.policy_id for p in policies] == [f"p{i:03d}" for i in range(70)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_policy_files_reports_every_failure(tmp_path, workers):
+    _write_policies(tmp_path, 70, broken={3, 41})
+    (tmp_path / "empty.yaml").write_text("", encoding="utf-8")
+
+    with pytest.raises(PolicyLoadError) as excinfo:
+        load_policy_files(policy_files([tmp_path]), workers=workers)
+
+    failed = [path.name for path, _ in excinfo.value.errors]
+    assert failed == ["empty.yaml", "policy003.yaml", "policy041.yaml"]
+    assert "3 policy file(s) failed validation" in str(excinfo.value)
+
+
+def test_yaml_loader_prefers_libyaml():
+    _, loader = _yaml_loader()
+
+    assert loader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def test_load_policy_directory_requires_a_directory(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_policy_directory(tmp_path / "missing")
+
+
+def test_load_error_names_each_file_once_and_indents_details(tmp_path):
+    (tmp_path / "list.json").write_text("[]", encoding="utf-8")
+    data = valid_policy()
+    del data["target"]
+    del data["effect"]
+    (tmp_path / "partial.json").write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(PolicyLoadError) as excinfo:
+        load_policy_files(policy_files([tmp_path]), workers=1)
+
+    lines = str(excinfo.value).splitlines()
+    assert lines[1] == f"  {tmp_path / 'list.json'}: policy file must contain a mapping"
+    assert lines[2].startswith(f"  {tmp_path / 'partial.json'}: ")
+    assert len(lines) > 3
+    assert all(line.startswith("    ") for line in lines[3:])
+    assert str(excinfo.value).count(str(tmp_path / "list.json")) == 1
@@ -0,0 +1,228 @@
+"""Static analysis of a policy set: duplicate, contradictory, shadowed and redundant policies.
+
+Policies are grouped by target, in input order, since only policies with the
+same target ever combine. Under ``deny_overrides`` (the default strategy) a
+target-matched policy denies unless its effect is ALLOW and its conditions
+pass, and the first denying policy decides. Hence:
+
+- a policy after an *always-denying* one (DENY effect, or ALLOW with
+  contradictory conditions) can never decide: it is **shadowed**;
+- an ALLOW policy implied by an earlier ALLOW policy (it passes whenever the
+  earlier one does) can never be the first to deny: it is **redundant**, as
+  is an exact **duplicate** of an earlier policy.
+
+Such a policy is removable only if every field it reads is also read by a
+policy kept before it, so a missing field still raises the same error.
+Contradictory policies are reported but never removed: they deny.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Hashable, Iterable, NamedTuple, Optional
+
+from engine.operators import OPERATORS
+from engine.values import is_number, value_key
+
+from validation.policy_validator import validate_policy_semantics
+
+if TYPE_CHECKING:
+    from validation.schema import Condition, Policy
+
+
+class Finding(NamedTuple):
+    kind: str
+    policy_id: str
+    related: Optional[str]
+    message: str
+    removable: bool
+
+
+class PolicySetAnalysis(NamedTuple):
+    findings: list[Finding]
+    kept: list[Policy]
+
+    @property
+    def removed(self) -> int:
+        return sum(finding.removable for finding in self.findings)
+
+
+def _condition_key(condition: Condition) -> Hashable:
+    return (condition.field, condition.operator, value_key(condition.value))
+
+
+def _satisfies(value: Any, condition: Condition) -> bool:
+    """Whether a request value equal to ``value`` passes ``condition``."""
+    return bool(OPERATORS[condition.operator](value, condition.value))
+
+
+def _implies(a: Condition, b: Condition) -> bool:
+    """Whether ``a`` passing guarantees ``b`` passes (sound, not complete)."""
+    if a.field != b.field:
+        return False
+    if _condition_key(a) == _condition_key(b):
+        return True
+    if a.operator == "equals":
+        return _satisfies(a.value, b)
+    if a.operator == "in":
+        # A value in the list equals one of its members.
+        return all(_satisfies(member, b) for member in a.value)
+    if a.operator in ("gt", "lt") and b.operator == a.operator:
+        if not (is_number(a.value) and is_number(b.value)):
+            return False
+        return bool(a.value >= b.value if a.operator == "gt" else a.value <= b.value)
+    return False
+
+
+def _excludes(a: Condition, b: Condition) -> bool:
+    """Whether ``a`` and ``b`` can never both pass (sound, not complete)."""
+    if a.field != b.field:
+        return False
+    for first, second in ((a, b), (b, a)):
+        if first.operator == "equals":
+            return not _satisfies(first.value, second)
+        if first.operator == "in":
+            return not any(_satisfies(member, second) for member in first.value)
+    if {a.operator, b.operator} == {"gt", "lt"}:
+        low, high = (a, b) if a.operator == "gt" else (b, a)
+        if is_number(low.value) and is_number(high.value):
+            # x > low and x < high is impossible when high <= low.
+            return bool(high.value <= low.value)
+    return False
+
+
+def _conditions(policy: Policy) -> tuple[bool, list[Condition]]:
+    conditions = policy.conditions
+    if conditions.all is not None:
+        return True, list(conditions.all)
+    return False, list(conditions.any or [])
+
+
+def _contradictory(policy: Policy) -> bool:
+    mode_all, conditions = _conditions(policy)
+    if not mode_all:
+        # ``in []`` can never pass; an ``any`` fails only if every branch does.
+        return all(c.operator == "in" and not list(c.value) for c in conditions)
+    for i, a in enumerate(conditions):
+        if a.operator == "in" and not list(a.value):
+            return True
+        for b in conditions[i + 1 :]:
+            if _excludes(a, b):
+                return True
+    return False
+
+
+def _policy_implies(a: Policy, b: Policy) -> bool:
+    """Whether ``b``'s conditions pass whenever ``a``'s do."""
+    a_all, a_conditions = _conditions(a)
+    b_all, b_conditions = _conditions(b)
+    # ``a`` as alternatives of conjunctions: one for ``all``, one per condition for ``any``.
+    alternatives = [a_conditions] if a_all else [[c] for c in a_conditions]
+
+    def conjunction_implies(conjunction: list[Condition], target: Condition) -> bool:
+        return any(_implies(c, target) for c in conjunction)
+
+    for conjunction in alternatives:
+        if b_all:
+            ok = all(conjunction_implies(conjunction, c) for c in b_conditions)
+        else:
+            ok = any(conjunction_implies(conjunction, c) for c in b_conditions)
+        if not ok:
+            return False
+    return True
+
+
+def _policy_key(policy: Policy) -> Hashable:
+    mode_all, conditions = _conditions(policy)
+    return (
+        policy.effect.value,
+        mode_all,
+        frozenset(_condition_key(c) for c in conditions),
+    )
+
+
+def _fields(policy: Policy) -> set[str]:
+    return {c.field for c in _conditions(policy)[1]}
+
+
+def analyze_policies(policies: Iterable[Policy]) -> PolicySetAnalysis:
+    """Report dead weight in ``policies`` and the set with removable policies dropped.
+
+    ``kept`` evaluates to the same decision, ``policy_id``, reason and error
+    as the full set for every request under ``deny_overrides``.
+    """
+    policies = list(policies)
+    buckets: dict[tuple[str, str], list[int]] = {}
+    for position, policy in enumerate(policies):
+        validate_policy_semantics(policy)
+        target = (policy.target.resource_type, policy.target.environment)
+        buckets.setdefault(target, []).append(position)
+
+    findings: list[Finding] = []
+    removed: set[int] = set()
+    for positions in buckets.values():
+        kept: list[Policy] = []
+        fields: set[str] = set()
+        keys: dict[Hashable, Policy] = {}
+        shadow: Optional[Policy] = None
+        for position in positions:
+            policy = policies[position]
+            contradictory = _contradictory(policy)
+            if contradictory:
+                findings.append(
+                    Finding(
+                        "contradiction",
+                        policy.policy_id,
+                        None,
+                        "conditions can never all pass; the policy always denies",
+                        False,
+                    )
+                )
+
+            reason: Optional[tuple[str, Policy, str]] = None
+            key = _policy_key(policy)
+            if shadow is not None:
+                reason = ("shadowed", shadow, "unreachable after always-denying policy")
+            elif key in keys:
+                reason = ("duplicate", keys[key], "duplicate of")
+            elif policy.effect.value == "ALLOW":
+                earlier = next(
+                    (
+                        p
+                        for p in kept
+                        if p.effect.value == "ALLOW" and _policy_implies(p, policy)
+                    ),
+                    None,
+                )
+                if earlier is not None:
+                    reason = ("redundant", earlier, "implied by earlier ALLOW policy")
+
+            if reason is not None:
+                kind, related, text = reason
+                extra = sorted(_fields(policy) - fields)
+                removable = not extra
+                message = f"{text} {related.policy_id}"
+                if not removable:
+                    message += f"; kept because it also reads {', '.join(extra)}"
+                findings.append(
+                    Finding(
+                        kind, policy.policy_id, related.policy_id, message, removable
+                    )
+                )
+                if removable:
+                    removed.add(position)
+                    continue
+
+            kept.append(policy)
+            fields |= _fields(policy)
+            keys.setdefault(key, policy)
+            if shadow is None and (policy.effect.value != "ALLOW" or contradictory):
+                shadow = policy
+
+    return PolicySetAnalysis(
+        findings, [p for i, p in enumerate(policies) if i not in removed]
+    )
+
+
+def optimize_policies(policies: Iterable[Policy]) -> list[Policy]:
+    """``policies`` without the ones ``analyze_policies`` proves removable."""
+    return analyze_policies(policies).kept
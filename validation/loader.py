@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from validation.policy_validator import PolicyValidationError, validate_policy_semantics
+
+if TYPE_CHECKING:
+    from validation.schema import Policy
+
+POLICY_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Below this many files a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 64
+
+
+class PolicyLoadError(PolicyValidationError):
+    """Every file that failed to load, reported together."""
+
+    def __init__(self, errors: list[tuple[Path, str]]) -> None:
+        self.errors = errors
+        lines = [f"{len(errors)} policy file(s) failed validation:"]
+        for path, message in errors:
+            # Multi-line (e.g. Pydantic) messages stay indented under their file.
+            lines.append(f"  {path}: " + message.replace("\n", "\n    "))
+        super().__init__("\n".join(lines))
+
+
+def _yaml_loader():
+    import yaml
+
+    # libyaml's C loader is several times faster when PyYAML was built with it.
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def read_policy_file(path: Path) -> Any:
+    suffix = path.suffix.lower()
+    if suffix not in POLICY_SUFFIXES:
+        raise PolicyValidationError(
+            f"Unsupported policy file format: {path.suffix}. Use .json, .yaml, or .yml"
+        )
+    with open(path, encoding="utf-8") as f:
+        if suffix == ".json":
+            return json.load(f)
+        yaml, loader = _yaml_loader()
+        return yaml.load(f, Loader=loader)
+
+
+def load_policy_file(path: Path) -> Policy:
+    from validation.schema import Policy
+
+    data = read_policy_file(path)
+    if not isinstance(data, dict):
+        raise PolicyValidationError("policy file must contain a mapping")
+    policy = Policy(**data)
+    validate_policy_semantics(policy)
+    return policy
+
+
+def policy_files(paths: Iterable[str | Path]) -> list[Path]:
+    """Expand directories (recursively) into their policy files, sorted per directory."""
+    files: list[Path] = []
+    for p in paths:
+        path = Path(p)
+        if path.is_dir():
+            files.extend(
+                sorted(
+                    f
+                    for f in path.rglob("*")
+                    if f.suffix.lower() in POLICY_SUFFIXES and f.is_file()
+                )
+            )
+        elif path.exists():
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"policy file not found: {path}")
+    return files
+
+
+def _load_or_error(path: Path) -> tuple[Path, Optional[Policy], Optional[str]]:
+    try:
+        return path, load_policy_file(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def load_policy_files(
+    files: Iterable[Path], *, workers: Optional[int] = None
+) -> list[Policy]:
+    """Parse and validate ``files`` in input order, in a process pool when large.
+
+    All failures are collected and raised together as ``PolicyLoadError``.
+    ``workers`` defaults to the CPU count; ``workers=1`` loads serially.
+    """
+    files = list(files)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(files) >= PARALLEL_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_load_or_error, files, chunksize=chunksize))
+    else:
+        results = [_load_or_error(path) for path in files]
+
+    errors = [(path, message) for path, _, message in results if message is not None]
+    if errors:
+        raise PolicyLoadError(errors)
+    return [policy for _, policy, _ in results if policy is not None]
+
+
+def load_policy_directory(
+    directory: str | Path, *, workers: Optional[int] = None
+) -> list[Policy]:
+    """Load every ``.json``/``.yaml``/``.yml`` policy under ``directory``."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"policy directory not found: {directory}")
+    return load_policy_files(policy_files([directory]), workers=workers)
@@ -1,6 +1,9 @@
-from typing import Iterable
+from __future__ import annotations
 
-from validation.schema import Condition, Policy
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from validation.schema import Condition, Policy
 
 
 class PolicyValidationError(Exception):